@@ -0,0 +1,52 @@
+# -----------------------------------------------------------------
+# bench_arranque.py
+#
+# Mide el arranque en frío de 'import parser': cada muestra es un
+# proceso de Python nuevo. Compara las tablas congeladas (modo por
+# omisión) contra PATITO_TABLAS=validar (reflexión sobre las funciones
+# t_/p_, validación de la gramática y construcción de la expresión
+# maestra del lexer, como hacían lex.lex() y yacc.yacc() antes).
+# Se resta el arranque de un intérprete vacío.
+#
+# Uso: python bench_arranque.py [muestras]
+# -----------------------------------------------------------------
+import os
+import subprocess
+import sys
+import time
+
+MUESTRAS = 21
+
+
+def medir(codigo, entorno, muestras):
+    """Mediana en segundos de correr 'python -c codigo' en un proceso nuevo."""
+    tiempos = []
+    for _ in range(muestras):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', codigo], env=entorno, check=True)
+        tiempos.append(time.perf_counter() - inicio)
+    tiempos.sort()
+    return tiempos[len(tiempos) // 2]
+
+
+if __name__ == '__main__':
+    muestras = int(sys.argv[1]) if len(sys.argv) > 1 else MUESTRAS
+    carpeta = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(carpeta)
+
+    congeladas = dict(os.environ)
+    congeladas.pop('PATITO_TABLAS', None)
+    validar = dict(congeladas, PATITO_TABLAS='validar')
+
+    vacio = medir('pass', congeladas, muestras)
+    solo_ply = medir('import ply.lex, ply.yacc', congeladas, muestras) - vacio
+    antes = medir('import parser', validar, muestras) - vacio
+    despues = medir('import parser', congeladas, muestras) - vacio
+
+    print(f"--- Arranque en frío de 'import parser' ({muestras} muestras, mediana) ---")
+    print(f"Intérprete vacío:               {vacio * 1000:7.1f} ms (ya restado)")
+    print(f"Solo importar ply.lex/ply.yacc: {solo_ply * 1000:7.1f} ms")
+    print(f"Validando (antes):              {antes * 1000:7.1f} ms")
+    print(f"Tablas congeladas (después):    {despues * 1000:7.1f} ms")
+    print(f"Ahorro:                         {(antes - despues) * 1000:7.1f} ms "
+          f"({100 * (antes - despues) / antes:.0f}%)")
@@ -0,0 +1,113 @@
+# -----------------------------------------------------------------
+# bench_compilador.py
+#
+# Benchmark de escala del compilador sobre programas sintéticos
+# (generador.py) de tamaño creciente. Por cada tamaño reporta:
+#   tokens/s       solo tokenizar (Escaner)
+#   análisis (s)   compilar completo (lexer de PLY, parser, semántica
+#                  y cuádruplos)
+#   cuádruplos/s   cuádruplos generados / tiempo de compilación
+#   memoria (MB)   pico de memoria de Python durante la compilación
+#   escala         µs por token relativo al tamaño más chico; si crece
+#                  mucho, algo dejó de ser lineal
+#
+# Uso: python bench_compilador.py [estatutos ...] [--json archivo]
+#   Los estatutos son los del cuerpo principal de cada tamaño; las
+#   funciones y variables crecen con ellos.
+# -----------------------------------------------------------------
+import json
+import sys
+import time
+import tracemalloc
+
+from escaner import Escaner, tokens_de
+from generador import generar_programa
+from parser import compilar
+
+TAMANOS = (500, 1000, 2000, 4000, 8000)
+PROFUNDIDAD = 3
+# Si el costo por token crece más que esto entre el tamaño más chico y
+# el más grande, se avisa de una posible regresión de escala
+LIMITE_ESCALA = 1.5
+
+
+def opciones_para(estatutos):
+    """Programa de ~'estatutos' estatutos, repartidos entre main y funciones."""
+    funciones = max(estatutos // 100, 1)
+    return {
+        'variables': min(max(estatutos // 10, 10), 800),
+        'funciones': funciones,
+        'estatutos': estatutos // 2,
+        'estatutos_funcion': estatutos // 2 // funciones,
+        'profundidad': PROFUNDIDAD,
+        'semilla': estatutos,
+    }
+
+
+def mejor(funcion, repeticiones=3):
+    """Menor tiempo de 'repeticiones' corridas: (resultado, segundos)."""
+    mejor_tiempo, resultado = None, None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        segundos = time.perf_counter() - inicio
+        if mejor_tiempo is None or segundos < mejor_tiempo:
+            mejor_tiempo = segundos
+    return resultado, mejor_tiempo
+
+
+def medir(estatutos):
+    fuente = generar_programa(**opciones_para(estatutos))
+
+    (tokens, _), tokenizar = mejor(lambda: tokens_de(Escaner(), fuente))
+    resultado, compilacion = mejor(lambda: compilar(fuente))
+    assert resultado.exito, resultado.errores[:3]
+
+    # La memoria se mide aparte: tracemalloc hace más lenta la compilación
+    tracemalloc.start()
+    compilar(fuente)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'estatutos': estatutos,
+        'bytes': len(fuente),
+        'tokens': len(tokens),
+        'cuadruplos': len(resultado.fila_cuadruplos),
+        'tokenizar_s': tokenizar,
+        'compilar_s': compilacion,
+        'tokens_por_s': len(tokens) / tokenizar,
+        'cuadruplos_por_s': len(resultado.fila_cuadruplos) / compilacion,
+        'memoria_pico_mb': pico / 1e6,
+        'us_por_token': compilacion / len(tokens) * 1e6,
+    }
+
+
+if __name__ == '__main__':
+    argumentos = sys.argv[1:]
+    ruta_json = None
+    if '--json' in argumentos:
+        posicion = argumentos.index('--json')
+        ruta_json = argumentos[posicion + 1]
+        del argumentos[posicion:posicion + 2]
+    tamanos = [int(arg) for arg in argumentos] or list(TAMANOS)
+
+    print(f"--- Benchmark de Escala del Compilador (profundidad {PROFUNDIDAD}) ---")
+    print(f"{'estatutos':>10}{'tokens':>10}{'tokens/s':>13}{'análisis (s)':>14}"
+          f"{'cuádruplos':>12}{'cuádruplos/s':>14}{'memoria (MB)':>14}{'escala':>8}")
+    resultados = []
+    for estatutos in tamanos:
+        r = medir(estatutos)
+        r['escala'] = r['us_por_token'] / (resultados[0] if resultados else r)['us_por_token']
+        resultados.append(r)
+        print(f"{r['estatutos']:>10}{r['tokens']:>10}{r['tokens_por_s']:>13,.0f}{r['compilar_s']:>14.3f}"
+              f"{r['cuadruplos']:>12}{r['cuadruplos_por_s']:>14,.0f}{r['memoria_pico_mb']:>14.2f}"
+              f"{r['escala']:>8.2f}")
+
+    if resultados[-1]['escala'] > LIMITE_ESCALA:
+        print(f"¡AVISO! El costo por token creció {resultados[-1]['escala']:.2f}x: posible regresión de escala.")
+
+    if ruta_json:
+        with open(ruta_json, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=2)
+        print(f"Resultados escritos en '{ruta_json}'")
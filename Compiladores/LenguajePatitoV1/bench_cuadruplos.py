@@ -0,0 +1,104 @@
+# -----------------------------------------------------------------
+# bench_cuadruplos.py
+#
+# Compara la memoria por cuádruplo y la velocidad de recorrido de:
+#   1. Una lista de objetos con __dict__ (el Cuadruplo original)
+#   2. Una lista de vistas Cuadruplo con __slots__
+#   3. La FilaCuadruplos (4 columnas array('i'))
+#
+# El programa grande se genera con el mismo patrón que deja el parser
+# para 'x = a + b * c;':  (*, b, c, t) (+, a, t, t') (=, t', _, x)
+#
+# Uso: python bench_cuadruplos.py [estatutos]
+# -----------------------------------------------------------------
+import sys
+import time
+import tracemalloc
+
+from quad_manager import FilaCuadruplos, Cuadruplo, Opcode
+
+ESTATUTOS = 200000
+
+
+class CuadruploConDict:
+    """Copia del Cuadruplo original (un objeto con __dict__ por cuádruplo)."""
+    def __init__(self, operador, op_izq, op_der, resultado):
+        self.operador = operador
+        self.op_izq = op_izq
+        self.op_der = op_der
+        self.resultado = resultado
+
+
+def generar_programa(estatutos):
+    """Devuelve la secuencia de cuádruplos (tuplas) del programa sintético."""
+    quads = []
+    for i in range(estatutos):
+        a, b, c, x = 1000 + i % 50, 1000 + (i + 7) % 50, 8000 + i % 20, 1000 + (i + 13) % 50
+        t1, t2 = 5000 + (2 * i) % 1000, 5000 + (2 * i + 1) % 1000
+        quads.append((Opcode.MULT, b, c, t1))
+        quads.append((Opcode.SUMA, a, t1, t2))
+        quads.append((Opcode.ASIG, t2, None, x))
+    return quads
+
+
+def medir_memoria(construir):
+    """Devuelve (estructura, bytes asignados al construirla)."""
+    tracemalloc.start()
+    estructura = construir()
+    usados, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return estructura, usados
+
+
+def recorrer_objetos(lista):
+    total = 0
+    for quad in lista:
+        total += quad.operador + quad.resultado
+    return total
+
+
+def recorrer_fila(fila):
+    total = 0
+    for operador, resultado in zip(fila.operadores, fila.resultados):
+        total += operador + resultado
+    return total
+
+
+def medir_tiempo(funcion, estructura, repeticiones=5):
+    """Mejor tiempo de 'repeticiones' recorridos completos."""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(estructura)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+if __name__ == '__main__':
+    estatutos = int(sys.argv[1]) if len(sys.argv) > 1 else ESTATUTOS
+    quads = generar_programa(estatutos)
+    total = len(quads)
+
+    def construir_dict():
+        return [CuadruploConDict(*quad) for quad in quads]
+
+    def construir_slots():
+        return [Cuadruplo(*quad) for quad in quads]
+
+    def construir_fila():
+        fila = FilaCuadruplos()
+        for quad in quads:
+            fila.agregar(*quad)
+        return fila
+
+    print(f"--- Benchmark de Almacenamiento de Cuádruplos ({total} cuádruplos) ---")
+    print(f"{'Representación':<26}{'bytes/quad':>12}{'recorrido (ms)':>16}")
+    for nombre, construir, recorrer in (
+        ("lista de objetos __dict__", construir_dict, recorrer_objetos),
+        ("lista de vistas __slots__", construir_slots, recorrer_objetos),
+        ("FilaCuadruplos array('i')", construir_fila, recorrer_fila),
+    ):
+        estructura, usados = medir_memoria(construir)
+        segundos = medir_tiempo(recorrer, estructura)
+        print(f"{nombre:<26}{usados / total:>12.1f}{segundos * 1000:>16.1f}")
+        del estructura
@@ -0,0 +1,85 @@
+# -----------------------------------------------------------------
+# bench_cubo.py
+#
+# Consultas por segundo al cubo semántico:
+#   1. El cubo original: diccionario anidado de IDs numéricos y el
+#      tipo de resultado buscado recorriendo self.tipos
+#   2. SemanticCube.lookup (strings sobre la tabla densa)
+#   3. SemanticCube.lookup_codigo (códigos enteros, como lo llama el
+#      QuadManager)
+#
+# Las consultas son una mezcla fija de combinaciones válidas, como las
+# que hace el parser al compilar expresiones.
+#
+# Uso: python bench_cubo.py [consultas]
+# -----------------------------------------------------------------
+import random
+import sys
+import time
+
+from semantic_cube import SemanticCube, TIPOS, CODIGO_TIPO, CODIGO_OPERADOR, OPERADORES
+
+CONSULTAS = 1000000
+
+
+class CuboConDicts:
+    """Copia del lookup original (diccionarios anidados)."""
+    def __init__(self, cubo):
+        self.tipos = {'entero': 1, 'flotante': 2, 'booleano': 3, 'error': -1}
+        self.cubo = {
+            self.tipos[izq]: {
+                self.tipos[der]: {op: self.tipos[res] for op, res in por_op.items()}
+                for der, por_op in por_der.items()
+            }
+            for izq, por_der in cubo.cubo.items()
+        }
+
+    def lookup(self, op_izq, op_der, operador):
+        tipo_izq = self.tipos.get(op_izq, self.tipos['error'])
+        tipo_der = self.tipos.get(op_der, self.tipos['error'])
+        resultado_num = self.cubo.get(tipo_izq, {}).get(tipo_der, {}).get(operador, self.tipos['error'])
+        if resultado_num == self.tipos['error']:
+            raise Exception(f"Error Semántico: Operación inválida. No se puede hacer '{op_izq} {operador} {op_der}'.")
+        for tipo_str, tipo_num in self.tipos.items():
+            if tipo_num == resultado_num:
+                return tipo_str
+        return 'error'
+
+
+def generar_consultas(cuantas):
+    """Combinaciones válidas (tipo_izq, tipo_der, operador) al azar."""
+    aleatorio = random.Random(0)
+    cubo = SemanticCube()
+    validas = [(izq, der, op) for izq, por_der in cubo.cubo.items()
+               for der, por_op in por_der.items() for op in por_op]
+    return [aleatorio.choice(validas) for _ in range(cuantas)]
+
+
+def medir(nombre, lookup, consultas, referencia=None):
+    inicio = time.perf_counter()
+    for izq, der, op in consultas:
+        lookup(izq, der, op)
+    segundos = time.perf_counter() - inicio
+    por_segundo = len(consultas) / segundos
+    comparacion = f"  ({por_segundo / referencia:.1f}x)" if referencia else ""
+    print(f"  {nombre:<34}{por_segundo:>16,.0f} consultas/s{comparacion}")
+    return por_segundo
+
+
+if __name__ == '__main__':
+    cuantas = int(sys.argv[1]) if len(sys.argv) > 1 else CONSULTAS
+    cubo = SemanticCube()
+    original = CuboConDicts(cubo)
+
+    consultas = generar_consultas(cuantas)
+    codigos = [(CODIGO_TIPO[izq], CODIGO_TIPO[der], CODIGO_OPERADOR[op]) for izq, der, op in consultas]
+
+    # Las tres dan lo mismo
+    for (izq, der, op), (c_izq, c_der, c_op) in zip(consultas[:1000], codigos):
+        assert original.lookup(izq, der, op) == cubo.lookup(izq, der, op)
+        assert cubo.lookup(izq, der, op) == TIPOS[cubo.lookup_codigo(c_izq, c_der, c_op)]
+
+    print(f"--- Benchmark del Cubo Semántico ({cuantas} consultas, {len(OPERADORES)} operadores) ---")
+    base = medir("Diccionarios anidados (original)", original.lookup, consultas)
+    medir("Tabla densa, lookup (strings)", cubo.lookup, consultas, base)
+    medir("Tabla densa, lookup_codigo", cubo.lookup_codigo, codigos, base)
@@ -0,0 +1,69 @@
+# -----------------------------------------------------------------
+# bench_escaner.py
+#
+# Compara el lexer de PLY (lexer.py) contra el Escaner de una sola
+# expresión regular (escaner.py) sobre un programa sintético grande:
+# tokens por segundo al solo tokenizar, y el tiempo de compilar el
+# programa completo con cada uno.
+#
+# Uso: python bench_escaner.py [estatutos]
+# -----------------------------------------------------------------
+import sys
+import time
+
+from lexer import lexer
+from escaner import Escaner
+from parser import compilar
+
+ESTATUTOS = 50000
+
+ESTATUTO = '''    x{i} = (a + {i}) * b - 2.5 / (c + 1.0); // estatuto {i}
+    escribe("x vale", x{i});
+'''
+
+
+def generar_programa(estatutos):
+    """Un programa con muchos IDs, constantes, letreros y comentarios."""
+    variables = min(estatutos, 900)
+    declaraciones = ', '.join(f"x{i}" for i in range(variables))
+    cuerpo = ''.join(ESTATUTO.format(i=i % variables) for i in range(estatutos))
+    return (f"programa bench;\nvars\n    {declaraciones} : flotante;\n"
+            f"    a, b, c : flotante;\ninicio\n{{\n{cuerpo}}}\nfin\n")
+
+
+def tokenizar(lexer_base, data):
+    """Devuelve (número de tokens, segundos)."""
+    lex = lexer_base.clone()
+    lex.lineno = 1
+    inicio = time.perf_counter()
+    lex.input(data)
+    total = 0
+    token = lex.token
+    while token() is not None:
+        total += 1
+    return total, time.perf_counter() - inicio
+
+
+def mejor(funcion, repeticiones=3):
+    resultados = [funcion() for _ in range(repeticiones)]
+    return min(resultados, key=lambda r: r[-1])
+
+
+if __name__ == '__main__':
+    estatutos = int(sys.argv[1]) if len(sys.argv) > 1 else ESTATUTOS
+    data = generar_programa(estatutos)
+
+    print(f"--- Benchmark de Escáneres ({len(data) / 1e6:.1f} MB, {estatutos} estatutos) ---")
+    print(f"{'Escáner':<22}{'tokens':>10}{'tokenizar (s)':>15}{'tokens/s':>14}{'compilar (s)':>14}")
+    tiempos = {}
+    for nombre, lexer_base in (("PLY (lexer.py)", lexer), ("Escaner (escaner.py)", Escaner())):
+        total, segundos = mejor(lambda: tokenizar(lexer_base, data))
+        inicio = time.perf_counter()
+        resultado = compilar(data, lexer_base=lexer_base)
+        compilacion = time.perf_counter() - inicio
+        assert resultado.exito, resultado.errores[:3]
+        tiempos[nombre] = segundos
+        print(f"{nombre:<22}{total:>10}{segundos:>15.3f}{total / segundos:>14,.0f}{compilacion:>14.3f}")
+
+    ply, escaner = tiempos.values()
+    print(f"Aceleración al tokenizar: {ply / escaner:.2f}x")
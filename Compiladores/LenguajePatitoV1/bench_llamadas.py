@@ -0,0 +1,99 @@
+# -----------------------------------------------------------------
+# bench_llamadas.py
+#
+# Costo de una llamada a función en la Máquina Virtual (ERA, PARAM,
+# GOSUB y ENDFUNC).
+#
+# Un ciclo 'mientras' llama LLAMADAS veces a una función de 2
+# parámetros cuyo cuerpo es una sola asignación; el mismo ciclo con
+# esa asignación en línea es la referencia. La diferencia entre los
+# dos, entre el número de llamadas, es el costo de cada llamada. Se
+# mide con registros de activación de distinto tamaño (más locales),
+# y aparte con una función recursiva (fibonacci).
+#
+# Uso: python bench_llamadas.py [llamadas]
+# -----------------------------------------------------------------
+import sys
+import time
+
+from parser import compilar
+from maquina_virtual import MaquinaVirtual
+
+LLAMADAS = 100000
+LOCALES = (0, 10, 100)  # Variables locales de la función, además de sus 2 parámetros
+FIBONACCI = 20
+
+PROGRAMA = '''
+programa bench_llamadas;
+vars i, r : entero; x : flotante;
+nula f(a : entero, b : flotante) {
+    %s
+    { r = a; }
+};
+inicio
+{
+    x = 1.5;
+    mientras (i < %d) haz {
+        %s
+        i = i + 1;
+    };
+}
+fin
+'''
+
+PROGRAMA_FIBONACCI = '''
+programa bench_fibonacci;
+vars r : entero;
+nula fib(n : entero) {
+    vars a : entero;
+    { si (n < 2) { r = n; } sino { fib(n - 1); a = r; fib(n - 2); r = a + r; }; }
+};
+inicio { fib(%d); escribe(r); } fin
+'''
+
+
+def ejecutar(fuente):
+    """Compila y ejecuta 'fuente': (segundos de ejecución, valores escritos)."""
+    resultado = compilar(fuente)
+    if not resultado.exito:
+        raise Exception(resultado.reporte_errores())
+    salida = []
+    mv = MaquinaVirtual(salida=salida.append)
+    mv.cargar(resultado.fila_cuadruplos, resultado.tabla_constantes.valores, None, resultado.dir_funciones)
+    inicio = time.perf_counter()
+    mv.ejecutar()
+    return time.perf_counter() - inicio, salida
+
+
+def medir(llamadas, locales):
+    """Segundos del ciclo con la llamada y del ciclo con el cuerpo en línea."""
+    declaracion = f"vars {', '.join(f'l{i}' for i in range(locales))} : entero;" if locales else ""
+    con_llamada, _ = ejecutar(PROGRAMA % (declaracion, llamadas, "f(i, x);"))
+    en_linea, _ = ejecutar(PROGRAMA % (declaracion, llamadas, "r = i;"))
+    return con_llamada, en_linea
+
+
+def llamadas_fibonacci(n):
+    """Llamadas que hace fib(n): fib(0) y fib(1) hacen una."""
+    anterior, actual = 1, 1
+    for _ in range(n - 1):
+        anterior, actual = actual, anterior + actual + 1
+    return actual
+
+
+if __name__ == '__main__':
+    llamadas = int(sys.argv[1]) if len(sys.argv) > 1 else LLAMADAS
+
+    medir(llamadas // 10, 0)  # Calentamiento
+
+    print(f"--- Benchmark de Llamadas ({llamadas} llamadas) ---")
+    print(f"{'locales':>8}{'con llamada (s)':>17}{'en línea (s)':>14}{'por llamada (µs)':>18}")
+    for locales in LOCALES:
+        con_llamada, en_linea = medir(llamadas, locales)
+        por_llamada = (con_llamada - en_linea) / llamadas * 1e6
+        print(f"{locales:>8}{con_llamada:>17.3f}{en_linea:>14.3f}{por_llamada:>18.2f}")
+
+    segundos, salida = ejecutar(PROGRAMA_FIBONACCI % FIBONACCI)
+    total = llamadas_fibonacci(FIBONACCI)
+    print(f"fib({FIBONACCI}) = {salida[0]}: {total} llamadas recursivas en {segundos:.3f} s "
+          f"({segundos / total * 1e6:.2f} µs por llamada, con su cuerpo)")
@@ -0,0 +1,68 @@
+# -----------------------------------------------------------------
+# bench_vm.py
+#
+# Micro-benchmark de la Máquina Virtual: cuádruplos por segundo.
+#
+# El programa de prueba es un ciclo 'mientras' cuyo cuerpo son
+# asignaciones aritméticas; da ITERACIONES vueltas dentro de la MV
+# (con su GOTOF y su GOTO).
+#
+# Uso: python bench_vm.py [iteraciones]
+# -----------------------------------------------------------------
+import sys
+import time
+
+from parser import compilar
+from maquina_virtual import MaquinaVirtual
+
+ITERACIONES = 20000
+REPETICIONES_CUERPO = 10  # Copias del cuerpo dentro del 'mientras'
+
+CUERPO = '''
+        i = i + 1;
+        j = (i * 3 - k) / 2;
+        k = j + i * 2;
+        x = x * 0.5 + y;
+        y = x / 3.0 - 1.0;
+'''
+
+PROGRAMA = '''
+programa bench_vm;
+vars
+    i, j, k : entero;
+    x, y : flotante;
+inicio
+{
+    mientras (i < %d) haz {
+%s
+    };
+}
+fin
+'''
+
+
+def medir(iteraciones):
+    """Ejecuta el ciclo de 'iteraciones' vueltas: (segundos, cuádruplos por vuelta)."""
+    # 'i' avanza 1 por cada copia del cuerpo
+    resultado = compilar(PROGRAMA % (iteraciones * REPETICIONES_CUERPO, CUERPO * REPETICIONES_CUERPO))
+    mv = MaquinaVirtual(salida=lambda valor: None)
+    mv.cargar(resultado.fila_cuadruplos, resultado.tabla_constantes.valores)
+    inicio = time.perf_counter()
+    mv.ejecutar()
+    # Todo el programa es el ciclo: condición, GOTOF, cuerpo y GOTO
+    return time.perf_counter() - inicio, len(mv.operadores)
+
+
+if __name__ == '__main__':
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else ITERACIONES
+
+    medir(iteraciones // 10)  # Calentamiento
+    segundos, por_vuelta = medir(iteraciones)
+    ejecutados = por_vuelta * iteraciones + 2  # + la última condición y su GOTOF
+
+    print("--- Benchmark de la Máquina Virtual ---")
+    print(f"Cuádruplos por iteración: {por_vuelta}")
+    print(f"Iteraciones:              {iteraciones}")
+    print(f"Cuádruplos ejecutados:    {ejecutados}")
+    print(f"Tiempo:                   {segundos:.3f} s")
+    print(f"Throughput:               {ejecutados / segundos:,.0f} cuádruplos/s")
@@ -0,0 +1,185 @@
+# -----------------------------------------------------------------
+# cache_compilacion.py
+#
+# Caché de Compilación en disco, direccionada por contenido.
+# La llave es el SHA-256 del código fuente + la huella del compilador
+# (el contenido de sus módulos) + las opciones de compilación. En un
+# acierto se carga el .pobj guardado y NO se corre el parser de PLY
+# ni las validaciones semánticas.
+#
+# Las entradas se desalojan por edad (max_edad segundos desde su
+# último uso) y por tamaño (max_bytes en total, primero las que
+# llevan más tiempo sin usarse).
+# -----------------------------------------------------------------
+import hashlib
+import os
+import time
+
+from objeto import a_bytes, desde_bytes, ProgramaObjeto, EXTENSION, VERSION_OBJETO
+
+# Módulos cuyo contenido determina el código que se genera
+MODULOS_COMPILADOR = ('lexer.py', 'lextab.py', 'parser.py', 'parsetab.py',
+                      'directory.py', 'semantic_cube.py',
+                      'memoria.py', 'constantes.py', 'quad_manager.py',
+                      'optimizador.py', 'objeto.py')
+
+def huella_compilador():
+    """Hash de los módulos del compilador: cambia si cambia el compilador."""
+    h = hashlib.sha256(f"objeto-v{VERSION_OBJETO}".encode('utf-8'))
+    carpeta = os.path.dirname(os.path.abspath(__file__))
+    for modulo in MODULOS_COMPILADOR:
+        with open(os.path.join(carpeta, modulo), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+VERSION_COMPILADOR = huella_compilador()
+
+
+class CacheCompilacion:
+    def __init__(self, directorio='.cache_patito', max_bytes=64 * 1024 * 1024, max_edad=7 * 24 * 3600):
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        self.max_edad = max_edad
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojados = 0
+        os.makedirs(directorio, exist_ok=True)
+
+    def llave(self, fuente, opciones=''):
+        """Llave de la entrada: hash del fuente, del compilador y de las opciones."""
+        h = hashlib.sha256(VERSION_COMPILADOR.encode('utf-8'))
+        h.update(b'\0' + opciones.encode('utf-8') + b'\0')
+        h.update(fuente.encode('utf-8'))
+        return h.hexdigest()
+
+    def _ruta(self, llave):
+        return os.path.join(self.directorio, llave + EXTENSION)
+
+    def obtener(self, fuente, compilar, opciones=''):
+        """
+        Devuelve el ProgramaObjeto del fuente.
+        En un fallo llama a 'compilar(fuente)', que debe devolver
+        (dir_funciones, tabla_constantes, fila_cuadruplos), y guarda el
+        resultado en disco.
+        """
+        ruta = self._ruta(self.llave(fuente, opciones))
+        try:
+            with open(ruta, 'rb') as f:
+                datos = f.read()
+            if time.time() - os.path.getmtime(ruta) <= self.max_edad:
+                programa = desde_bytes(datos)
+                os.utime(ruta)  # Marca el último uso (para el desalojo)
+                self.aciertos += 1
+                return programa
+        except Exception:
+            pass  # No existe, está corrupta o es de otra versión: se recompila
+
+        self.fallos += 1
+        dir_funciones, tabla_constantes, fila_cuadruplos = compilar(fuente)
+        datos = a_bytes(dir_funciones, tabla_constantes, fila_cuadruplos)
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, 'wb') as f:
+            f.write(datos)
+        os.replace(temporal, ruta)  # Escritura atómica: nunca se lee una entrada a medias
+        self.desalojar()
+        return ProgramaObjeto(dir_funciones, tabla_constantes, fila_cuadruplos)
+
+    def desalojar(self):
+        """Borra las entradas vencidas y, si se pasa de max_bytes, las menos usadas."""
+        ahora = time.time()
+        entradas = []
+        for nombre in os.listdir(self.directorio):
+            if not nombre.endswith(EXTENSION):
+                continue
+            ruta = os.path.join(self.directorio, nombre)
+            try:
+                info = os.stat(ruta)
+            except FileNotFoundError:
+                continue
+            if ahora - info.st_mtime > self.max_edad:
+                self._borrar(ruta)
+            else:
+                entradas.append((info.st_mtime, info.st_size, ruta))
+
+        total = sum(tam for _, tam, _ in entradas)
+        for _, tam, ruta in sorted(entradas):
+            if total <= self.max_bytes:
+                break
+            self._borrar(ruta)
+            total -= tam
+
+    def _borrar(self, ruta):
+        try:
+            os.remove(ruta)
+            self.desalojados += 1
+        except FileNotFoundError:
+            pass
+
+    def __str__(self):
+        """Representación en string para depuración."""
+        total = self.aciertos + self.fallos
+        tasa = 100 * self.aciertos / total if total else 0
+        return (f"--- Caché de Compilación ({self.directorio}) ---\n"
+                f"  Aciertos: {self.aciertos}  Fallos: {self.fallos}  "
+                f"Desalojados: {self.desalojados}  Tasa: {tasa:.0f}%\n"
+                f"------------------------------------------")
+
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    import tempfile
+    from parser import compilar as compilar_patito
+
+    with open('prueba_etapa3.pat', 'r') as f:
+        fuente = f.read()
+    compilado = compilar_patito(fuente)
+    resultado = (compilado.dir_funciones, compilado.tabla_constantes, compilado.fila_cuadruplos)
+    compilaciones = []
+
+    def compilar(texto):
+        compilaciones.append(texto)
+        return resultado
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        cache = CacheCompilacion(carpeta)
+
+        # Caso 1: la primera vez compila, la segunda no
+        primero = cache.obtener(fuente, compilar)
+        segundo = cache.obtener(fuente, compilar)
+        assert len(compilaciones) == 1
+        assert (cache.aciertos, cache.fallos) == (1, 1)
+        assert segundo.fila_cuadruplos.operadores == primero.fila_cuadruplos.operadores
+        assert segundo.tabla_constantes.valores == primero.tabla_constantes.valores
+        # Un acierto conserva los spans: los errores de ejecución siguen ubicados
+        assert segundo.fila_cuadruplos.inicios == primero.fila_cuadruplos.inicios
+        assert segundo.fila_cuadruplos.fines == primero.fila_cuadruplos.fines
+
+        # Caso 2: otro fuente u otras opciones son otra llave
+        cache.obtener(fuente + "\n", compilar)
+        cache.obtener(fuente, compilar, opciones='-O')
+        assert len(compilaciones) == 3
+
+        # Caso 3: una entrada corrupta se recompila
+        with open(cache._ruta(cache.llave(fuente)), 'wb') as f:
+            f.write(b'basura')
+        cache.obtener(fuente, compilar)
+        assert len(compilaciones) == 4
+
+        # Caso 4: desalojo por tamaño deja solo lo que cabe
+        cache.max_bytes = 0
+        cache.desalojar()
+        assert os.listdir(carpeta) == []
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        # Caso 5: desalojo por edad (una entrada vencida se recompila)
+        cache = CacheCompilacion(carpeta, max_edad=-1)
+        cache.obtener(fuente, compilar)
+        cache.obtener(fuente, compilar)
+        assert cache.aciertos == 0 and cache.desalojados >= 1
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de cache_compilacion.py: OK")
@@ -0,0 +1,400 @@
+# -----------------------------------------------------------------
+# compilacion_incremental.py
+#
+# Recompilación incremental a nivel de función.
+# El programa se parte en unidades: el encabezado (programa y vars
+# globales), cada func_def y el cuerpo principal (de 'inicio' a
+# 'fin'). Cada unidad se compila por separado y se guarda con una
+# huella de su texto; al recompilar, las unidades que no cambiaron
+# reutilizan su entrada del directorio y sus cuádruplos, y solo las
+# editadas pasan otra vez por el parser.
+#
+# Al final se re-enlaza la fila de cuádruplos:
+# - las constantes se vuelven a internar en la tabla final, en el
+#   mismo orden en que las internó cada unidad (así las direcciones
+#   salen iguales que en una compilación completa),
+# - los saltos se recorren al nuevo inicio de la unidad en la fila, y
+#   cada GOSUB va al nuevo inicio de la función que llama,
+# - los spans se recorren a la nueva posición de la unidad en el fuente.
+# Para que las llamadas compilen (y las funciones conserven su número)
+# cada unidad se compila con las funciones anteriores como esqueletos:
+# su firma con un cuerpo vacío.
+# Las entradas del directorio de la caché no se tocan: cada programa
+# enlazado recibe copias (con su propio inicio y sus líneas), así que
+# un resultado anterior no cambia al compilar la siguiente versión.
+# Las variables globales no se reubican: la huella de cada unidad
+# incluye el encabezado, así que sus direcciones no cambian. Las
+# locales y los temporales son relativos a cada función.
+#
+# Si algo no cuadra (el fuente no se puede partir, una unidad tiene
+# errores, funciones repetidas), se hace una compilación completa para
+# que los diagnósticos sean exactamente los de parser.compilar().
+# -----------------------------------------------------------------
+import hashlib
+import re
+
+from escaner import Escaner
+from mapa_fuente import MapaFuente
+from memoria import AsignadorMemoria, SEGMENTOS_MARCO, ambito_de
+from directory import FuncDirectory, Simbolo, VarTable
+from constantes import TablaConstantes
+from quad_manager import FilaCuadruplos, Opcode, SIN_OPERANDO, SALTOS
+from optimizador import Optimizador
+from parser import Compilador, ResultadoCompilacion
+
+TIPOS_RETORNO = ('ENTERO', 'FLOTANTE', 'NULA')
+
+# Texto con el que se cierra la compilación aislada de una función
+CUERPO_VACIO = " inicio { } fin"
+
+
+def en_blanco(texto):
+    """'texto' con todo cambiado por espacios menos los saltos de línea."""
+    return re.sub(r'[^\n]', ' ', texto)
+
+
+def esqueletos(fuente, funciones, desde, hasta):
+    """
+    El texto de fuente[desde:hasta] con cada func_def que contiene
+    cambiada por su firma y un cuerpo vacío ('{{}};'), y lo demás en
+    blanco. Mide lo mismo y tiene los mismos saltos de línea.
+    """
+    partes = []
+    for _, inicio, fin, firma in funciones:
+        if desde <= inicio and fin <= hasta:
+            partes.append(en_blanco(fuente[desde:inicio]))
+            resto = list(en_blanco(fuente[inicio + len(firma):fin]))
+            cuerpo = iter('{{}};')
+            for i, caracter in enumerate(resto):
+                if caracter != '\n':
+                    resto[i] = next(cuerpo, ' ')
+            partes.append(firma + ''.join(resto))
+            desde = fin
+    partes.append(en_blanco(fuente[desde:hasta]))
+    return ''.join(partes)
+
+
+def partir(fuente):
+    """
+    Parte 'fuente' en (fin del encabezado, [(nombre, inicio, fin, firma)]
+    de cada func_def, inicio del cuerpo principal), con offsets en el
+    fuente. 'firma' es el texto de la función hasta su primer '{'.
+    Devuelve None si el fuente no tiene la forma esperada (incluso con
+    errores léxicos): entonces se compila completo.
+    """
+    escaner = Escaner()
+    escaner.errores = []
+    escaner.input(fuente)
+    tokens = list(escaner)
+    if escaner.errores:
+        return None
+
+    funciones = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.type == 'INICIO':
+            fin_encabezado = funciones[0][1] if funciones else token.lexpos
+            return fin_encabezado, funciones, token.lexpos
+        if (token.type in TIPOS_RETORNO and i + 2 < len(tokens)
+                and tokens[i + 1].type == 'ID' and tokens[i + 2].type == 'LPAREN'):
+            # La función termina en el ';' que sigue a su '}' de cierre
+            profundidad = 0
+            firma = None
+            j = i + 3
+            while j < len(tokens):
+                if tokens[j].type == 'LBRACE':
+                    if firma is None:
+                        firma = fuente[token.lexpos:tokens[j].lexpos]
+                    profundidad += 1
+                elif tokens[j].type == 'RBRACE':
+                    profundidad -= 1
+                    if profundidad == 0:
+                        break
+                j += 1
+            if j + 1 >= len(tokens) or tokens[j + 1].type != 'PTOCOMA':
+                return None
+            funciones.append((tokens[i + 1].value, token.lexpos, tokens[j + 1].lexfin, firma))
+            i = j + 2
+            continue
+        if funciones:
+            return None  # Algo que no es función entre las funciones
+        i += 1
+    return None
+
+
+def copiar_entrada(entrada, padre=None, lineas=0):
+    """
+    Copia de una entrada del directorio con su VarTable (hija de
+    'padre') y sus Simbolos, recorridos 'lineas' líneas.
+    """
+    copia = dict(entrada)
+    copia['parametros'] = list(entrada['parametros'])
+    copia['tabla_vars'] = tabla = VarTable(padre)
+    for nombre, simbolo in entrada['tabla_vars'].variables.items():
+        tabla.variables[nombre] = Simbolo(simbolo.tipo, simbolo.direccion, simbolo.clase, simbolo.linea + lineas)
+    return copia
+
+
+class UnidadCompilada:
+    """Lo que se guarda de una unidad (encabezado, función o cuerpo principal) ya compilada."""
+    __slots__ = ('nombre', 'entrada', 'fila', 'primero', 'constantes', 'marca_maxima', 'contadores',
+                 'inicio', 'linea')
+
+    def __init__(self, nombre, resultado, inicio, linea):
+        self.nombre = nombre  # 'global' para el encabezado, None para el cuerpo principal
+        self.entrada = resultado.dir_funciones.functions[nombre] if nombre else None
+        self.fila = resultado.fila_cuadruplos
+        # Su primer cuádruplo: los de antes son de los esqueletos
+        self.primero = resultado.dir_funciones.functions[nombre or 'global']['inicio']
+        # [(valor, tipo, dirección)] en el orden en que la unidad los internó
+        self.constantes = [(valor, tipo, direccion) for (valor, tipo), direccion
+                           in resultado.tabla_constantes.direcciones.items()]
+        self.marca_maxima = dict(resultado.memoria.marca_maxima)
+        self.contadores = dict(resultado.memoria.contadores)
+        self.inicio = inicio  # Offset de la unidad en el fuente al compilarla
+        self.linea = linea    # Línea donde empezaba la unidad al compilarla
+
+
+class CompiladorIncremental:
+    """
+    Compila versiones sucesivas de un mismo programa reutilizando las
+    funciones que no cambiaron. Se usa como el Compilador:
+    compilar(fuente, optimizar) devuelve un ResultadoCompilacion.
+    """
+    def __init__(self):
+        self.unidades = {}   # {huella: UnidadCompilada} de la última compilación
+        self.reutilizadas = 0
+        self.recompiladas = 0
+        self.completa = False  # True si la última fue una compilación completa
+
+    def compilar(self, fuente, optimizar=False):
+        self.reutilizadas = 0
+        self.recompiladas = 0
+        self.completa = False
+        resultado = self._compilar_por_unidades(fuente, optimizar)
+        if resultado is None:
+            self.completa = True
+            resultado = Compilador(lexer_base=Escaner()).compilar(fuente, optimizar)
+        return resultado
+
+    def _compilar_por_unidades(self, fuente, optimizar):
+        partes = partir(fuente)
+        if partes is None:
+            return None
+        fin_encabezado, funciones, inicio_principal = partes
+        encabezado = fuente[:fin_encabezado]
+        if len({nombre for nombre, _, _, _ in funciones}) != len(funciones):
+            return None  # Funciones repetidas: el error lo reporta la compilación completa
+
+        # La huella de cada unidad incluye el encabezado (direcciones y
+        # tipos de las globales) y las firmas de todas las funciones
+        contexto = hashlib.blake2b(digest_size=16)
+        contexto.update(encabezado.encode('utf-8'))
+        for _, _, _, firma in funciones:
+            contexto.update(b'\0' + firma.encode('utf-8'))
+
+        def huella(texto):
+            h = contexto.copy()
+            h.update(b'\1' + texto.encode('utf-8'))
+            return h.hexdigest()
+
+        unidades = {}
+        encabezado_compilado = self._unidad(unidades, huella(''), 'global', encabezado + CUERPO_VACIO, 0, 1)
+        if encabezado_compilado is None:
+            return None
+        compiladas = []
+        linea, contadas = 1, 0  # Línea de 'inicio', contando los saltos hasta ahí
+        for nombre, inicio, fin, _ in funciones:
+            linea, contadas = linea + fuente.count('\n', contadas, inicio), inicio
+            texto = fuente[inicio:fin]
+            fuente_aislado = encabezado + esqueletos(fuente, funciones, fin_encabezado, inicio) + texto + CUERPO_VACIO
+            compiladas.append(self._unidad(unidades, huella(texto), nombre, fuente_aislado, inicio, linea))
+        linea += fuente.count('\n', contadas, inicio_principal)
+        texto = fuente[inicio_principal:]
+        fuente_aislado = encabezado + esqueletos(fuente, funciones, fin_encabezado, inicio_principal) + texto
+        compiladas.append(self._unidad(unidades, huella(texto), None, fuente_aislado, inicio_principal, linea))
+
+        # Solo se guardan las unidades de esta versión (sin error)
+        self.unidades = unidades
+        if None in compiladas:
+            return None
+        return self._enlazar(fuente, encabezado_compilado, compiladas, optimizar)
+
+    def _unidad(self, unidades, llave, nombre, fuente_aislado, inicio, linea):
+        """
+        (unidad, desplazamiento en el fuente, en líneas) con la unidad de
+        la caché con esa huella, o recién compilada, para ponerla en
+        'inicio' (en la línea 'linea'). None si tiene errores.
+        """
+        unidad = self.unidades.get(llave)
+        if unidad is not None:
+            self.reutilizadas += 1
+        else:
+            self.recompiladas += 1
+            resultado = Compilador(lexer_base=Escaner()).compilar(fuente_aislado)
+            if not resultado.exito:
+                return None  # Los errores los reporta la compilación completa
+            unidad = UnidadCompilada(nombre, resultado, inicio, linea)
+        unidades[llave] = unidad
+        return unidad, inicio - unidad.inicio, linea - unidad.linea
+
+    def _enlazar(self, fuente, encabezado, compiladas, optimizar):
+        """Arma el programa completo con las unidades, en orden."""
+        encabezado, _, _ = encabezado
+        memoria = AsignadorMemoria()
+        for segmento, usadas in encabezado.contadores.items():
+            if segmento[0] == 'global':
+                memoria.contadores[segmento] = usadas
+        dir_funciones = FuncDirectory(memoria)
+        dir_funciones.functions['global'] = principal = copiar_entrada(encabezado.entrada)
+        tabla_constantes = TablaConstantes(memoria)
+        fila = FilaCuadruplos()
+        inicios = [None] * len(compiladas)  # Por número de función (el 0 es el 'global')
+        if len(compiladas) > 1:
+            fila.agregar('GOTO', None, None, None)  # Al cuerpo principal
+
+        for unidad, desplazamiento, lineas in compiladas:
+            base = len(fila)
+            if unidad.nombre is not None:
+                # Su ámbito cuelga del global de este programa, no del de
+                # la compilación en la que se guardó
+                entrada = copiar_entrada(unidad.entrada, principal['tabla_vars'], lineas)
+                dir_funciones.functions[unidad.nombre] = entrada
+                entrada['inicio'] = inicios[entrada['numero']] = base
+            else:
+                # Al final queda el estado del cuerpo principal, como en una compilación completa
+                for segmento, usadas in unidad.contadores.items():
+                    if segmento[0] in ('local', 'temporal'):
+                        memoria.contadores[segmento] = usadas
+                principal['inicio'] = base
+                principal['recursos'] = [unidad.contadores[segmento] for segmento in SEGMENTOS_MARCO]
+                if base > 0:
+                    fila.rellenar(0, base)
+            for segmento, maximo in unidad.marca_maxima.items():
+                memoria.marca_maxima[segmento] = max(memoria.marca_maxima[segmento], maximo)
+
+            reubicacion = {direccion: tabla_constantes.obtener_direccion(valor, tipo)
+                           for valor, tipo, direccion in unidad.constantes}
+
+            def reubicar(direccion):
+                if direccion != SIN_OPERANDO and ambito_de(direccion) == 'constante':
+                    return reubicacion[direccion]
+                return direccion
+
+            origen = unidad.fila
+            for i in range(unidad.primero, len(origen)):
+                op = origen.operadores[i]
+                izq, res = origen.izquierdos[i], origen.resultados[i]
+                if op == Opcode.GOSUB:
+                    res = inicios[izq]  # 'izq' es el número de la función llamada
+                elif op in SALTOS:
+                    res += base - unidad.primero
+                elif op != Opcode.PARAM:  # El de un PARAM es el número de parámetro
+                    res = reubicar(res)
+                if op not in (Opcode.ERA, Opcode.GOSUB):
+                    izq = reubicar(izq)
+                inicio, fin = origen.span(i)
+                span = (inicio + desplazamiento, fin + desplazamiento) if inicio >= 0 else (inicio, fin)
+                fila.agregar(op, izq, reubicar(origen.derechos[i]), res, span)
+
+        optimizador = None
+        if optimizar:
+            optimizador = Optimizador(tabla_constantes)
+            fila = optimizador.optimizar(fila, dir_funciones)
+
+        return ResultadoCompilacion(dir_funciones, tabla_constantes, fila, memoria, [],
+                                    optimizador, MapaFuente.desde_texto(fuente))
+
+    def __str__(self):
+        modo = "completa" if self.completa else "por funciones"
+        return (f"--- Compilación Incremental ({modo}) ---\n"
+                f"  Unidades reutilizadas: {self.reutilizadas}  Recompiladas: {self.recompiladas}\n"
+                f"----------------------------------------")
+
+
+# -----------------------------------------------------------
+# PRUEBAS (mismo resultado que una compilación completa)
+# -----------------------------------------------------------
+def run_tests():
+    from parser import compilar
+    from maquina_virtual import MaquinaVirtual
+
+    def columnas(resultado):
+        fila = resultado.fila_cuadruplos
+        return (fila.operadores, fila.izquierdos, fila.derechos, fila.resultados,
+                fila.inicios, fila.fines, resultado.tabla_constantes.valores,
+                str(resultado.dir_funciones), resultado.memoria.marca_maxima)
+
+    fuente = '''programa p;
+vars x : entero; y : flotante;
+nula f(a : entero) { vars t : entero; { t = a * 2 + 1; escribe(t, "f"); si (a > 0) { f(a - 1); }; } };
+flotante g() { vars u : flotante; { u = y * 1.5; escribe(u, 2); } };
+nula h(b : flotante) { { y = b + 1; f(x); } };
+inicio { x = 3; y = x + 0.5; escribe(x, y, "fin"); h(y); g(); } fin'''
+
+    incremental = CompiladorIncremental()
+    resultado = incremental.compilar(fuente)
+    assert resultado.exito and not incremental.completa
+    assert (incremental.reutilizadas, incremental.recompiladas) == (0, 5)
+    assert columnas(resultado) == columnas(compilar(fuente))
+
+    # Sin cambios: nada se recompila
+    incremental.compilar(fuente)
+    assert (incremental.reutilizadas, incremental.recompiladas) == (5, 0)
+
+    # Se edita el cuerpo de 'g' (más largo, con una línea más y
+    # constantes nuevas): 'f', 'h' y el principal se reutilizan
+    # aunque se movieron en el fuente y en la tabla de constantes
+    editado = fuente.replace("u = y * 1.5;", "u = y * 2.5 - 7;\n u = u / 3;")
+    resultado = incremental.compilar(editado)
+    assert (incremental.reutilizadas, incremental.recompiladas) == (4, 1)
+    assert columnas(resultado) == columnas(compilar(editado))
+    assert columnas(incremental.compilar(editado, optimizar=True)) == columnas(compilar(editado, optimizar=True))
+
+    # Las llamadas van al nuevo inicio de cada función
+    salida = []
+    mv = MaquinaVirtual(salida=salida.append)
+    mv.cargar(resultado.fila_cuadruplos, resultado.tabla_constantes.valores, None, resultado.dir_funciones)
+    mv.ejecutar()
+    assert salida == [3, 3.5, "fin", 7, "f", 5, "f", 3, "f", 1, "f", (4.5 * 2.5 - 7) / 3, 2], salida
+
+    # Los resultados anteriores no cambian al compilar otra versión:
+    # el directorio de cada uno es una copia del de la caché
+    anterior = incremental.compilar(editado)
+    columnas_anterior = columnas(anterior)
+    simbolo_g = anterior.dir_funciones.lookup_var_entry_in_func('g', 'u')
+    inicio_g = anterior.dir_funciones.functions['g']['inicio']
+    siguiente = incremental.compilar(editado.replace("t = a * 2 + 1;", "t = a * 2 + 1;\n t = t - 1;"))
+    assert incremental.reutilizadas == 4
+    assert columnas(anterior) == columnas_anterior
+    assert anterior.dir_funciones.functions['g']['inicio'] == inicio_g
+    assert siguiente.dir_funciones.functions['g']['inicio'] > inicio_g
+    assert simbolo_g.linea == 4 and siguiente.dir_funciones.lookup_var_entry_in_func('g', 'u').linea == 5
+    assert anterior.dir_funciones.functions['global'] is not siguiente.dir_funciones.functions['global']
+
+    # Un cambio en las globales recompila todo
+    editado = editado.replace("x : entero;", "x : entero; z : entero;")
+    resultado = incremental.compilar(editado)
+    assert (incremental.reutilizadas, incremental.recompiladas) == (0, 5)
+    assert columnas(resultado) == columnas(compilar(editado))
+
+    # Con errores (o funciones repetidas) se compila completo y los
+    # diagnósticos son los de siempre
+    for con_error in (editado.replace("t = a * 2", "t = w * 2"),
+                      editado.replace("nula h(", "nula f("),
+                      editado.replace("inicio {", "inicio { x = 1 $ 2;")):
+        resultado = incremental.compilar(con_error)
+        assert incremental.completa and not resultado.exito
+        assert resultado.errores == compilar(con_error).errores
+
+    # Y al corregirlo vuelve a reutilizar (las unidades sin error se guardaron)
+    incremental.compilar(editado)
+    assert (incremental.reutilizadas, incremental.recompiladas) == (4, 1)
+    incremental.compilar(editado.replace("b + 1", "b + 2"))
+    assert (incremental.reutilizadas, incremental.recompiladas) == (4, 1)
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de compilacion_incremental.py: OK")
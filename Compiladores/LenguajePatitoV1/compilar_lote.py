@@ -0,0 +1,151 @@
+# -----------------------------------------------------------------
+# compilar_lote.py
+#
+# Compilación en lote de muchos archivos .pat en paralelo.
+# Reparte los archivos entre un pool de procesos (uno por núcleo);
+# cada proceso importa el parser UNA vez al arrancar (initializer) y
+# reutiliza sus tablas para todos los archivos que le tocan, con un
+# Compilador nuevo por archivo.
+#
+# Por cada archivo reporta si compiló, sus errores, cuántos
+# cuádruplos generó y el .pobj escrito; al final un resumen y el
+# tiempo total (opcionalmente comparado con compilar en serie).
+#
+# Uso: python compilar_lote.py <carpeta | patrón glob> [-j N] [-O]
+#                              [--sin-objeto] [--comparar-serial]
+#   -j N               procesos del pool (por omisión, uno por núcleo)
+#   -O                 aplica el optimizador de cuádruplos
+#   --sin-objeto       no escribe los archivos .pobj
+#   --comparar-serial  también compila todo en serie y compara tiempos
+# -----------------------------------------------------------------
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+class ResultadoArchivo:
+    """Resultado de compilar un archivo (se manda de vuelta desde el worker)."""
+    def __init__(self, ruta, errores, cuadruplos=0, constantes=0, objeto=None, segundos=0.0):
+        self.ruta = ruta
+        self.errores = errores
+        self.cuadruplos = cuadruplos
+        self.constantes = constantes
+        self.objeto = objeto      # Ruta del .pobj escrito (None si no se escribió)
+        self.segundos = segundos
+
+    @property
+    def exito(self):
+        return not self.errores
+
+    def __str__(self):
+        if self.exito:
+            destino = f" -> {self.objeto}" if self.objeto else ""
+            return (f"  OK     {self.ruta}: {self.cuadruplos} cuádruplos, "
+                    f"{self.constantes} constantes ({self.segundos * 1000:.1f} ms){destino}")
+        output = f"  ERROR  {self.ruta}: {len(self.errores)} error(es)\n"
+        output += "\n".join(f"           {error}" for error in self.errores)
+        return output
+
+
+def buscar_archivos(objetivo):
+    """Devuelve los .pat de una carpeta (recursivo) o los que coinciden con un patrón glob."""
+    if os.path.isdir(objetivo):
+        patron = os.path.join(objetivo, '**', '*.pat')
+    else:
+        patron = objetivo
+    return sorted(ruta for ruta in glob.glob(patron, recursive=True) if os.path.isfile(ruta))
+
+
+# --- 1. Trabajo de cada proceso ---
+
+def _iniciar_worker():
+    """Carga el parser (tablas de PLY) una sola vez por proceso."""
+    import parser  # noqa: F401
+
+
+def compilar_archivo(ruta, optimizar=False, escribir=True):
+    """Compila un archivo y devuelve su ResultadoArchivo. Nunca lanza excepciones."""
+    from parser import compilar_archivo as compilar_patito
+    from objeto import escribir_objeto, EXTENSION
+
+    inicio = time.perf_counter()
+    try:
+        resultado = compilar_patito(ruta, optimizar)
+    except Exception as e:
+        return ResultadoArchivo(ruta, [f"Error: {e}"], segundos=time.perf_counter() - inicio)
+
+    objeto = None
+    if resultado.exito and escribir:
+        objeto = ruta.rsplit('.', 1)[0] + EXTENSION
+        escribir_objeto(objeto, resultado.dir_funciones, resultado.tabla_constantes,
+                        resultado.fila_cuadruplos)
+    return ResultadoArchivo(ruta, resultado.errores, len(resultado.fila_cuadruplos),
+                            len(resultado.tabla_constantes), objeto,
+                            time.perf_counter() - inicio)
+
+
+# --- 2. Compilación del lote ---
+
+def compilar_en_paralelo(rutas, procesos=None, optimizar=False, escribir=True):
+    """Compila 'rutas' en un pool de procesos. Devuelve los resultados en el mismo orden."""
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_worker) as pool:
+        tareas = [pool.submit(compilar_archivo, ruta, optimizar, escribir) for ruta in rutas]
+        return [tarea.result() for tarea in tareas]
+
+
+def compilar_en_serie(rutas, optimizar=False, escribir=True):
+    """Compila 'rutas' una tras otra en este proceso."""
+    _iniciar_worker()
+    return [compilar_archivo(ruta, optimizar, escribir) for ruta in rutas]
+
+
+def resumen(resultados, segundos, procesos):
+    """Texto con el total de archivos, errores, cuádruplos y tiempos."""
+    correctos = sum(1 for r in resultados if r.exito)
+    cuadruplos = sum(r.cuadruplos for r in resultados)
+    trabajo = sum(r.segundos for r in resultados)
+    return (f"--- Resumen del Lote ---\n"
+            f"  Archivos: {len(resultados)}  Correctos: {correctos}  "
+            f"Con errores: {len(resultados) - correctos}\n"
+            f"  Cuádruplos generados: {cuadruplos}\n"
+            f"  Procesos: {procesos}  Tiempo total: {segundos:.3f} s  "
+            f"(suma por archivo: {trabajo:.3f} s)\n"
+            f"------------------------")
+
+
+if __name__ == '__main__':
+    argumentos = argparse.ArgumentParser(description="Compila muchos archivos .pat en paralelo.")
+    argumentos.add_argument('objetivo', help="carpeta o patrón glob (ej. 'programas/*.pat')")
+    argumentos.add_argument('-j', type=int, default=os.cpu_count(), dest='procesos')
+    argumentos.add_argument('-O', action='store_true', dest='optimizar')
+    argumentos.add_argument('--sin-objeto', action='store_true')
+    argumentos.add_argument('--comparar-serial', action='store_true')
+    opciones = argumentos.parse_args()
+
+    rutas = buscar_archivos(opciones.objetivo)
+    if not rutas:
+        print(f"No se encontraron archivos .pat en '{opciones.objetivo}'.")
+        sys.exit(1)
+
+    inicio = time.perf_counter()
+    resultados = compilar_en_paralelo(rutas, opciones.procesos, opciones.optimizar,
+                                      not opciones.sin_objeto)
+    paralelo = time.perf_counter() - inicio
+
+    print("--- Resultados por Archivo ---")
+    for resultado in resultados:
+        print(resultado)
+    print(resumen(resultados, paralelo, opciones.procesos))
+
+    if opciones.comparar_serial:
+        inicio = time.perf_counter()
+        compilar_en_serie(rutas, opciones.optimizar, escribir=False)
+        serie = time.perf_counter() - inicio
+        print(f"Serie: {serie:.3f} s  Paralelo: {paralelo:.3f} s  "
+              f"Aceleración: {serie / paralelo:.2f}x")
+
+    if not all(r.exito for r in resultados):
+        sys.exit(1)
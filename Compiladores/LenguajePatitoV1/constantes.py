@@ -0,0 +1,82 @@
+# -----------------------------------------------------------------
+# constantes.py
+#
+# Tabla de Constantes.
+# Cada constante distinta (valor + tipo) recibe UNA sola dirección
+# virtual, sin importar cuántas veces aparezca en el programa.
+# El código generado y la Máquina Virtual comparten esa única copia.
+# -----------------------------------------------------------------
+from memoria import AsignadorMemoria
+
+class TablaConstantes:
+    def __init__(self, memoria=None):
+        """
+        Inicializa la tabla vacía.
+        Estructura: {(valor, tipo): dirección} y su inverso
+                    {dirección: valor}
+        """
+        self.direcciones = {}
+        self.valores = {}
+        self.memoria = memoria if memoria is not None else AsignadorMemoria()
+
+    def obtener_direccion(self, valor, tipo):
+        """
+        Devuelve la dirección de la constante, reservándola solo la
+        primera vez que aparece. El tipo es parte de la llave para que
+        10 (entero) y 10.0 (flotante) no se confundan.
+        """
+        llave = (valor, tipo)
+        direccion = self.direcciones.get(llave)
+        if direccion is None:
+            direccion = self.memoria.asignar('constante', tipo)
+            self.direcciones[llave] = direccion
+            self.valores[direccion] = valor
+        return direccion
+
+    def __len__(self):
+        return len(self.valores)
+
+    def __str__(self):
+        """Representación en string para depuración."""
+        output = "--- Tabla de Constantes ---\n"
+        for (valor, tipo), direccion in self.direcciones.items():
+            output += f"{direccion}: {valor!r} ({tipo})\n"
+        output += "---------------------------"
+        return output
+
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    from memoria import BASES, tipo_de
+
+    tabla = TablaConstantes()
+
+    # Una dirección por (valor, tipo): repetir la constante no reserva otra
+    uno = tabla.obtener_direccion(1, 'entero')
+    assert tabla.obtener_direccion(1, 'entero') == uno == BASES[('constante', 'entero')]
+    hola = tabla.obtener_direccion("hola", 'letrero')
+    assert tabla.obtener_direccion("hola", 'letrero') == hola
+    assert tabla.obtener_direccion("Hola", 'letrero') != hola
+
+    # 1 y 1.0 son iguales en Python, pero no son la misma constante
+    uno_flotante = tabla.obtener_direccion(1.0, 'flotante')
+    assert uno_flotante != uno
+    assert (tipo_de(uno), tipo_de(uno_flotante), tipo_de(hola)) == ('entero', 'flotante', 'letrero')
+    assert isinstance(tabla.valores[uno], int) and isinstance(tabla.valores[uno_flotante], float)
+
+    # Cada tipo llena su segmento en orden, y 'valores' es el inverso de 'direcciones'
+    assert tabla.obtener_direccion(2, 'entero') == uno + 1
+    assert tabla.obtener_direccion(2.5, 'flotante') == uno_flotante + 1
+    assert len(tabla) == 6
+    assert {direccion: valor for (valor, _), direccion in tabla.direcciones.items()} == tabla.valores
+
+    # Con el AsignadorMemoria del compilador, las direcciones siguen su cuenta
+    otra = TablaConstantes(tabla.memoria)
+    assert otra.obtener_direccion(3, 'entero') == uno + 2
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de constantes.py: OK")
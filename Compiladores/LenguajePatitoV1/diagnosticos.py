@@ -0,0 +1,121 @@
+# -----------------------------------------------------------------
+# diagnosticos.py
+#
+# Errores de una compilación (léxicos, sintácticos y semánticos).
+# La compilación NO se detiene en el primero: el lexer, el parser
+# (con producciones 'error' en estatutos y declaraciones) y los
+# Puntos Neurálgicos van juntando Diagnosticos, y al final se arma
+# un reporte con todos.
+# -----------------------------------------------------------------
+from mapa_fuente import SIN_SPAN
+
+LEXICO = 'léxico'
+SINTACTICO = 'sintáctico'
+SEMANTICO = 'semántico'
+CLASES = (LEXICO, SINTACTICO, SEMANTICO)
+
+
+class Diagnostico(str):
+    """
+    Un mensaje de error con su clase (LEXICO, SINTACTICO o SEMANTICO) y
+    su span en el fuente. Es un str (el mensaje completo), así que quien
+    solo imprime los errores no necesita saber de esta clase.
+    """
+    def __new__(cls, mensaje, clase, span=SIN_SPAN):
+        diagnostico = super().__new__(cls, mensaje)
+        diagnostico.clase = clase
+        diagnostico.span = span
+        return diagnostico
+
+    def __getnewargs__(self):
+        # Para pickle (compilar_lote.py los manda entre procesos)
+        return str(self), self.clase, self.span
+
+
+def reporte_errores(diagnosticos, mapa_fuente=None):
+    """
+    Reporte de todos los diagnósticos, ordenados por su posición en el
+    fuente (los que no tienen span van al final), con el total por clase.
+    """
+    # Un mensaje suelto (str) no tiene clase ni span
+    def inicio(diagnostico):
+        return getattr(diagnostico, 'span', SIN_SPAN)[0]
+
+    ordenados = sorted(diagnosticos, key=lambda d: (inicio(d) < 0, inicio(d)))
+    output = f"--- Reporte de Errores ({len(diagnosticos)}) ---\n"
+    for diagnostico in ordenados:
+        clase = getattr(diagnostico, 'clase', '?')
+        span = getattr(diagnostico, 'span', SIN_SPAN)
+        if mapa_fuente is not None and span[0] >= 0:
+            linea, columna = mapa_fuente.linea_columna(span[0])
+            posicion = f"{linea}:{columna}"
+        else:
+            posicion = "?"
+        output += f"  {posicion:>8}  [{clase}] {diagnostico}\n"
+    totales = [f"{clase}: {sum(getattr(d, 'clase', None) == clase for d in diagnosticos)}" for clase in CLASES]
+    output += "  " + "  ".join(totales) + "\n"
+    output += "-----------------------------"
+    return output
+
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    import pickle
+    from parser import compilar
+    from escaner import Escaner
+
+    texto = ("programa p;\n"
+             "vars x, x : entero;\n"
+             "  y : flotante;\n"
+             "  entero w;\n"              # Declaración mal escrita
+             "inicio {\n"
+             "  x = a + 1;\n"             # 'a' no declarada
+             "  y = b * (c + 2);\n"       # 'b' y 'c': sin errores en cascada
+             "  x = 1 +;\n"               # Estatuto mal escrito
+             "  x = y;\n"                 # Tipos
+             "  z = 3 $ 4;\n"             # Carácter ilegal
+             "  x = 2;\n"
+             "} fin")
+    esperado = [
+        (SEMANTICO, 2, 9), (SINTACTICO, 4, 11), (SEMANTICO, 6, 7), (SEMANTICO, 7, 7),
+        (SEMANTICO, 7, 12), (SINTACTICO, 8, 10), (SEMANTICO, 9, 3), (LEXICO, 10, 9),
+        (SINTACTICO, 10, 11),
+    ]
+    for resultado in (compilar(texto), compilar(texto, lexer_base=Escaner())):
+        assert not resultado.exito
+        obtenido = [(d.clase, *resultado.mapa_fuente.linea_columna(d.span[0])) for d in resultado.errores]
+        assert sorted(obtenido, key=lambda e: e[1:]) == esperado, obtenido
+
+        reporte = resultado.reporte_errores()
+        assert "léxico: 1  sintáctico: 3  semántico: 5" in reporte
+        assert reporte.index("'a' no está declarada") < reporte.index("Carácter ilegal")
+
+        # Siguen siendo str y sobreviven a pickle (compilar_lote.py)
+        copia = pickle.loads(pickle.dumps(resultado.errores))
+        assert copia == resultado.errores
+        assert [(d.clase, d.span) for d in copia] == [(d.clase, d.span) for d in resultado.errores]
+
+    # Un programa correcto no tiene diagnósticos
+    assert compilar(texto.split("vars")[0] + "inicio { } fin").exito
+
+    # Función repetida: un solo error; su cuerpo se revisa aparte y sus
+    # parámetros y variables no caen en la tabla global
+    texto = ("programa p;\n"
+             "vars x : entero;\n"
+             "nula f(a : entero) { { x = a; } };\n"
+             "nula f(b : flotante) { vars x : flotante; { x = b; } };\n"
+             "nula g(c : entero) { { x = c; } };\n"
+             "inicio { f(1); g(2); } fin")
+    for resultado in (compilar(texto), compilar(texto, lexer_base=Escaner())):
+        assert resultado.errores == ["Error en línea 4, columna 6: Error Semántico: La función 'f' ya está declarada."], resultado.errores
+        funciones = resultado.dir_funciones.functions
+        assert list(funciones) == ['global', 'f', 'g']
+        assert list(funciones['global']['tabla_vars'].variables) == ['x']
+        assert funciones['f']['parametros'] == ['entero'] and funciones['g']['parametros'] == ['entero']
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de diagnosticos.py: OK")
@@ -5,31 +5,65 @@
 # - VarTable (Tabla de Variables)
 # - FuncDirectory (Directorio de Funciones)
 # -----------------------------------------------------------------
+from memoria import AsignadorMemoria, SEGMENTOS_MARCO
 
-# --- 1. Tabla de Variables (VarTable) ---
+# Ámbito donde se revisa el cuerpo de una función que no se pudo
+# declarar (ej. repetida); no es un ID válido, así que nadie la llama
+DESCARTADA = '<descartada>'
+
+# --- 1. Símbolo (registro de una variable) ---
+class Simbolo:
+    """
+    Lo que se sabe de una variable declarada: su tipo, su dirección
+    virtual, su clase ('variable' o 'parametro') y la línea donde se
+    declaró. Con __slots__: uno por variable, sin __dict__.
+    """
+    __slots__ = ('tipo', 'direccion', 'clase', 'linea')
+
+    def __init__(self, tipo, direccion, clase='variable', linea=0):
+        self.tipo = tipo
+        self.direccion = direccion
+        self.clase = clase
+        self.linea = linea
+
+    def __repr__(self):
+        return f"Simbolo({self.tipo}, {self.direccion}, {self.clase}, línea {self.linea})"
+
+
+# --- 2. Tabla de Variables (VarTable) ---
 class VarTable:
     """
-    Representa una tabla de variables para un ámbito (scope) específico,
-    ya sea global o local de una función.
+    Representa una tabla de variables para un ámbito (scope) específico:
+    el global o el de una función. Cada tabla apunta a la de su ámbito
+    'padre' (la de una función, a la global), y un nombre se resuelve
+    subiendo por esa cadena.
     """
-    def __init__(self):
+    def __init__(self, padre=None):
         """
         Inicializa la tabla. El diccionario 'variables' almacenará
-        la información de cada variable.
-        Estructura: {'nombre_var': {'tipo': 'entero' | 'flotante', ...}}
+        el Simbolo de cada variable declarada en ESTE ámbito.
+        Estructura: {'nombre_var': Simbolo(tipo, direccion, clase, linea)}
         """
         self.variables = {}
+        self.padre = padre
+        # {símbolo: Simbolo} ya resueltos desde este ámbito (por la cadena),
+        # con el número de símbolo del lexer (ver identificadores.py).
+        # Solo se guardan los encontrados. Se vacía al declarar aquí; los
+        # ámbitos hijos no se revisan porque en Patito las declaraciones
+        # van antes que los estatutos que las usan.
+        self.resueltos = {}
 
-    def add_var(self, name, type):
+    def add_var(self, name, type, address, clase='variable', linea=0):
         """
-        Añade una variable a la tabla.
+        Añade una variable (con su dirección virtual) a la tabla.
         Lanza una excepción si la variable ya está declarada.
         """
         if name in self.variables:
             # Error: Variable doblemente declarada en el mismo ámbito
             raise Exception(f"Error Semántico: La variable '{name}' ya está declarada en este ámbito.")
         else:
-            self.variables[name] = {'tipo': type}
+            self.variables[name] = Simbolo(type, address, clase, linea)
+            self.resueltos.clear()
             # print(f"Variable añadida a VarTable: {name} (Tipo: {type})") # Para depuración
 
     def lookup_var(self, name):
@@ -37,33 +71,72 @@ class VarTable:
         Busca una variable en esta tabla específica.
         Devuelve el tipo si la encuentra, o None si no.
         """
-        if name in self.variables:
-            return self.variables[name]['tipo']
-        else:
-            return None
+        simbolo = self.variables.get(name)
+        return simbolo.tipo if simbolo is not None else None
+
+    def lookup_entry(self, name):
+        """
+        Busca una variable en esta tabla específica.
+        Devuelve su Simbolo o None.
+        """
+        return self.variables.get(name)
+
+    def resolver(self, name, id_simbolo=None):
+        """
+        Busca una variable en este ámbito y, si no está, en los de
+        arriba. Devuelve el Simbolo del ámbito más cercano, o None.
+        Con el número de símbolo del nombre ('id_simbolo'), la primera
+        búsqueda sube por la cadena y las siguientes son una sola
+        consulta a 'resueltos'.
+        """
+        if id_simbolo is not None:
+            simbolo = self.resueltos.get(id_simbolo)
+            if simbolo is not None:
+                return simbolo
+        tabla = self
+        while tabla is not None:
+            simbolo = tabla.variables.get(name)
+            if simbolo is not None:
+                if id_simbolo is not None:
+                    self.resueltos[id_simbolo] = simbolo
+                return simbolo
+            tabla = tabla.padre
+        return None
 
     def __str__(self):
         """Representación en string para depuración."""
         return str(self.variables)
 
 
-# --- 2. Directorio de Funciones (FuncDirectory) ---
+# --- 3. Directorio de Funciones (FuncDirectory) ---
 class FuncDirectory:
     """
     Representa el directorio principal de funciones del programa.
     Contiene un diccionario de todas las funciones, incluyendo un
     ámbito 'global' especial.
     """
-    def __init__(self):
+    def __init__(self, memoria=None):
         """
         Inicializa el directorio.
+        'memoria' es el AsignadorMemoria que reparte las direcciones
+        virtuales de las variables al declararlas.
         Estructura: {'nombre_func': {'tipo_retorno': 'nula' | 'entero' | ...,
-                                    'tabla_vars': VarTable(),
-                                    'parametros': ['entero', 'flotante', ...]
+                                    'tabla_vars': VarTable(padre=la global),
+                                    'parametros': ['entero', 'flotante', ...],
+                                    'numero': posición en el directorio,
+                                    'inicio': su primer cuádruplo,
+                                    'recursos': [casillas por segmento]
                                    }
                     }
+        'numero' es el que usan los cuádruplos ERA y GOSUB. 'recursos'
+        sigue el orden de SEGMENTOS_MARCO (locales y temporales por
+        tipo): con él la MV arma el registro de activación de la
+        función. En el 'global', 'inicio' es el del cuerpo principal.
         """
         self.functions = {}
+        # Entrada del ámbito DESCARTADA (ver descartar_func); no está en 'functions'
+        self.descartada = None
+        self.memoria = memoria if memoria is not None else AsignadorMemoria()
         # Pre-cargar el ámbito 'global'
         self.add_func('global', 'nula')
 
@@ -76,31 +149,82 @@ class FuncDirectory:
             # Error: Función doblemente declarada
             raise Exception(f"Error Semántico: La función '{name}' ya está declarada.")
         else:
+            globales = self.functions['global']['tabla_vars'] if self.functions else None
             self.functions[name] = {
                 'tipo_retorno': return_type,
-                'tabla_vars': VarTable(),
-                'parametros': [] # Lista ordenada de tipos de parámetros
+                'tabla_vars': VarTable(padre=globales),
+                'parametros': [], # Lista ordenada de tipos de parámetros
+                'numero': len(self.functions),
+                'inicio': None,   # Se conocen al generar su código
+                'recursos': None,
             }
+            # Las direcciones locales y temporales son relativas a cada función
+            self.memoria.reiniciar_locales()
             # print(f"Función añadida a Directorio: {name} (Tipo: {return_type})") # Para depuración
             
+    def descartar_func(self, return_type):
+        """
+        Abre el ámbito DESCARTADA para el cuerpo de una función que
+        add_func rechazó: sus parámetros y variables se declaran y se
+        revisan ahí (hijo del global, como cualquier función), pero no
+        quedan en el directorio ni en la tabla global.
+        """
+        self.descartada = {
+            'tipo_retorno': return_type,
+            'tabla_vars': VarTable(padre=self.functions['global']['tabla_vars']),
+            'parametros': [],
+            'numero': None,
+            'inicio': None,
+            'recursos': None,
+        }
+        self.memoria.reiniciar_locales()
+
+    def _entrada(self, func_name):
+        if func_name == DESCARTADA and self.descartada is not None:
+            return self.descartada
+        return self.functions[func_name]
+
     def lookup_func(self, name):
         """
         Verifica si una función existe en el directorio.
         Lanza una excepción si no existe.
         """
-        if name not in self.functions:
+        if name not in self.functions and not (name == DESCARTADA and self.descartada is not None):
             raise Exception(f"Error Semántico: La función '{name}' no está declarada.")
 
-    def add_var_to_func(self, func_name, var_name, var_type):
+    def registrar_inicio(self, func_name, cuadruplo):
+        """Guarda el número del primer cuádruplo de la función."""
+        self._entrada(func_name)['inicio'] = cuadruplo
+
+    def registrar_recursos(self, func_name):
+        """
+        Guarda cuántas locales y temporales de cada tipo usó la función.
+        Se llama al terminar su código, antes de reiniciar los contadores.
+        """
+        self._entrada(func_name)['recursos'] = self.memoria.tamano_marco()
+
+    def ambito(self, func_name):
+        """La VarTable del ámbito de la función."""
+        return self._entrada(func_name)['tabla_vars']
+
+    def add_var_to_func(self, func_name, var_name, var_type, clase='variable', linea=0):
         """
-        Añade una variable a la tabla de variables de una función específica.
+        Añade una variable al ámbito de una función específica.
+        La variable recibe una dirección 'global' o 'local' según el ámbito.
+        'clase' es 'variable' o 'parametro'; 'linea', la de su declaración.
         """
         # Primero nos aseguramos que la función exista
         self.lookup_func(func_name)
         
-        # Llama al método add_var de la VarTable de esa función
+        # Llama al método add_var de la VarTable de ese ámbito
         try:
-            self.functions[func_name]['tabla_vars'].add_var(var_name, var_type)
+            tabla = self.ambito(func_name)
+            if var_name not in tabla.variables:
+                ambito = 'global' if func_name == 'global' else 'local'
+                direccion = self.memoria.asignar(ambito, var_type)
+            else:
+                direccion = None # add_var reportará la doble declaración
+            tabla.add_var(var_name, var_type, direccion, clase, linea)
         except Exception as e:
             # Re-lanza la excepción con más contexto
             raise Exception(f"Error en función '{func_name}': {e}")
@@ -110,29 +234,27 @@ class FuncDirectory:
         Añade el TIPO de un parámetro a la lista de parámetros de la función.
         """
         self.lookup_func(func_name)
-        self.functions[func_name]['parametros'].append(param_type)
+        self._entrada(func_name)['parametros'].append(param_type)
+
+    def lookup_var_entry_in_func(self, func_name, var_name, id_simbolo=None):
+        """
+        Igual que lookup_var_in_func, pero devuelve el Simbolo completo
+        de la variable en lugar de solo el tipo. 'id_simbolo' es el
+        número de símbolo del nombre, si se tiene (ver VarTable.resolver).
+        """
+        simbolo = self.ambito(func_name).resolver(var_name, id_simbolo)
+        if simbolo is not None:
+            return simbolo
+
+        raise Exception(f"Error Semántico: La variable '{var_name}' no está declarada.")
 
     def lookup_var_in_func(self, func_name, var_name):
         """
         Busca una variable y devuelve su tipo.
-        Busca primero en el ámbito local (func_name) y, si no la
-        encuentra, busca en el ámbito 'global'.
+        Busca primero en el ámbito de func_name y después en el 'global'.
         Lanza una excepción si no la encuentra en ninguno.
         """
-        # 1. Buscar en el ámbito local (la función actual)
-        tipo_local = self.functions[func_name]['tabla_vars'].lookup_var(var_name)
-        
-        if tipo_local:
-            return tipo_local
-        
-        # 2. Si no, buscar en el ámbito 'global'
-        tipo_global = self.functions['global']['tabla_vars'].lookup_var(var_name)
-        
-        if tipo_global:
-            return tipo_global
-            
-        # 3. Si no está en ningún lado, es un error
-        raise Exception(f"Error Semántico: La variable '{var_name}' no está declarada.")
+        return self.lookup_var_entry_in_func(func_name, var_name).tipo
         
     def __str__(self):
         """Representación en string para depuración."""
@@ -140,6 +262,70 @@ class FuncDirectory:
         for name, data in self.functions.items():
             output += f"Función: {name} (Retorno: {data['tipo_retorno']})\n"
             output += f"  Params: {data['parametros']}\n"
+            if data['recursos'] is not None:
+                recursos = ', '.join(f"{ambito} {tipo} {n}" for (ambito, tipo), n
+                                     in zip(SEGMENTOS_MARCO, data['recursos']) if n)
+                output += f"  Inicio: cuádruplo {data['inicio']}  Recursos: [{recursos}]\n"
             output += f"  Vars: {str(data['tabla_vars'])}\n"
         output += "---------------------------------"
-        return output
\ No newline at end of file
+        return output
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    import pickle
+    from parser import Compilador
+
+    directorio = FuncDirectory()
+    directorio.add_var_to_func('global', 'x', 'entero', linea=2)
+    directorio.add_var_to_func('global', 'y', 'flotante', linea=2)
+    directorio.add_func('f', 'nula')
+    directorio.add_var_to_func('f', 'x', 'flotante', 'parametro', 5)
+
+    # El ámbito más cercano gana; lo que no está, se busca arriba
+    x_global = directorio.lookup_var_entry_in_func('global', 'x')
+    x_local = directorio.lookup_var_entry_in_func('f', 'x', 0)
+    assert (x_global.tipo, x_global.clase, x_global.linea) == ('entero', 'variable', 2)
+    assert (x_local.tipo, x_local.clase, x_local.linea) == ('flotante', 'parametro', 5)
+    assert directorio.lookup_var_in_func('f', 'y') == 'flotante'
+    assert directorio.lookup_var_entry_in_func('f', 'y', 1) is directorio.lookup_var_entry_in_func('global', 'y')
+
+    # La resolución se recuerda por ámbito, con el número de símbolo
+    tabla_f = directorio.functions['f']['tabla_vars']
+    assert set(tabla_f.resueltos) == {0, 1}
+    assert directorio.lookup_var_entry_in_func('f', 'y', 1) is tabla_f.resueltos[1]
+
+    # Declarar en un ámbito vacía lo que ya había resuelto
+    directorio.add_var_to_func('f', 'y', 'entero', linea=6)
+    assert directorio.lookup_var_entry_in_func('f', 'y', 1).tipo == 'entero'
+
+    for nombre, esperado in (('z', "'z' no está declarada"), ('x', "'x' ya está declarada")):
+        try:
+            if nombre == 'z':
+                directorio.lookup_var_in_func('f', 'z')
+            else:
+                directorio.add_var_to_func('global', 'x', 'entero')
+            assert False, nombre
+        except Exception as e:
+            assert esperado in str(e), e
+
+    # Desde el parser: clase y línea de cada declaración
+    compilador = Compilador()
+    resultado = compilador.compilar("programa p;\nvars a : entero;\n"
+                         "nula g(b : flotante) {\n  vars c : entero;\n  { c = a; }\n};\n"
+                         "inicio { a = 1; } fin")
+    assert resultado.exito, resultado.errores
+    tabla_g = resultado.dir_funciones.functions['g']['tabla_vars']
+    b, c = tabla_g.variables['b'], tabla_g.variables['c']
+    assert (b.tipo, b.clase, b.linea) == ('flotante', 'parametro', 3)
+    assert (c.tipo, c.clase, c.linea) == ('entero', 'variable', 4)
+    a = compilador.identificadores.simbolos['a']
+    assert tabla_g.resueltos[a] is resultado.dir_funciones.functions['global']['tabla_vars'].variables['a']
+    copia = pickle.loads(pickle.dumps(resultado.dir_funciones))
+    assert str(copia) == str(resultado.dir_funciones)
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de directory.py: OK")
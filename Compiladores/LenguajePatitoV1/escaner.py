@@ -0,0 +1,255 @@
+# -----------------------------------------------------------------
+# escaner.py
+#
+# Escáner escrito a mano, alternativa rápida al lexer de PLY.
+# Todo el léxico de Patito es UNA sola expresión regular con grupos
+# nombrados; finditer() recorre el texto y 'lastgroup' dice qué se
+# encontró, sin llamar una función t_ por cada token.
+#
+# Cumple el mismo contrato que lexer.py: tokens con los mismos
+# 'type', 'value', 'lineno' y 'lexpos', y los mismos errores léxicos
+# (se imprimen o se guardan en 'errores'). Se usa igual que el lexer
+# de PLY: input(), token(), clone() y el atributo lineno.
+#
+# Con input_archivo() tokeniza un archivo (de texto, binario o un
+# mmap) por ventanas de tamaño fijo, sin leerlo completo: la memoria
+# no crece con el tamaño del archivo.
+#
+# Cada token lleva además 'lexfin' (dónde termina en el fuente) para
+# armar su span (ver mapa_fuente.py), y cada ID su 'simbolo' de la
+# TablaIdentificadores (ver identificadores.py), como el lexer de PLY.
+# -----------------------------------------------------------------
+import codecs
+import re
+
+from lexer import reserved
+from diagnosticos import Diagnostico, LEXICO
+from identificadores import TablaIdentificadores
+
+# Los espacios antes de cada token se consumen en el mismo match (no
+# generan uno propio). Van primero los tokens más frecuentes. El orden
+# importa: el comentario antes que DIV, flotante antes que entero, y
+# los operadores de 2 caracteres antes que los de 1. ERROR atrapa
+# cualquier otro carácter y '\Z' los espacios al final del texto.
+PATRON = re.compile(r'''[ \t]*(?:
+    (?P<ID>[A-Za-z_][A-Za-z_0-9]*)
+  | (?P<COMENTARIO>//[^\n]*)
+  | (?P<OPERADOR>>=|<=|==|!=|[-+*/=><(){},;:])
+  | (?P<CTE_FLOT>\d+\.\d+)
+  | (?P<CTE_ENT>\d+)
+  | (?P<NUEVA_LINEA>\n+)
+  | (?P<LETRERO>"[^"\n]*")
+  | (?P<ERROR>.)
+  | \Z)''', re.VERBOSE)
+
+# Operador -> tipo de token
+OPERADORES = {
+    '+': 'MAS', '-': 'MENOS', '*': 'POR', '/': 'DIV', '=': 'ASIG',
+    '>=': 'MAYORIG', '<=': 'MENORIG', '==': 'IGUALDAD', '!=': 'DIF',
+    '>': 'MAYOR', '<': 'MENOR', '(': 'LPAREN', ')': 'RPAREN',
+    '{': 'LBRACE', '}': 'RBRACE', ',': 'COMA', ';': 'PTOCOMA', ':': 'DOSPTOS',
+}
+
+
+# Caracteres (o bytes) que se leen por ventana en input_archivo()
+TAM_VENTANA = 64 * 1024
+
+
+class Token:
+    """Token con los mismos campos que el LexToken de PLY, más 'lexfin' y 'simbolo'."""
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexfin', 'simbolo', 'lexer')
+
+    def __init__(self, tipo, valor, lineno, lexpos, lexfin, simbolo=None):
+        self.type = tipo
+        self.value = valor
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.lexfin = lexfin
+        self.simbolo = simbolo  # Solo los ID
+
+    def __repr__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+class Escaner:
+    def __init__(self):
+        self.lineno = 1
+        self.lexpos = 0
+        self.lexdata = ''
+        self.errores = None  # Si es una lista, los errores léxicos se guardan ahí
+        self.identificadores = TablaIdentificadores()
+        self._tokens = iter(())
+
+    def clone(self):
+        """Un escáner nuevo sin estado (mismo uso que lexer.clone() de PLY)."""
+        return Escaner()
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self._tokens = self._escanear(data)
+
+    def input_archivo(self, archivo, tam_ventana=TAM_VENTANA, mapa_fuente=None):
+        """
+        Tokeniza 'archivo' (cualquier objeto con read(n) que devuelva
+        str o bytes UTF-8, ej. un archivo abierto o un mmap) leyendo
+        ventanas de 'tam_ventana'. lexpos sigue contando desde el
+        inicio del archivo.
+        Si se da un MapaFuente, se le agregan las líneas de cada ventana
+        conforme se leen.
+        """
+        self.lexdata = ''
+        self.lexpos = 0
+        self._tokens = self._escanear_flujo(archivo, tam_ventana, mapa_fuente)
+
+    def token(self):
+        """Devuelve el siguiente token o None al final de la entrada."""
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+    def _error(self, caracter, lexpos):
+        mensaje = f"Error Léxico: Carácter ilegal '{caracter}' en línea {self.lineno}"
+        if self.errores is None:
+            print(mensaje)
+        else:
+            self.errores.append(Diagnostico(mensaje, LEXICO, (lexpos, lexpos + len(caracter))))
+
+    def _escanear(self, data):
+        yield from self._escanear_rango(data, len(data), 0)
+        self.lexpos = len(data)
+
+    def _escanear_flujo(self, archivo, tam_ventana, mapa_fuente):
+        """
+        Ningún token cruza un salto de línea (los letreros y los
+        comentarios terminan en él), así que de cada ventana se
+        tokeniza solo hasta su último '\\n' y el resto se pega al inicio
+        de la siguiente. Al final del archivo se tokeniza todo.
+        """
+        decodificador = None
+        pendiente = ''
+        base = 0  # Posición en el archivo de pendiente[0]
+        while True:
+            bloque = archivo.read(tam_ventana)
+            fin = not bloque
+            if not isinstance(bloque, str):
+                if decodificador is None:
+                    decodificador = codecs.getincrementaldecoder('utf-8')()
+                bloque = decodificador.decode(bloque, final=fin)
+            if mapa_fuente is not None:
+                mapa_fuente.agregar(bloque, base + len(pendiente))
+            texto = pendiente + bloque
+            corte = len(texto) if fin else texto.rfind('\n') + 1
+            yield from self._escanear_rango(texto, corte, base)
+            pendiente = texto[corte:]
+            base += corte
+            if fin:
+                break
+        self.lexpos = base
+
+    def _escanear_rango(self, data, fin, base):
+        """Tokens de data[:fin]; 'base' se suma a lexpos."""
+        operadores = OPERADORES
+        reservadas = reserved
+        interna = self.identificadores.interna
+        lineno = self.lineno  # Copia local; self.lineno se actualiza en cada salto de línea
+        for m in PATRON.finditer(data, 0, fin):
+            clase = m.lastgroup
+            if clase == 'ID':
+                texto = m.group(clase)
+                reservada = reservadas.get(texto)
+                if reservada is not None:
+                    yield Token(reservada, texto, lineno, base + m.start(clase), base + m.end(clase))
+                else:
+                    simbolo, nombre = interna(texto)
+                    yield Token('ID', nombre, lineno, base + m.start(clase), base + m.end(clase), simbolo)
+            elif clase == 'OPERADOR':
+                texto = m.group(clase)
+                yield Token(operadores[texto], texto, lineno, base + m.start(clase), base + m.end(clase))
+            elif clase == 'NUEVA_LINEA':
+                lineno += m.end() - m.start(clase)
+                self.lineno = lineno
+            elif clase == 'CTE_ENT':
+                yield Token('CTE_ENT', int(m.group(clase)), lineno, base + m.start(clase), base + m.end(clase))
+            elif clase == 'CTE_FLOT':
+                yield Token('CTE_FLOT', float(m.group(clase)), lineno, base + m.start(clase), base + m.end(clase))
+            elif clase == 'LETRERO':
+                yield Token('LETRERO', m.group(clase), lineno, base + m.start(clase), base + m.end(clase))
+            elif clase == 'ERROR':
+                self.lexpos = base + m.start(clase)
+                self._error(m.group(clase), self.lexpos)
+            # COMENTARIO y los espacios al final (clase None) no generan nada
+
+
+# -----------------------------------------------------------
+# PRUEBAS (mismos tokens que el lexer de PLY)
+# -----------------------------------------------------------
+def tokens_de(lexer_base, data):
+    """Lista de (type, value, lineno, lexpos) y errores al tokenizar 'data'."""
+    lexer = lexer_base.clone()
+    lexer.lineno = 1
+    lexer.errores = []
+    lexer.identificadores = TablaIdentificadores()
+    lexer.input(data)
+    salida = []
+    while True:
+        tok = lexer.token()
+        if tok is None:
+            return salida, lexer.errores
+        salida.append((tok.type, tok.value, tok.lineno, tok.lexpos))
+
+def run_tests():
+    import glob
+    from lexer import lexer
+
+    casos = [open(ruta).read() for ruta in sorted(glob.glob('*.pat'))]
+    casos += [
+        'x=1.5;y>=2<=3==4!=5>6<7 // comentario >= "no"\n"hola mundo" letrero',
+        'programa p; vars a_1, _b : flotante;\n\n\ninicio { escribe("a", a_1); } fin',
+        '3. @ "sin cerrar\n 12abc $',   # Errores léxicos y tokens pegados
+        '',
+    ]
+    for data in casos:
+        assert tokens_de(Escaner(), data) == tokens_de(lexer, data), data[:40]
+
+    # Por ventanas: tokens partidos entre ventanas, letreros, comentarios,
+    # líneas más largas que la ventana y UTF-8 partido a la mitad
+    import io
+    import mmap
+    import tempfile
+    casos.append('escribe("año ñandú"); // ¿comentario?\n' * 20 + 'x = 123456.789;' * 30)
+    for data in casos:
+        esperado = tokens_de(Escaner(), data)
+        for tam in (1, 2, 3, 7, 64, 4096):
+            for archivo in (io.StringIO(data), io.BytesIO(data.encode('utf-8'))):
+                escaner = Escaner()
+                escaner.errores = []
+                escaner.input_archivo(archivo, tam)
+                salida = [(t.type, t.value, t.lineno, t.lexpos) for t in escaner]
+                assert (salida, escaner.errores) == esperado, (data[:40], tam)
+
+    with tempfile.TemporaryFile() as f:
+        f.write(casos[-1].encode('utf-8'))
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            escaner = Escaner()
+            escaner.errores = []
+            escaner.input_archivo(mapa, 100)
+            salida = [(t.type, t.value, t.lineno, t.lexpos) for t in escaner]
+            assert (salida, escaner.errores) == tokens_de(Escaner(), casos[-1])
+
+    # Se puede usar en lugar del lexer de PLY en el Compilador
+    from parser import Compilador
+    with open('prueba_etapa3.pat') as f:
+        fuente = f.read()
+    con_ply = Compilador().compilar(fuente)
+    con_escaner = Compilador(lexer_base=Escaner()).compilar(fuente)
+    assert con_escaner.exito
+    assert con_escaner.fila_cuadruplos.operadores == con_ply.fila_cuadruplos.operadores
+    assert con_escaner.fila_cuadruplos.resultados == con_ply.fila_cuadruplos.resultados
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de escaner.py: OK")
@@ -0,0 +1,203 @@
+# -----------------------------------------------------------------
+# generador.py
+#
+# Generador de programas Patito sintéticos y VÁLIDOS (léxica,
+# sintáctica y semánticamente) de tamaño configurable, para los
+# benchmarks y las pruebas de escala.
+#
+# Se controla el número de variables globales y de funciones, los
+# estatutos del cuerpo principal y de cada función, la profundidad de
+# las expresiones y la mezcla de estatutos (asigna, si, mientras,
+# escribe, llama). Con la misma semilla sale el mismo programa.
+#
+# Las expresiones respetan el cubo semántico: a una variable entera
+# solo se le asignan expresiones enteras. Las constantes salen de un
+# conjunto acotado para no llenar los segmentos de constantes. Cada
+# función solo llama a las declaradas antes que ella (sin recursión).
+# -----------------------------------------------------------------
+import random
+
+# Mezcla de estatutos por omisión: {estatuto: peso}
+MEZCLA = {'asigna': 5, 'escribe': 2, 'si': 2, 'mientras': 1, 'llama': 1}
+
+OPERADORES_ARITMETICOS = ('+', '-', '*', '/')
+OPERADORES_RELACIONALES = ('>', '<', '==', '!=', '>=', '<=')
+LETREROS = ('"hola"', '"valor:"', '"resultado"', '"fin de ciclo"', '"x = "')
+
+# Máximo de estatutos dentro del cuerpo de un si/mientras
+ESTATUTOS_POR_BLOQUE = 3
+
+
+class GeneradorPatito:
+    def __init__(self, variables=20, funciones=2, estatutos=50, estatutos_funcion=10,
+                 profundidad=3, mezcla=None, anidamiento=2, semilla=0):
+        """
+        'variables'         variables globales (mitad enteras, mitad flotantes)
+        'funciones'         funciones (cada una con 2 parámetros y 3 locales)
+        'estatutos'         estatutos del cuerpo principal
+        'estatutos_funcion' estatutos del cuerpo de cada función
+        'profundidad'       máxima profundidad de las expresiones
+        'mezcla'            {estatuto: peso}, ver MEZCLA
+        'anidamiento'       máximo de si/mientras uno dentro de otro
+        """
+        self.variables = max(variables, 2)
+        self.funciones = funciones
+        self.estatutos = estatutos
+        self.estatutos_funcion = estatutos_funcion
+        self.profundidad = profundidad
+        self.mezcla = dict(mezcla or MEZCLA)
+        self.anidamiento = anidamiento
+        self.aleatorio = random.Random(semilla)
+        self._visibles = {}  # {tipo: [nombres]} del ámbito que se está generando
+        self._llamables = 0  # Funciones que ya se pueden llamar (f0 .. f{n-1})
+
+    # --- Programa ---
+
+    def generar(self):
+        """Devuelve el texto de un programa completo."""
+        enteras = [f"g{i}" for i in range(0, self.variables, 2)]
+        flotantes = [f"g{i}" for i in range(1, self.variables, 2)]
+        partes = [f"programa sintetico;\nvars\n"
+                  f"    {', '.join(enteras)} : entero;\n"
+                  f"    {', '.join(flotantes)} : flotante;\n"]
+
+        for i in range(self.funciones):
+            self._visibles = {'entero': enteras + [f"p{i}_0", f"l{i}_0", f"l{i}_1"],
+                              'flotante': flotantes + [f"p{i}_1", f"l{i}_2"]}
+            self._llamables = i
+            cuerpo = self._estatutos(self.estatutos_funcion, '        ', 0)
+            partes.append(f"nula f{i}(p{i}_0 : entero, p{i}_1 : flotante) {{\n"
+                          f"    vars l{i}_0, l{i}_1 : entero; l{i}_2 : flotante;\n"
+                          f"    {{\n{cuerpo}    }}\n}};\n")
+
+        self._visibles = {'entero': enteras, 'flotante': flotantes}
+        self._llamables = self.funciones
+        partes.append(f"inicio\n{{\n{self._estatutos(self.estatutos, '    ', 0)}}}\nfin\n")
+        return ''.join(partes)
+
+    # --- Estatutos ---
+
+    def _estatutos(self, cuantos, sangria, nivel):
+        return ''.join(self._estatuto(sangria, nivel) for _ in range(cuantos))
+
+    def _estatuto(self, sangria, nivel):
+        tipos = list(self.mezcla)
+        pesos = [self.mezcla[tipo] for tipo in tipos]
+        tipo = self.aleatorio.choices(tipos, pesos)[0]
+        if tipo in ('si', 'mientras') and nivel >= self.anidamiento:
+            tipo = 'asigna'
+        if tipo == 'llama' and not self._llamables:
+            tipo = 'asigna'
+
+        if tipo == 'asigna':
+            tipo_var = self.aleatorio.choice(('entero', 'flotante'))
+            destino = self.aleatorio.choice(self._visibles[tipo_var])
+            return f"{sangria}{destino} = {self._expresion(tipo_var, self.profundidad)};\n"
+        if tipo == 'llama':
+            # f{i}(entero, flotante); al flotante también le sirve una expresión entera
+            funcion = self.aleatorio.randrange(self._llamables)
+            argumentos = (self._expresion('entero', self.profundidad),
+                          self._expresion(self.aleatorio.choice(('entero', 'flotante')), self.profundidad))
+            return f"{sangria}f{funcion}({', '.join(argumentos)});\n"
+        if tipo == 'escribe':
+            elementos = [self._elemento_escribe() for _ in range(self.aleatorio.randint(1, 3))]
+            return f"{sangria}escribe({', '.join(elementos)});\n"
+
+        condicion = self._condicion()
+        bloque = self._bloque(sangria, nivel)
+        if tipo == 'mientras':
+            return f"{sangria}mientras ({condicion}) haz {bloque};\n"
+        if self.aleatorio.random() < 0.5:
+            return f"{sangria}si ({condicion}) {bloque} sino {self._bloque(sangria, nivel)};\n"
+        return f"{sangria}si ({condicion}) {bloque};\n"
+
+    def _bloque(self, sangria, nivel):
+        cuantos = self.aleatorio.randint(1, ESTATUTOS_POR_BLOQUE)
+        return f"{{\n{self._estatutos(cuantos, sangria + '    ', nivel + 1)}{sangria}}}"
+
+    def _elemento_escribe(self):
+        opcion = self.aleatorio.random()
+        if opcion < 0.3:
+            return self.aleatorio.choice(LETREROS)
+        if opcion < 0.35:
+            return 'letrero'
+        return self._expresion(self.aleatorio.choice(('entero', 'flotante')), self.profundidad)
+
+    def _condicion(self):
+        operador = self.aleatorio.choice(OPERADORES_RELACIONALES)
+        izq = self._expresion(self.aleatorio.choice(('entero', 'flotante')), self.profundidad - 1)
+        der = self._expresion(self.aleatorio.choice(('entero', 'flotante')), self.profundidad - 1)
+        return f"{izq} {operador} {der}"
+
+    # --- Expresiones ---
+
+    def _expresion(self, tipo, profundidad):
+        """
+        Expresión aritmética de 'tipo'. Una entera solo tiene operandos
+        enteros; una flotante tiene al menos un operando flotante.
+        """
+        if profundidad <= 0 or self.aleatorio.random() < 0.3:
+            return self._hoja(tipo)
+        operador = self.aleatorio.choice(OPERADORES_ARITMETICOS)
+        tipo_der = tipo if tipo == 'entero' else self.aleatorio.choice(('entero', 'flotante'))
+        izq = self._expresion(tipo, profundidad - 1)
+        der = self._expresion(tipo_der, profundidad - 1)
+        if self.aleatorio.random() < 0.5:
+            return f"({izq} {operador} {der})"
+        return f"{izq} {operador} {der}"
+
+    def _hoja(self, tipo):
+        if self.aleatorio.random() < 0.6:
+            return self.aleatorio.choice(self._visibles[tipo])
+        # Constantes de un conjunto acotado (y nunca 0, por las divisiones)
+        if tipo == 'entero':
+            return str(self.aleatorio.randint(1, 100))
+        return f"{self.aleatorio.randint(1, 200) / 4:.2f}"
+
+
+def generar_programa(**opciones):
+    """Atajo: GeneradorPatito(**opciones).generar()."""
+    return GeneradorPatito(**opciones).generar()
+
+
+# -----------------------------------------------------------
+# PRUEBAS (todo programa generado compila sin errores)
+# -----------------------------------------------------------
+def run_tests():
+    from parser import compilar
+    from escaner import Escaner
+
+    configuraciones = [
+        {},
+        {'variables': 2, 'funciones': 0, 'estatutos': 5, 'profundidad': 0},
+        {'variables': 60, 'funciones': 5, 'estatutos': 200, 'profundidad': 5, 'anidamiento': 3},
+        {'mezcla': {'mientras': 1}, 'estatutos': 20},
+        {'mezcla': {'si': 1, 'escribe': 1}, 'estatutos': 20},
+    ]
+    for semilla in range(3):
+        for opciones in configuraciones:
+            fuente = generar_programa(semilla=semilla, **opciones)
+            for lexer_base in (None, Escaner()):
+                resultado = compilar(fuente, lexer_base=lexer_base)
+                assert resultado.exito, (opciones, semilla, resultado.errores[:3])
+
+    # Misma semilla, mismo programa
+    assert generar_programa(semilla=7) == generar_programa(semilla=7)
+    assert generar_programa(semilla=7) != generar_programa(semilla=8)
+
+    # La mezcla se respeta
+    solo_ciclos = generar_programa(mezcla={'mientras': 1}, estatutos=10, anidamiento=0, funciones=0)
+    assert solo_ciclos.count('mientras') == 0  # Sin anidamiento se vuelven asignaciones
+    solo_ciclos = generar_programa(mezcla={'mientras': 1}, estatutos=10, anidamiento=1, funciones=0)
+    assert solo_ciclos.count('mientras') == 10 and 'si (' not in solo_ciclos
+    llamadas = generar_programa(mezcla={'llama': 1}, estatutos=10, funciones=3, semilla=1)
+    assert llamadas.count('f0(') > 1 and 'f2(' in llamadas.split('inicio')[1]
+    assert 'f2(' not in llamadas.split('nula f2')[1].split('inicio')[0]
+
+    # El tamaño crece con los parámetros
+    assert len(generar_programa(estatutos=400)) > 4 * len(generar_programa(estatutos=50))
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de generador.py: OK")
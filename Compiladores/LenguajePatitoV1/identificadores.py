@@ -0,0 +1,85 @@
+# -----------------------------------------------------------------
+# identificadores.py
+#
+# Tabla de Identificadores.
+# El lexer interna cada ID: todas las apariciones de un mismo nombre
+# comparten UN solo str (su hash se calcula una vez y las
+# comparaciones son por identidad) y un número de símbolo pequeño,
+# que los Puntos Neurálgicos usan como llave en lugar del texto.
+# Cada compilación tiene su propia tabla.
+# -----------------------------------------------------------------
+
+class TablaIdentificadores:
+    def __init__(self):
+        """
+        Inicializa la tabla vacía.
+        Estructura: {nombre: símbolo} y su inverso [nombre] (el
+                    símbolo es la posición del nombre en la lista)
+        """
+        self.simbolos = {}
+        self.nombres = []
+
+    def interna(self, texto):
+        """
+        Devuelve (símbolo, nombre) de 'texto'. El nombre es siempre el
+        mismo str para el mismo texto: el de su primera aparición.
+        """
+        simbolo = self.simbolos.get(texto)
+        if simbolo is None:
+            simbolo = len(self.nombres)
+            self.simbolos[texto] = simbolo
+            self.nombres.append(texto)
+        return simbolo, self.nombres[simbolo]
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def __str__(self):
+        """Representación en string para depuración."""
+        output = "--- Tabla de Identificadores ---\n"
+        for simbolo, nombre in enumerate(self.nombres):
+            output += f"{simbolo}: {nombre}\n"
+        output += "--------------------------------"
+        return output
+
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    from lexer import lexer
+    from escaner import Escaner
+    from parser import Compilador
+
+    tabla = TablaIdentificadores()
+    primero = ''.join(['co', 'nta'])
+    segundo = ''.join(['con', 'ta'])
+    assert primero is not segundo
+    assert tabla.interna(primero) == (0, 'conta') and tabla.interna('x') == (1, 'x')
+    assert tabla.interna(segundo)[1] is primero
+    assert len(tabla) == 2
+
+    # Los dos lexers internan igual: mismo símbolo y mismo str por nombre
+    fuente = "programa p; vars x, y : entero; inicio { x = y + x * y; escribe(x); } fin"
+    for base in (lexer, Escaner()):
+        lex = base.clone()
+        lex.identificadores = TablaIdentificadores()
+        lex.input(fuente)
+        ids = [tok for tok in iter(lex.token, None) if tok.type == 'ID']
+        assert [tok.simbolo for tok in ids] == [0, 1, 2, 1, 2, 1, 2, 1]
+        xs = [tok.value for tok in ids if tok.value == 'x']
+        assert len(xs) == 4 and all(x is xs[0] for x in xs)
+        assert lex.identificadores.nombres == ['p', 'x', 'y']
+
+    # Cada compilación tiene su tabla
+    compilador = Compilador(lexer_base=Escaner())
+    assert compilador.compilar(fuente).exito
+    assert compilador.identificadores.nombres == ['p', 'x', 'y']
+    otro = Compilador()
+    assert otro.compilar("programa q; inicio { } fin").exito
+    assert otro.identificadores.nombres == ['q']
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de identificadores.py: OK")
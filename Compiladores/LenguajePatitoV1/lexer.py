@@ -1,6 +1,21 @@
+import hashlib
+import importlib
 import ply.lex as lex
+import os
 import sys
 
+from diagnosticos import Diagnostico, LEXICO
+from identificadores import TablaIdentificadores
+
+# Modo de arranque de las tablas (lexer y parser):
+#   por omisión  se cargan las tablas congeladas (lextab.py, parsetab.py)
+#                sin validar la gramática y sin escribir nada; solo se
+#                compara su firma con la de las reglas, y si no coincide
+#                se regeneran
+#   'validar'    PATITO_TABLAS=validar: se valida todo y se regeneran las
+#                tablas (y parser.out). Úsalo después de cambiar la gramática.
+TABLAS_CONGELADAS = os.environ.get('PATITO_TABLAS') != 'validar'
+
 # ------------------------------------------------------------
 # 1. LISTA DE TOKENS
 # ------------------------------------------------------------
@@ -76,15 +91,20 @@ t_DOSPTOS = r':'
 # 3. TOKENS COMPLEJOS (CON ACCIONES EN CÓDIGO)
 # ------------------------------------------------------------
 
+# Las constantes guardan en 'lexfin' dónde terminan en el fuente, porque
+# su valor ya no es el texto (ver mapa_fuente.span_token)
+
 # Token para CTE_FLOT (constante flotante)
 def t_CTE_FLOT(t):
     r'\d+\.\d+'
+    t.lexfin = t.lexpos + len(t.value)
     t.value = float(t.value)
     return t
 
 # Token para CTE_ENT (constante entera)
 def t_CTE_ENT(t):
     r'\d+'
+    t.lexfin = t.lexpos + len(t.value)
     t.value = int(t.value)
     return t
 
@@ -97,6 +117,9 @@ def t_ID(t):
     # Si no, el tipo se queda como 'ID'.
     if t.value in reserved:
         t.type = reserved[t.value]
+    else:
+        # Un solo str por nombre, con su número de símbolo
+        t.simbolo, t.value = t.lexer.identificadores.interna(t.value)
     return t
 
 # Token para LETRERO (string literal, tu extensión)
@@ -125,13 +148,70 @@ t_ignore_COMMENT = r'//.*'
 # Manejo de errores léxicos
 # Se llama cuando se encuentra un carácter ilegal
 def t_error(t):
-    print(f"Error Léxico: Carácter ilegal '{t.value[0]}' en línea {t.lexer.lineno}")
+    mensaje = f"Error Léxico: Carácter ilegal '{t.value[0]}' en línea {t.lexer.lineno}"
+    # Si el lexer pertenece a una compilación, el error se guarda en ella
+    errores = getattr(t.lexer, 'errores', None)
+    if errores is None:
+        print(mensaje)
+    else:
+        errores.append(Diagnostico(mensaje, LEXICO, (t.lexpos, t.lexpos + 1)))
     t.lexer.skip(1)
 
 # ------------------------------------------------------------
 # 5. CONSTRUIR EL LEXER
 # ------------------------------------------------------------
-lexer = lex.lex()
+def firma_lexer():
+    """
+    Huella de las reglas del lexer: tokens, palabras reservadas y cada
+    regla t_ (la expresión de las cadenas y el docstring de las
+    funciones), en el orden en que lex las prueba. Se guarda en
+    lextab.py para saber si la tabla es de estas reglas.
+    """
+    reglas = {nombre: valor for nombre, valor in globals().items() if nombre.startswith('t_')}
+    funciones = sorted((valor.__code__.co_firstlineno, nombre, valor.__doc__ or '')
+                       for nombre, valor in reglas.items() if callable(valor))
+    cadenas = sorted(((nombre, valor) for nombre, valor in reglas.items() if isinstance(valor, str)),
+                     key=lambda regla: (-len(regla[1]), regla[0]))
+    partes = [' '.join(tokens), repr(sorted(reserved.items()))]
+    partes += [f"{nombre}={regla}" for _, nombre, regla in funciones]
+    partes += [f"{nombre}={regla}" for nombre, regla in cadenas]
+    return hashlib.sha256('\n'.join(partes).encode('utf-8')).hexdigest()
+
+def cargar_lexer(modulo='lextab'):
+    """
+    El lexer de las tablas de 'modulo' (nombre o módulo ya importado)
+    si se generaron con las reglas actuales; None si no existen o las
+    reglas cambiaron desde que se generaron.
+    """
+    try:
+        tablas = importlib.import_module(modulo) if isinstance(modulo, str) else modulo
+    except ImportError:
+        return None
+    if getattr(tablas, '_firma', None) != firma_lexer():
+        return None
+    return lex.lex(optimize=True, lextab=tablas)
+
+def construir_lexer():
+    """
+    Con TABLAS_CONGELADAS carga la expresión maestra de lextab.py, sin
+    validar las reglas; solo compara su firma. Si no hay tabla, es de
+    otras reglas, o en modo 'validar', construye el lexer con lex.lex()
+    y regenera lextab.py (con la firma al final).
+    """
+    if TABLAS_CONGELADAS:
+        nuevo = cargar_lexer()
+        if nuevo is not None:
+            return nuevo
+    nuevo = lex.lex()
+    carpeta = os.path.dirname(os.path.abspath(__file__))
+    nuevo.writetab('lextab', carpeta)
+    with open(os.path.join(carpeta, 'lextab.py'), 'a') as f:
+        f.write(f"_firma        = {firma_lexer()!r}\n")
+    return nuevo
+
+lexer = construir_lexer()
+# Las copias (clone) la comparten; el Compilador le da una propia a cada compilación
+lexer.identificadores = TablaIdentificadores()
 
 # ------------------------------------------------------------
 # 6. SECCIÓN DE PRUEBA
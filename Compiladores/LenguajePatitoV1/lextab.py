@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ASIG', 'COMA', 'CTE_ENT', 'CTE_FLOT', 'DIF', 'DIV', 'DOSPTOS', 'ENTERO', 'ESCRIBE', 'FIN', 'FLOTANTE', 'HAZ', 'ID', 'IGUALDAD', 'INICIO', 'LBRACE', 'LETRERO', 'LETRERO_KW', 'LPAREN', 'MAS', 'MAYOR', 'MAYORIG', 'MENOR', 'MENORIG', 'MENOS', 'MIENTRAS', 'NULA', 'POR', 'PROGRAMA', 'PTOCOMA', 'RBRACE', 'RPAREN', 'SI', 'SINO', 'VARS'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_CTE_FLOT>\\d+\\.\\d+)|(?P<t_CTE_ENT>\\d+)|(?P<t_ID>[A-Za-z_][A-Za-z_0-9]*)|(?P<t_LETRERO>\\"[^"\\n]*\\")|(?P<t_newline>\\n+)|(?P<t_ignore_COMMENT>//.*)|(?P<t_MAS>\\+)|(?P<t_POR>\\*)|(?P<t_MAYORIG>>=)|(?P<t_MENORIG><=)|(?P<t_IGUALDAD>==)|(?P<t_DIF>!=)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_MENOS>-)|(?P<t_DIV>/)|(?P<t_ASIG>=)|(?P<t_MAYOR>>)|(?P<t_MENOR><)|(?P<t_COMA>,)|(?P<t_PTOCOMA>;)|(?P<t_DOSPTOS>:)', [None, ('t_CTE_FLOT', 'CTE_FLOT'), ('t_CTE_ENT', 'CTE_ENT'), ('t_ID', 'ID'), ('t_LETRERO', 'LETRERO'), ('t_newline', 'newline'), (None, None), (None, 'MAS'), (None, 'POR'), (None, 'MAYORIG'), (None, 'MENORIG'), (None, 'IGUALDAD'), (None, 'DIF'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'MENOS'), (None, 'DIV'), (None, 'ASIG'), (None, 'MAYOR'), (None, 'MENOR'), (None, 'COMA'), (None, 'PTOCOMA'), (None, 'DOSPTOS')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_firma        = 'ae2e0da92435a1f509233d03be8369ba38eae70e7d3ae6ca902a3bbc5266fc5b'
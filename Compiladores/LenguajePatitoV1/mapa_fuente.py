@@ -0,0 +1,110 @@
+# -----------------------------------------------------------------
+# mapa_fuente.py
+#
+# Mapa del Código Fuente.
+# Guarda UNA vez por archivo el offset donde empieza cada línea. Los
+# tokens y los cuádruplos solo llevan su 'span' (offset de inicio y de
+# fin en el texto); la línea y la columna se calculan cuando hacen
+# falta (un error, el depurador) con búsqueda binaria: O(log n).
+# -----------------------------------------------------------------
+from array import array
+from bisect import bisect_right
+
+# Span de lo que no tiene posición en el fuente (ej. un cuádruplo que
+# agregó el optimizador)
+SIN_SPAN = (-1, -1)
+
+
+class MapaFuente:
+    def __init__(self, inicios=None):
+        """'inicios' son los offsets donde empieza cada línea (la 1 en 0)."""
+        self.inicios = array('i', [0]) if inicios is None else array('i', inicios)
+
+    @classmethod
+    def desde_texto(cls, texto):
+        mapa = cls()
+        mapa.agregar(texto, 0)
+        return mapa
+
+    def agregar(self, texto, base):
+        """
+        Registra los saltos de línea de 'texto', que empieza en el
+        offset 'base' del archivo (para leerlo por ventanas).
+        """
+        inicios = self.inicios
+        pos = texto.find('\n')
+        while pos != -1:
+            inicios.append(base + pos + 1)
+            pos = texto.find('\n', pos + 1)
+
+    def linea_columna(self, offset):
+        """(línea, columna) de un offset, ambas desde 1."""
+        linea = bisect_right(self.inicios, offset)
+        return linea, offset - self.inicios[linea - 1] + 1
+
+    def ubicacion(self, span):
+        """Texto 'línea L, columna C' del inicio de un span."""
+        if span[0] < 0:
+            return "ubicación desconocida"
+        linea, columna = self.linea_columna(span[0])
+        return f"línea {linea}, columna {columna}"
+
+    def __len__(self):
+        return len(self.inicios)
+
+
+def span_token(token):
+    """
+    (inicio, fin) de un token. El Escaner y las constantes de lexer.py
+    guardan el fin en 'lexfin'; en los demás el valor es el texto mismo
+    (ej. un operador).
+    """
+    fin = getattr(token, 'lexfin', None)
+    if fin is None:
+        fin = token.lexpos + len(token.value)
+    return token.lexpos, fin
+
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    texto = "programa p;\nvars x : entero;\n\ninicio\n{ x = 1 / 0; }\nfin"
+    mapa = MapaFuente.desde_texto(texto)
+    assert list(mapa.inicios) == [0, 12, 29, 30, 37, 52]
+    for offset in range(len(texto)):
+        linea = texto.count('\n', 0, offset) + 1
+        columna = offset - (texto.rfind('\n', 0, offset) + 1) + 1
+        assert mapa.linea_columna(offset) == (linea, columna), offset
+
+    # Por ventanas da lo mismo que con el texto completo
+    por_ventanas = MapaFuente()
+    for base in range(0, len(texto), 5):
+        por_ventanas.agregar(texto[base:base + 5], base)
+    assert por_ventanas.inicios == mapa.inicios
+
+    # Spans de tokens, diagnósticos y errores de ejecución
+    from parser import compilar, compilar_archivo
+    from escaner import Escaner
+    from maquina_virtual import MaquinaVirtual
+    import io
+    for resultado in (compilar(texto), compilar(texto, lexer_base=Escaner()),
+                      compilar_archivo(io.StringIO(texto))):
+        assert resultado.exito, resultado.errores
+        fila = resultado.fila_cuadruplos
+        assert [texto[i:f] for i, f in zip(fila.inicios, fila.fines)] == ["1 / 0", "x = 1 / 0"]
+        mv = MaquinaVirtual(salida=lambda valor: None)
+        mv.cargar(fila, resultado.tabla_constantes.valores, resultado.mapa_fuente)
+        try:
+            mv.ejecutar()
+            assert False, "Debió fallar"
+        except Exception as e:
+            assert str(e).endswith("(línea 5, columna 7).")
+
+    resultado = compilar(texto.replace("x = 1", "y = 1"))
+    assert resultado.errores[0].startswith("Error en línea 5, columna 3:")
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de mapa_fuente.py: OK")
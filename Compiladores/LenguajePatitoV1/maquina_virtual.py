@@ -0,0 +1,485 @@
+# -----------------------------------------------------------------
+# maquina_virtual.py
+#
+# Máquina Virtual (MV) de Patito.
+# Ejecuta directamente la fila de cuádruplos del QuadManager, sin
+# volver a pasar por el lexer ni por el parser.
+#
+# - Cargador: traduce UNA sola vez cada cuádruplo a un código de
+#   operación entero y cada dirección virtual a un índice de memoria.
+# - Memoria: segmentos tipados (globales, locales, temporales y
+#   constantes, ver memoria.py) acomodados en una lista plana.
+# - Ciclo de ejecución: despacho sobre la tabla compacta de operadores.
+# - Llamadas: el registro de activación de cada función tiene un
+#   tamaño fijo, calculado en compilación (ver 'recursos' en
+#   directory.py); la MV arma su plantilla al cargar y cada ERA solo
+#   la copia.
+# -----------------------------------------------------------------
+import operator
+import sys
+
+from memoria import SEGMENTOS, SEGMENTOS_MARCO, TAM_SEGMENTO, segmento_de, tipo_de
+from quad_manager import Opcode, SIN_OPERANDO, SALTOS
+
+# --- 1. Tabla Compacta de Operadores ---
+# Códigos internos de la MV. Casi coinciden con el Opcode del
+# QuadManager, pero incluyen variantes especializadas por tipo.
+# Los operadores binarios van primero para que el ciclo de ejecución
+# los reconozca con una sola comparación (op < OP_ASIG).
+OP_SUMA = 0
+OP_RESTA = 1
+OP_MULT = 2
+OP_DIV = 3
+OP_DIV_ENTERA = 4   # '/' cuando el cubo dice entero / entero -> entero
+OP_MAYOR = 5
+OP_MENOR = 6
+OP_IGUALDAD = 7
+OP_DIF = 8
+OP_MAYORIG = 9
+OP_MENORIG = 10
+OP_ASIG = 11
+OP_ASIG_FLOT = 12   # flotante = entero (promoción)
+OP_ESCRIBE = 13
+OP_GOTO = 14
+OP_GOTOF = 15
+OP_ERA = 16
+OP_PARAM = 17
+OP_PARAM_FLOT = 18  # Parámetro flotante con argumento entero (promoción)
+OP_GOSUB = 19
+OP_ENDFUNC = 20
+OP_NEG = 21
+
+# {Opcode: código de la MV}
+CODIGOS_OPERADOR = {
+    Opcode.SUMA: OP_SUMA,
+    Opcode.RESTA: OP_RESTA,
+    Opcode.MULT: OP_MULT,
+    Opcode.DIV: OP_DIV,
+    Opcode.MAYOR: OP_MAYOR,
+    Opcode.MENOR: OP_MENOR,
+    Opcode.IGUALDAD: OP_IGUALDAD,
+    Opcode.DIF: OP_DIF,
+    Opcode.MAYORIG: OP_MAYORIG,
+    Opcode.MENORIG: OP_MENORIG,
+    Opcode.ASIG: OP_ASIG,
+    Opcode.ESCRIBE: OP_ESCRIBE,
+    Opcode.GOTO: OP_GOTO,
+    Opcode.GOTOF: OP_GOTOF,
+    Opcode.ERA: OP_ERA,
+    Opcode.PARAM: OP_PARAM,
+    Opcode.GOSUB: OP_GOSUB,
+    Opcode.ENDFUNC: OP_ENDFUNC,
+    Opcode.NEG: OP_NEG,
+}
+
+# En ERA y GOSUB 'op_izq' es el número de la función, y en PARAM el
+# 'resultado' es el número del parámetro: no son direcciones
+NUMERO_DE_FUNCION = (Opcode.ERA, Opcode.GOSUB)
+
+# Máximo de llamadas anidadas (una recursión sin fin se detiene aquí)
+LIMITE_LLAMADAS = 10000
+
+def _div_entera(a, b):
+    """División entera truncada hacia cero (como en C), no hacia -infinito."""
+    cociente = abs(a) // abs(b)
+    return cociente if (a < 0) == (b < 0) else -cociente
+
+# Indexada por código de operación (solo binarios)
+OPERACIONES_BINARIAS = (
+    operator.add,
+    operator.sub,
+    operator.mul,
+    operator.truediv,
+    _div_entera,
+    operator.gt,
+    operator.lt,
+    operator.eq,
+    operator.ne,
+    operator.ge,
+    operator.le,
+)
+
+# --- 2. Segmentos de Memoria ---
+# Valor con el que arranca cada casilla según el tipo del segmento
+VALOR_INICIAL = {
+    'entero': 0,
+    'flotante': 0.0,
+    'booleano': False,
+    'letrero': '',
+}
+
+# --- 3. La Máquina Virtual ---
+class MaquinaVirtual:
+    def __init__(self, salida=print):
+        """
+        'salida' es la función que recibe cada valor de ESCRIBE
+        (por defecto 'print'; los benchmarks pasan una que no imprime).
+        """
+        self.salida = salida
+        # Casillas usadas y posición en la memoria plana de cada segmento
+        self.tamanos = [0] * len(SEGMENTOS)
+        self.bases = [0] * len(SEGMENTOS)
+        # Cuádruplos ya traducidos, en 4 columnas paralelas
+        self.operadores = []
+        self.izquierdos = []
+        self.derechos = []
+        self.resultados = []
+        self.memoria_inicial = []
+        # Por número de función: secciones (inicio, fin, desplazamiento)
+        # de la memoria plana que ocupa su registro de activación, y la
+        # plantilla del registro (sus valores iniciales, en ese orden)
+        self.marcos = []
+        self.plantillas = []
+        # Para reportar los errores de ejecución en el código fuente
+        self.fila_cuadruplos = None
+        self.mapa_fuente = None
+
+    # --- Cargador ---
+
+    def cargar(self, fila_cuadruplos, constantes, mapa_fuente=None, funciones=None):
+        """
+        Traduce la fila de cuádruplos (FilaCuadruplos) al formato interno
+        de la MV.
+        'constantes' es el diccionario {dirección: valor} de la TablaConstantes.
+        'mapa_fuente' (opcional) es el MapaFuente de la compilación: con él
+        los errores de ejecución dicen la línea y columna del cuádruplo.
+        'funciones' es el FuncDirectory; solo hace falta si hay llamadas.
+        Cada dirección virtual se convierte aquí una sola vez en un índice
+        de la memoria plana; durante la ejecución solo se indexa. El
+        resultado de un salto es un número de cuádruplo y se deja igual.
+        """
+        operadores = fila_cuadruplos.operadores
+        entradas = list(funciones.functions.values()) if funciones is not None else []
+        if not entradas and Opcode.ERA in operadores:
+            raise Exception("Error de Ejecución: El programa tiene llamadas; falta el directorio de funciones.")
+
+        # 1. Medir cuántas casillas usa cada segmento (el marco de cada
+        # función cuenta completo, aunque no use todas sus casillas)
+        self.tamanos = [0] * len(SEGMENTOS)
+        for direccion in constantes:
+            self._usar(direccion)
+        izquierdos = [SIN_OPERANDO if op in NUMERO_DE_FUNCION else izq
+                      for op, izq in zip(operadores, fila_cuadruplos.izquierdos)]
+        resultados = [SIN_OPERANDO if op in SALTOS or op == Opcode.PARAM else res
+                      for op, res in zip(operadores, fila_cuadruplos.resultados)]
+        columnas = (izquierdos, fila_cuadruplos.derechos, resultados)
+        for columna in columnas:
+            for direccion in columna:
+                if direccion != SIN_OPERANDO:
+                    self._usar(direccion)
+        for entrada in entradas:
+            for segmento, casillas in zip(SEGMENTOS_MARCO, entrada['recursos'] or ()):
+                i = SEGMENTOS.index(segmento)
+                self.tamanos[i] = max(self.tamanos[i], casillas)
+
+        # 2. Acomodar los segmentos uno tras otro en la memoria plana
+        self.memoria_inicial = []
+        for segmento, (_, tipo) in enumerate(SEGMENTOS):
+            self.bases[segmento] = len(self.memoria_inicial)
+            self.memoria_inicial.extend([VALOR_INICIAL[tipo]] * self.tamanos[segmento])
+        for direccion, valor in constantes.items():
+            self.memoria_inicial[self.indice(direccion)] = valor
+
+        # 3. El registro de activación de cada función
+        self.marcos = []
+        self.plantillas = []
+        posiciones = []  # Por función: [posición de cada parámetro en su registro]
+        for entrada in entradas:
+            secciones, plantilla, desde = [], [], {}
+            for segmento, casillas in zip(SEGMENTOS_MARCO, entrada['recursos'] or ()):
+                if casillas:
+                    inicio = self.bases[SEGMENTOS.index(segmento)]
+                    desde[segmento] = len(plantilla)
+                    secciones.append((inicio, inicio + casillas, len(plantilla)))
+                    plantilla.extend([VALOR_INICIAL[segmento[1]]] * casillas)
+            # Los parámetros son las primeras locales de su tipo, en orden
+            vistos = {}
+            parametros = []
+            for tipo in entrada['parametros']:
+                parametros.append(desde[('local', tipo)] + vistos.get(tipo, 0))
+                vistos[tipo] = vistos.get(tipo, 0) + 1
+            self.marcos.append(tuple(secciones))
+            self.plantillas.append(plantilla)
+            posiciones.append(parametros)
+
+        # 4. Traducir los cuádruplos, columna por columna
+        self.operadores = [self._codigo_operador(op, izq, res) for op, izq, res in
+                           zip(operadores, fila_cuadruplos.izquierdos, fila_cuadruplos.resultados)]
+        self.izquierdos = [self.indice(direccion) for direccion in izquierdos]
+        self.derechos = [self.indice(direccion) for direccion in fila_cuadruplos.derechos]
+        self.resultados = [res if op in SALTOS else self.indice(res)
+                           for op, res in zip(operadores, fila_cuadruplos.resultados)]
+        # Las llamadas: número de función y posición de cada parámetro
+        llamadas = []  # Funciones de los ERA abiertos (los argumentos pueden tener llamadas)
+        for i, op in enumerate(operadores):
+            if op in NUMERO_DE_FUNCION:
+                numero = fila_cuadruplos.izquierdos[i]
+                self.izquierdos[i] = numero
+                if op == Opcode.ERA:
+                    llamadas.append(numero)
+                else:
+                    llamadas.pop()
+            elif op == Opcode.PARAM:
+                numero = llamadas[-1]
+                k = fila_cuadruplos.resultados[i]
+                self.resultados[i] = posiciones[numero][k]
+                if entradas[numero]['parametros'][k] == 'flotante' and tipo_de(fila_cuadruplos.izquierdos[i]) == 'entero':
+                    self.operadores[i] = OP_PARAM_FLOT
+        self.fila_cuadruplos = fila_cuadruplos
+        self.mapa_fuente = mapa_fuente
+
+    def _usar(self, direccion):
+        segmento = segmento_de(direccion)
+        self.tamanos[segmento] = max(self.tamanos[segmento], direccion % TAM_SEGMENTO + 1)
+
+    def indice(self, direccion):
+        """Traduce una dirección virtual a su índice en la memoria plana."""
+        if direccion == SIN_OPERANDO:
+            return -1
+        return self.bases[segmento_de(direccion)] + direccion % TAM_SEGMENTO
+
+    def _codigo_operador(self, operador, izq, res):
+        """Traduce el Opcode a su código de la MV, especializándolo según los tipos."""
+        if operador not in CODIGOS_OPERADOR:
+            raise Exception(f"Error de Ejecución: Operador no soportado '{Opcode(operador).simbolo}'.")
+        codigo = CODIGOS_OPERADOR[operador]
+        if codigo == OP_DIV and tipo_de(res) == 'entero':
+            codigo = OP_DIV_ENTERA
+        elif codigo == OP_ASIG and tipo_de(res) == 'flotante' and tipo_de(izq) == 'entero':
+            codigo = OP_ASIG_FLOT
+        return codigo
+
+    # --- Ciclo de Ejecución ---
+
+    def ejecutar(self):
+        """
+        Ejecuta los cuádruplos cargados desde el primero.
+        Devuelve la memoria final (útil para pruebas).
+        """
+        memoria = list(self.memoria_inicial)
+        operadores = self.operadores
+        izquierdos = self.izquierdos
+        derechos = self.derechos
+        resultados = self.resultados
+        binarias = OPERACIONES_BINARIAS
+        salida = self.salida
+        marcos = self.marcos
+        plantillas = self.plantillas
+        pendientes = []  # Registros de los ERA que todavía no llegan a su GOSUB
+        llamadas = []    # (regreso, secciones, valores del llamador), por llamada activa
+
+        total = len(operadores)
+        ip = 0
+        try:
+            while ip < total:
+                op = operadores[ip]
+                if op < OP_ASIG:
+                    memoria[resultados[ip]] = binarias[op](memoria[izquierdos[ip]], memoria[derechos[ip]])
+                elif op == OP_ASIG:
+                    memoria[resultados[ip]] = memoria[izquierdos[ip]]
+                elif op == OP_GOTOF:
+                    if not memoria[izquierdos[ip]]:
+                        ip = resultados[ip]
+                        continue
+                elif op == OP_GOTO:
+                    ip = resultados[ip]
+                    continue
+                elif op == OP_ASIG_FLOT:
+                    memoria[resultados[ip]] = float(memoria[izquierdos[ip]])
+                elif op == OP_NEG:
+                    memoria[resultados[ip]] = -memoria[izquierdos[ip]]
+                elif op == OP_PARAM:
+                    pendientes[-1][resultados[ip]] = memoria[izquierdos[ip]]
+                elif op == OP_ERA:
+                    pendientes.append(plantillas[izquierdos[ip]][:])
+                elif op == OP_GOSUB:
+                    if len(llamadas) >= LIMITE_LLAMADAS:
+                        raise Exception(f"Error de Ejecución: Más de {LIMITE_LLAMADAS} llamadas anidadas "
+                                        f"en el cuádruplo {ip}{self._ubicacion(ip)}.")
+                    # Las casillas del marco guardan lo del llamador y
+                    # reciben el registro nuevo
+                    registro = pendientes.pop()
+                    secciones = marcos[izquierdos[ip]]
+                    guardados = []
+                    for inicio, fin, desde in secciones:
+                        guardados.append(memoria[inicio:fin])
+                        memoria[inicio:fin] = registro[desde:desde + fin - inicio]
+                    llamadas.append((ip + 1, secciones, guardados))
+                    ip = resultados[ip]
+                    continue
+                elif op == OP_ENDFUNC:
+                    ip, secciones, guardados = llamadas.pop()
+                    for (inicio, fin, _), valores in zip(secciones, guardados):
+                        memoria[inicio:fin] = valores
+                    continue
+                elif op == OP_PARAM_FLOT:
+                    pendientes[-1][resultados[ip]] = float(memoria[izquierdos[ip]])
+                else:  # OP_ESCRIBE
+                    salida(memoria[resultados[ip]])
+                ip += 1
+        except ZeroDivisionError:
+            raise Exception(f"Error de Ejecución: División entre cero en el cuádruplo {ip}{self._ubicacion(ip)}.")
+        return memoria
+
+    def _ubicacion(self, ip):
+        """' (línea L, columna C)' del cuádruplo ip, o '' si no hay mapa ni span."""
+        if self.mapa_fuente is None:
+            return ''
+        span = self.fila_cuadruplos.span(ip)
+        if span[0] < 0:
+            return ''
+        return f" ({self.mapa_fuente.ubicacion(span)})"
+
+    def __str__(self):
+        """Representación en string para depuración."""
+        output = "--- Memoria de la MV ---\n"
+        for segmento, (ambito, tipo) in enumerate(SEGMENTOS):
+            if self.tamanos[segmento]:
+                output += f"  {ambito} {tipo}: base {self.bases[segmento]}, {self.tamanos[segmento]} casillas\n"
+        output += "------------------------"
+        return output
+
+
+# -----------------------------------------------------------
+# PRUEBAS (cuádruplos armados a mano, un caso por operador)
+# -----------------------------------------------------------
+def run_tests():
+    from quad_manager import FilaCuadruplos
+    from directory import FuncDirectory
+    from parser import compilar
+
+    def correr(quads, constantes, funciones=None):
+        fila = FilaCuadruplos()
+        for quad in quads:
+            fila.agregar(*quad)
+        salida = []
+        mv = MaquinaVirtual(salida=salida.append)
+        mv.cargar(fila, constantes, None, funciones)
+        memoria = mv.ejecutar()
+        return salida, {direccion: memoria[mv.indice(direccion)] for direccion in
+                        set(fila.izquierdos) | set(fila.derechos) | set(fila.resultados)
+                        if direccion >= TAM_SEGMENTO}, mv
+
+    # Operadores binarios, con la variante de cada tipo: 'entero / entero'
+    # trunca hacia cero y 'flotante = entero' promueve
+    constantes = {8000: 7, 8001: -2, 9000: 0.5, 10000: "hola"}
+    salida, memoria, mv = correr([
+        ('+', 8000, 8001, 1000), ('-', 8000, 8001, 1001), ('*', 8000, 8001, 5000),
+        ('/', 8000, 8001, 5001), ('/', 8000, 9000, 2000), ('*', 1000, 9000, 6000),
+        ('>', 8000, 8001, 7000), ('<', 8000, 8001, 7001), ('==', 8000, 8000, 7002),
+        ('!=', 8000, 8000, 7003), ('>=', 8001, 8001, 7004), ('<=', 8000, 8001, 7005),
+        ('=', 8000, None, 1002), ('=', 8000, None, 2001), ('NEG', 9000, None, 6001),
+        ('ESCRIBE', None, None, 10000), ('ESCRIBE', None, None, 2001), ('ESCRIBE', None, None, 5001),
+    ], constantes)
+    assert salida == ["hola", 7.0, -3]
+    assert isinstance(memoria[2001], float) and memoria[1002] == 7
+    assert (memoria[1000], memoria[1001], memoria[5000], memoria[5001]) == (5, 9, -14, -3)
+    assert (memoria[2000], memoria[6000], memoria[6001]) == (14.0, 2.5, -0.5)
+    assert [memoria[7000 + i] for i in range(6)] == [True, False, True, False, True, False]
+
+    # Cada segmento ocupa en la memoria plana solo las casillas que usa
+    assert mv.tamanos == [3, 2, 0, 0, 2, 2, 6, 2, 1, 1]
+    assert [mv.indice(d) for d in (1000, 2000, 5000, 6000, 7000, 8000, 9000, 10000)] == \
+        [0, 3, 5, 7, 9, 15, 17, 18]
+
+    # GOTO y GOTOF: un ciclo que escribe 0, 1 y 2
+    salida, memoria, _ = correr([
+        ('<', 1000, 8001, 7000), ('GOTOF', 7000, None, 5), ('ESCRIBE', None, None, 1000),
+        ('+', 1000, 8000, 1000), ('GOTO', None, None, 0), ('ESCRIBE', None, None, 10000),
+    ], {8000: 1, 8001: 3, 10000: "fin"})
+    assert salida == [0, 1, 2, "fin"] and memoria[1000] == 3
+
+    # ERA, PARAM (con promoción a flotante), GOSUB y ENDFUNC: la
+    # función suma(n : entero, x : flotante) escribe n + x y se llama a
+    # sí misma con n - 1 hasta n = 0. Sus locales y temporales se
+    # restauran al regresar de cada llamada.
+    funciones = FuncDirectory()
+    funciones.add_func('suma', 'nula')
+    funciones.add_var_to_func('suma', 'n', 'entero', 'parametro')
+    funciones.add_var_to_func('suma', 'x', 'flotante', 'parametro')
+    funciones.functions['suma']['parametros'] = ['entero', 'flotante']
+    funciones.functions['suma']['recursos'] = [1, 1, 1, 1, 1]
+    funciones.functions['suma']['inicio'] = 1
+    salida, _, _ = correr([
+        ('GOTO', None, None, 12),
+        ('+', 3000, 4000, 6000), ('ESCRIBE', None, None, 6000),  # 1: suma
+        ('>', 3000, 8000, 7000), ('GOTOF', 7000, None, 10),
+        ('-', 3000, 8001, 5000), ('ERA', 1, None, None), ('PARAM', 5000, None, 0),
+        ('PARAM', 4000, None, 1), ('GOSUB', 1, None, 1),
+        ('ESCRIBE', None, None, 3000),  # 10: la 'n' de esta llamada
+        ('ENDFUNC', None, None, None),
+        ('ERA', 1, None, None), ('PARAM', 8002, None, 0), ('PARAM', 8000, None, 1),  # 12: principal
+        ('GOSUB', 1, None, 1),
+    ], {8000: 0, 8001: 1, 8002: 2}, funciones)
+    assert salida == [2.0, 1.0, 0.0, 0, 1, 2], salida
+    assert all(isinstance(valor, float) for valor in salida[:3])  # PARAM_FLOT
+
+    # Llamadas sin el directorio de funciones
+    try:
+        correr([('ERA', 1, None, None), ('GOSUB', 1, None, 0)], {})
+        assert False, "faltaba el directorio"
+    except Exception as e:
+        assert "falta el directorio de funciones" in str(e)
+
+    # Más de LIMITE_LLAMADAS llamadas anidadas
+    funciones = FuncDirectory()
+    funciones.add_func('f', 'nula')
+    funciones.functions['f']['recursos'] = [0, 0, 0, 0, 0]
+    try:
+        correr([('GOTO', None, None, 4), ('ERA', 1, None, None), ('GOSUB', 1, None, 1),
+                ('ENDFUNC', None, None, None), ('ERA', 1, None, None), ('GOSUB', 1, None, 1)],
+               {}, funciones)
+        assert False, "la recursión no termina"
+    except Exception as e:
+        assert str(e) == f"Error de Ejecución: Más de {LIMITE_LLAMADAS} llamadas anidadas en el cuádruplo 2."
+
+    # División entre cero, con la ubicación del cuádruplo en el fuente
+    resultado = compilar("programa p; vars a, b : entero;\ninicio { a = 1;\n  b = a / b; } fin")
+    mv = MaquinaVirtual(salida=lambda valor: None)
+    mv.cargar(resultado.fila_cuadruplos, resultado.tabla_constantes.valores, resultado.mapa_fuente)
+    try:
+        mv.ejecutar()
+        assert False, "debió fallar"
+    except Exception as e:
+        assert str(e) == "Error de Ejecución: División entre cero en el cuádruplo 1 (línea 3, columna 7).", e
+
+
+if __name__ == '__main__':
+    # Uso: python maquina_virtual.py [archivo.pat | archivo.pobj]
+    #   .pobj se carga directo (sin lexer ni parser); .pat pasa por la
+    #   caché de compilación y solo se compila si no está en ella
+    from objeto import cargar_objeto, EXTENSION
+    from cache_compilacion import CacheCompilacion
+
+    def compilar(fuente):
+        from parser import compilar as compilar_patito
+        resultado = compilar_patito(fuente)
+        if not resultado.exito:
+            for error in resultado.errores:
+                print(error)
+            sys.exit(1)
+        return resultado.dir_funciones, resultado.tabla_constantes, resultado.fila_cuadruplos
+
+    archivo = sys.argv[1] if len(sys.argv) > 1 else 'prueba_etapa3.pat'
+    mapa_fuente = None  # Un .pobj suelto no trae el fuente para ubicar los spans
+    try:
+        if archivo.endswith(EXTENSION):
+            programa = cargar_objeto(archivo)
+        else:
+            with open(archivo, 'r') as f:
+                data = f.read()
+            cache = CacheCompilacion()
+            programa = cache.obtener(data, compilar)
+            print(cache)
+            from mapa_fuente import MapaFuente
+            mapa_fuente = MapaFuente.desde_texto(data)
+    except FileNotFoundError:
+        print(f"Archivo '{archivo}' no encontrado.")
+        sys.exit()
+
+    mv = MaquinaVirtual()
+    mv.cargar(programa.fila_cuadruplos, programa.tabla_constantes.valores, mapa_fuente, programa.dir_funciones)
+    print(mv)
+    print("--- INICIO DE EJECUCIÓN ---")
+    mv.ejecutar()
+    print("--- FIN DE EJECUCIÓN ---")
@@ -0,0 +1,208 @@
+# -----------------------------------------------------------------
+# memoria.py
+#
+# Mapa de Memoria Virtual de Patito.
+# Cada variable, temporal y constante recibe una dirección entera.
+# La dirección indica por sí sola el ámbito y el tipo del valor:
+#
+#   1000 - 1999   global    entero
+#   2000 - 2999   global    flotante
+#   3000 - 3999   local     entero
+#   4000 - 4999   local     flotante
+#   5000 - 5999   temporal  entero
+#   6000 - 6999   temporal  flotante
+#   7000 - 7999   temporal  booleano
+#   8000 - 8999   constante entero
+#   9000 - 9999   constante flotante
+#  10000 - 10999  constante letrero
+# -----------------------------------------------------------------
+
+TAM_SEGMENTO = 1000
+
+# Orden de los segmentos; el segmento i empieza en (i + 1) * TAM_SEGMENTO
+SEGMENTOS = (
+    ('global', 'entero'),
+    ('global', 'flotante'),
+    ('local', 'entero'),
+    ('local', 'flotante'),
+    ('temporal', 'entero'),
+    ('temporal', 'flotante'),
+    ('temporal', 'booleano'),
+    ('constante', 'entero'),
+    ('constante', 'flotante'),
+    ('constante', 'letrero'),
+)
+
+# {(ambito, tipo): dirección base}
+BASES = {segmento: (i + 1) * TAM_SEGMENTO for i, segmento in enumerate(SEGMENTOS)}
+
+# Segmentos relativos a cada función: forman su registro de activación
+SEGMENTOS_MARCO = tuple(segmento for segmento in SEGMENTOS if segmento[0] in ('local', 'temporal'))
+
+
+# --- Consultas sobre una dirección ---
+
+def segmento_de(direccion):
+    """Devuelve el número de segmento (0, 1, ...) de una dirección."""
+    return direccion // TAM_SEGMENTO - 1
+
+def ambito_de(direccion):
+    """Devuelve 'global', 'local', 'temporal' o 'constante'."""
+    return SEGMENTOS[segmento_de(direccion)][0]
+
+def tipo_de(direccion):
+    """Devuelve 'entero', 'flotante', 'booleano' o 'letrero'."""
+    return SEGMENTOS[segmento_de(direccion)][1]
+
+
+# --- Asignador de Direcciones ---
+class AsignadorMemoria:
+    """
+    Reparte direcciones virtuales por ámbito y tipo.
+    Los contadores 'local' y 'temporal' se reinician al entrar a
+    cada función, porque esas direcciones son relativas a su ámbito.
+
+    Los temporales se reciclan: cuando su único uso los consume, el
+    QuadManager los devuelve con liberar() a un pool por tipo, y el
+    siguiente temporal de ese tipo reutiliza la dirección. Así el
+    espacio de temporales crece con la profundidad de las expresiones
+    y no con el largo del programa.
+    """
+    def __init__(self):
+        self.contadores = {segmento: 0 for segmento in SEGMENTOS}
+        # Pool de direcciones libres por segmento temporal
+        self.libres = {segmento: [] for segmento in SEGMENTOS if segmento[0] == 'temporal'}
+        # Máximo de temporales vivos a la vez (high-water mark), en todo el programa
+        self.marca_maxima = {segmento: 0 for segmento in self.libres}
+
+    def asignar(self, ambito, tipo):
+        """
+        Devuelve la siguiente dirección libre del segmento (ambito, tipo).
+        Lanza una excepción si el segmento no existe o ya se llenó.
+        """
+        segmento = (ambito, tipo)
+        if segmento not in self.contadores:
+            raise Exception(f"Error Semántico: No hay memoria '{ambito}' para el tipo '{tipo}'.")
+
+        libres = self.libres.get(segmento)
+        if libres:
+            return libres.pop()
+
+        usadas = self.contadores[segmento]
+        if usadas >= TAM_SEGMENTO:
+            raise Exception(f"Error de Memoria: Se agotó el segmento {ambito} {tipo} ({TAM_SEGMENTO} direcciones).")
+
+        self.contadores[segmento] = usadas + 1
+        if libres is not None and usadas + 1 > self.marca_maxima[segmento]:
+            self.marca_maxima[segmento] = usadas + 1
+        return BASES[segmento] + usadas
+
+    def liberar(self, direccion):
+        """
+        Devuelve un temporal al pool de su tipo para reutilizarlo.
+        Las direcciones que no son temporales se ignoran.
+        """
+        segmento = SEGMENTOS[segmento_de(direccion)]
+        if segmento in self.libres:
+            self.libres[segmento].append(direccion)
+
+    def maximo_temporales(self):
+        """
+        High-water mark: {tipo: máximo de temporales vivos a la vez}.
+        Es el tamaño que necesita el segmento temporal de la MV.
+        """
+        return {tipo: maximo for (_, tipo), maximo in self.marca_maxima.items()}
+
+    def tamano_marco(self):
+        """
+        [casillas] por cada segmento de SEGMENTOS_MARCO usadas en el
+        ámbito actual: el tamaño de su registro de activación. Como los
+        contadores solo crecen dentro del ámbito, cuenta también los
+        temporales ya reciclados.
+        """
+        return [self.contadores[segmento] for segmento in SEGMENTOS_MARCO]
+
+    def reiniciar_locales(self):
+        """Reinicia los contadores 'local' y 'temporal' (nuevo ámbito)."""
+        for segmento in self.contadores:
+            if segmento[0] in ('local', 'temporal'):
+                self.contadores[segmento] = 0
+        for libres in self.libres.values():
+            libres.clear()
+
+    def __str__(self):
+        """Representación en string para depuración."""
+        output = "--- Memoria Asignada ---\n"
+        for (ambito, tipo), usadas in self.contadores.items():
+            if usadas:
+                output += f"  {ambito} {tipo}: {usadas} (desde {BASES[(ambito, tipo)]})\n"
+        output += f"  Máximo de temporales vivos: {self.maximo_temporales()}\n"
+        output += "------------------------"
+        return output
+
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    memoria = AsignadorMemoria()
+
+    # Un temporal liberado lo reutiliza el siguiente de su mismo tipo
+    for tipo in ('entero', 'flotante', 'booleano'):
+        primero = memoria.asignar('temporal', tipo)
+        segundo = memoria.asignar('temporal', tipo)
+        memoria.liberar(primero)
+        assert memoria.asignar('temporal', tipo) == primero
+        assert memoria.asignar('temporal', tipo) == segundo + 1
+    assert memoria.maximo_temporales() == {'entero': 3, 'flotante': 3, 'booleano': 3}
+
+    # Los pools no se mezclan entre tipos, y liberar algo que no es
+    # temporal no hace nada
+    entero = memoria.asignar('temporal', 'entero')
+    memoria.liberar(entero)
+    assert tipo_de(memoria.asignar('temporal', 'flotante')) == 'flotante'
+    assert memoria.asignar('temporal', 'entero') == entero
+    memoria.liberar(memoria.asignar('global', 'entero'))
+    memoria.liberar(BASES[('constante', 'entero')])
+    assert memoria.libres == {segmento: [] for segmento in memoria.libres}
+
+    # El máximo de temporales vivos cuenta los que estuvieron vivos a la
+    # vez, no cuántos se pidieron
+    memoria = AsignadorMemoria()
+    for _ in range(10):
+        memoria.liberar(memoria.asignar('temporal', 'entero'))
+    assert memoria.maximo_temporales()['entero'] == 1
+
+    # tamano_marco: las casillas exactas del ámbito actual; al empezar
+    # otra función los contadores (y los pools) vuelven a cero
+    memoria = AsignadorMemoria()
+    memoria.asignar('global', 'flotante')
+    memoria.reiniciar_locales()
+    for tipo in ('entero', 'entero', 'flotante'):
+        memoria.asignar('local', tipo)
+    temporales = [memoria.asignar('temporal', 'booleano') for _ in range(3)]
+    for temporal in temporales:
+        memoria.liberar(temporal)
+    assert memoria.tamano_marco() == [2, 1, 0, 0, 3]
+    memoria.reiniciar_locales()
+    assert memoria.tamano_marco() == [0, 0, 0, 0, 0]
+    assert memoria.asignar('temporal', 'booleano') == BASES[('temporal', 'booleano')]
+    assert memoria.asignar('local', 'flotante') == BASES[('local', 'flotante')]
+    assert memoria.tamano_marco() == [0, 1, 0, 0, 1]
+    assert memoria.contadores[('global', 'flotante')] == 1  # Las globales no se reinician
+    assert memoria.maximo_temporales()['booleano'] == 3
+
+    # Un segmento lleno se reporta
+    memoria = AsignadorMemoria()
+    for _ in range(TAM_SEGMENTO):
+        memoria.asignar('constante', 'letrero')
+    try:
+        memoria.asignar('constante', 'letrero')
+        assert False, "el segmento estaba lleno"
+    except Exception as e:
+        assert "Se agotó el segmento constante letrero" in str(e)
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de memoria.py: OK")
@@ -0,0 +1,267 @@
+# -----------------------------------------------------------------
+# objeto.py
+#
+# Código Objeto de Patito (archivos .pobj).
+# Guarda en binario todo lo que la Máquina Virtual necesita, para
+# que una ejecución no vuelva a pasar por el lexer ni el parser.
+#
+# Formato (little-endian):
+#   Encabezado  '<4sHHIII': b'PATO', versión, reservado,
+#               bytes del directorio, # constantes, # cuádruplos
+#   Directorio  JSON en UTF-8 (funciones con sus parámetros, número,
+#               cuádruplo de inicio y recursos, y sus variables,
+#               cada una como [tipo, dirección, clase, línea])
+#   Constantes  por cada una: dirección (i32) + valor según el tipo
+#               que indica la dirección: entero u32 con el largo + sus
+#               bytes en complemento a 2 (los enteros de Patito no
+#               tienen límite, como los de Python), flotante 'd',
+#               letrero u32 con el largo + UTF-8
+#   Cuádruplos  las 6 columnas array('i') de la FilaCuadruplos, una
+#               tras otra (operadores, izquierdos, derechos, resultados,
+#               y el span de cada uno en el fuente: inicios, fines)
+#
+# Se carga con una sola lectura del archivo; las columnas de
+# cuádruplos se copian directo de los bytes, sin decodificar uno a uno.
+# -----------------------------------------------------------------
+import json
+import struct
+import sys
+from array import array
+
+from memoria import AsignadorMemoria, tipo_de
+from directory import FuncDirectory
+from constantes import TablaConstantes
+from quad_manager import FilaCuadruplos
+
+MAGICO = b'PATO'
+VERSION_OBJETO = 5
+ENCABEZADO = struct.Struct('<4sHHIII')
+EXTENSION = '.pobj'
+
+
+class ProgramaObjeto:
+    """Lo que contiene un archivo .pobj ya cargado en memoria."""
+    def __init__(self, dir_funciones, tabla_constantes, fila_cuadruplos):
+        self.dir_funciones = dir_funciones
+        self.tabla_constantes = tabla_constantes
+        self.fila_cuadruplos = fila_cuadruplos
+
+
+# --- 1. Escritura ---
+
+def _directorio_a_dict(dir_funciones):
+    funciones = {}
+    for nombre, datos in dir_funciones.functions.items():
+        entrada = {clave: valor for clave, valor in datos.items() if clave != 'tabla_vars'}
+        entrada['variables'] = {var: [simbolo.tipo, simbolo.direccion, simbolo.clase, simbolo.linea]
+                                for var, simbolo in datos['tabla_vars'].variables.items()}
+        funciones[nombre] = entrada
+    return funciones
+
+def _entero_a_bytes(valor):
+    # Los bytes justos para el valor y su signo (1 para 0..127)
+    return valor.to_bytes(valor.bit_length() // 8 + 1, 'little', signed=True)
+
+def _columnas(fila_cuadruplos):
+    return (fila_cuadruplos.operadores, fila_cuadruplos.izquierdos,
+            fila_cuadruplos.derechos, fila_cuadruplos.resultados,
+            fila_cuadruplos.inicios, fila_cuadruplos.fines)
+
+def _columna_a_bytes(columna):
+    if sys.byteorder == 'big':
+        columna = array('i', columna)
+        columna.byteswap()
+    return columna.tobytes()
+
+def a_bytes(dir_funciones, tabla_constantes, fila_cuadruplos):
+    """Serializa un programa compilado al formato .pobj."""
+    directorio = json.dumps(_directorio_a_dict(dir_funciones), separators=(',', ':')).encode('utf-8')
+
+    partes = [b'', directorio]
+    for direccion, valor in tabla_constantes.valores.items():
+        tipo = tipo_de(direccion)
+        if tipo == 'entero':
+            entero = _entero_a_bytes(valor)
+            partes.append(struct.pack('<iI', direccion, len(entero)) + entero)
+        elif tipo == 'flotante':
+            partes.append(struct.pack('<id', direccion, valor))
+        else:
+            texto = valor.encode('utf-8')
+            partes.append(struct.pack('<iI', direccion, len(texto)) + texto)
+
+    for columna in _columnas(fila_cuadruplos):
+        partes.append(_columna_a_bytes(columna))
+
+    partes[0] = ENCABEZADO.pack(MAGICO, VERSION_OBJETO, 0, len(directorio),
+                                len(tabla_constantes), len(fila_cuadruplos))
+    return b''.join(partes)
+
+def escribir_objeto(ruta, dir_funciones, tabla_constantes, fila_cuadruplos):
+    """Escribe el programa compilado en 'ruta'. Devuelve los bytes escritos."""
+    datos = a_bytes(dir_funciones, tabla_constantes, fila_cuadruplos)
+    with open(ruta, 'wb') as f:
+        f.write(datos)
+    return len(datos)
+
+
+# --- 2. Lectura ---
+
+def _leer(formato, vista, pos):
+    """struct.unpack_from que reporta un archivo truncado como error de .pobj."""
+    if pos + struct.calcsize(formato) > len(vista):
+        raise Exception("Error de Código Objeto: Archivo truncado.")
+    return struct.unpack_from(formato, vista, pos)
+
+def _rebanada(vista, pos, largo):
+    if pos + largo > len(vista):
+        raise Exception("Error de Código Objeto: Archivo truncado.")
+    return vista[pos:pos + largo]
+
+def desde_bytes(datos):
+    """Reconstruye un ProgramaObjeto a partir de los bytes de un .pobj."""
+    vista = memoryview(datos)
+    if len(vista) < ENCABEZADO.size:
+        raise Exception("Error de Código Objeto: Archivo truncado.")
+    magico, version, _, tam_directorio, n_constantes, n_cuadruplos = ENCABEZADO.unpack_from(vista, 0)
+    if magico != MAGICO:
+        raise Exception("Error de Código Objeto: No es un archivo .pobj.")
+    if version != VERSION_OBJETO:
+        raise Exception(f"Error de Código Objeto: Versión {version} no soportada (se esperaba {VERSION_OBJETO}).")
+    pos = ENCABEZADO.size
+
+    # Directorio. Se reconstruye con un asignador propio: las direcciones
+    # ya vienen en el archivo y no deben tocar las del compilador.
+    funciones = json.loads(bytes(_rebanada(vista, pos, tam_directorio)).decode('utf-8'))
+    pos += tam_directorio
+    memoria = AsignadorMemoria()
+    dir_funciones = FuncDirectory(memoria)
+    for nombre, entrada in funciones.items():
+        if nombre != 'global':
+            dir_funciones.add_func(nombre, entrada['tipo_retorno'])
+        datos_func = dir_funciones.functions[nombre]
+        for clave, valor in entrada.items():
+            if clave != 'variables':
+                datos_func[clave] = valor
+        for var, (tipo, direccion, clase, linea) in entrada['variables'].items():
+            datos_func['tabla_vars'].add_var(var, tipo, direccion, clase, linea)
+
+    # Constantes
+    tabla_constantes = TablaConstantes(memoria)
+    for _ in range(n_constantes):
+        (direccion,) = _leer('<i', vista, pos)
+        pos += 4
+        tipo = tipo_de(direccion)
+        if tipo == 'entero':
+            (largo,) = _leer('<I', vista, pos)
+            pos += 4
+            valor = int.from_bytes(_rebanada(vista, pos, largo), 'little', signed=True)
+            pos += largo
+        elif tipo == 'flotante':
+            (valor,) = _leer('<d', vista, pos)
+            pos += 8
+        else:
+            (largo,) = _leer('<I', vista, pos)
+            pos += 4
+            valor = bytes(_rebanada(vista, pos, largo)).decode('utf-8')
+            pos += largo
+        tabla_constantes.direcciones[(valor, tipo)] = direccion
+        tabla_constantes.valores[direccion] = valor
+
+    # Cuádruplos: cada columna se copia directo de los bytes
+    fila = FilaCuadruplos()
+    columnas = _columnas(fila)
+    tam_columna = n_cuadruplos * fila.operadores.itemsize
+    if len(vista) - pos != len(columnas) * tam_columna:
+        raise Exception("Error de Código Objeto: Archivo truncado.")
+    for columna in columnas:
+        columna.frombytes(vista[pos:pos + tam_columna])
+        if sys.byteorder == 'big':
+            columna.byteswap()
+        pos += tam_columna
+    fila.reindexar()  # Destinos de salto y líderes de bloque
+
+    return ProgramaObjeto(dir_funciones, tabla_constantes, fila)
+
+def cargar_objeto(ruta):
+    """Carga un archivo .pobj con una sola lectura."""
+    with open(ruta, 'rb') as f:
+        return desde_bytes(f.read())
+
+
+# -----------------------------------------------------------
+# PRUEBAS (round-trip y comparación de tamaño)
+# -----------------------------------------------------------
+def run_tests():
+    import io
+    from contextlib import redirect_stdout
+    from parser import Compilador
+
+    with open('prueba_etapa3.pat', 'r') as f:
+        fuente = f.read()
+    compilador = Compilador()
+    resultado = compilador.compilar(fuente)
+    assert resultado.exito, resultado.errores
+    dir_general, quad_manager = resultado.dir_funciones, compilador.quad_manager
+
+    # Caso 1: escribir y volver a leer conserva todo
+    datos = a_bytes(dir_general, quad_manager.tabla_constantes, quad_manager.fila_cuadruplos)
+    programa = desde_bytes(datos)
+    fila = quad_manager.fila_cuadruplos
+    assert programa.fila_cuadruplos.operadores == fila.operadores
+    assert programa.fila_cuadruplos.izquierdos == fila.izquierdos
+    assert programa.fila_cuadruplos.derechos == fila.derechos
+    assert programa.fila_cuadruplos.resultados == fila.resultados
+    assert programa.fila_cuadruplos.inicios == fila.inicios and len(fila.inicios) == len(fila)
+    assert programa.fila_cuadruplos.fines == fila.fines
+    assert [programa.fila_cuadruplos.span(i) for i in range(len(fila))] == [fila.span(i) for i in range(len(fila))]
+    assert programa.tabla_constantes.valores == quad_manager.tabla_constantes.valores
+    assert programa.tabla_constantes.direcciones == quad_manager.tabla_constantes.direcciones
+    assert str(programa.dir_funciones) == str(dir_general)
+
+    # Caso 2: volver a serializar lo cargado da exactamente los mismos bytes
+    assert a_bytes(programa.dir_funciones, programa.tabla_constantes, programa.fila_cuadruplos) == datos
+
+    # Caso 3: un archivo ajeno, de otra versión o truncado en cualquier
+    # punto (encabezado, directorio, constantes o cuádruplos) se rechaza
+    # con un error de .pobj, no con uno de json o struct
+    assert len(quad_manager.tabla_constantes) > 0  # Para cortar también dentro de las constantes
+    malos = [b'XXXX' + datos[4:], datos[:4] + struct.pack('<H', VERSION_OBJETO + 1) + datos[6:]]
+    malos += [datos[:corte] for corte in range(len(datos))]
+    for malo in malos:
+        try:
+            desde_bytes(malo)
+            assert False, "Debió rechazar el archivo"
+        except Exception as e:
+            assert str(e).startswith("Error de Código Objeto"), (len(malo), e)
+
+    # Caso 4: enteros fuera de 64 bits, escritos en el fuente o que
+    # salen del plegado de constantes, se guardan y se ejecutan igual
+    from maquina_virtual import MaquinaVirtual
+    fuente_grande = ("programa p; vars x, y : entero; inicio { x = 99999999999999999999; "
+                     "y = -3037000500 * 3037000500; escribe(x, y, -x + 1); } fin")
+    esperado = [99999999999999999999, -3037000500 * 3037000500, -99999999999999999998]
+    for optimizar in (False, True):
+        grande = Compilador().compilar(fuente_grande, optimizar)
+        assert grande.exito, grande.errores
+        programa = desde_bytes(a_bytes(grande.dir_funciones, grande.tabla_constantes, grande.fila_cuadruplos))
+        assert programa.tabla_constantes.valores == grande.tabla_constantes.valores
+        salida = []
+        mv = MaquinaVirtual(salida=salida.append)
+        mv.cargar(programa.fila_cuadruplos, programa.tabla_constantes.valores)
+        mv.ejecutar()
+        assert salida == esperado, salida
+    for valor in (0, 1, -1, 127, 128, -128, -129, 2 ** 63, -2 ** 63 - 1, 10 ** 40):
+        assert int.from_bytes(_entero_a_bytes(valor), 'little', signed=True) == valor
+
+    # Comparación contra el volcado de texto actual (directorio + cuádruplos)
+    texto = io.StringIO()
+    with redirect_stdout(texto):
+        print(dir_general)
+        quad_manager.mostrar_cuadruplos()
+    print(f"Volcado de texto: {len(texto.getvalue().encode('utf-8'))} bytes")
+    print(f"Código objeto:    {len(datos)} bytes")
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de objeto.py: OK")
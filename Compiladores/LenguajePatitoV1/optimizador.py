@@ -0,0 +1,530 @@
+# -----------------------------------------------------------------
+# optimizador.py
+#
+# Etapa opcional de optimización sobre la fila de cuádruplos.
+# Cada pase recibe una FilaCuadruplos y devuelve una nueva, más
+# corta; el Optimizador lleva la cuenta de cuántos cuádruplos quitó
+# cada pase.
+#
+# Pases (en este orden):
+# - plegado_constantes: evalúa en compilación las operaciones entre
+#   constantes, quita identidades (x + 0, x * 1, ...) y propaga las
+#   constantes a los cuádruplos siguientes (también el NEG de una
+#   constante, que pasa a ser la constante negativa).
+# - propagacion_copias: (op, a, b, t) (=, t, _, x) -> (op, a, b, x),
+#   y lo mismo con (NEG, a, _, t).
+# - asignaciones_muertas: quita escrituras a una dirección que se
+#   vuelve a escribir en el mismo bloque sin haberse leído.
+# - codigo_inalcanzable: quita lo que sigue a un GOTO hasta el
+#   siguiente destino de salto (también una función que nadie llama).
+# Al final, las constantes que ya ningún cuádruplo lee (las que se
+# plegaron) salen de la tabla y las demás se recorren al inicio de su
+# segmento, para que la MV y el .pobj no carguen constantes muertas.
+# -----------------------------------------------------------------
+from memoria import BASES, ambito_de, tipo_de
+from quad_manager import FilaCuadruplos, Opcode, SIN_OPERANDO, SALTOS, FIN_DE_BLOQUE
+from mapa_fuente import SIN_SPAN
+from maquina_virtual import CODIGOS_OPERADOR, OPERACIONES_BINARIAS, OP_DIV, OP_DIV_ENTERA
+
+# --- 1. Clasificación de Operadores ---
+ARITMETICOS = (Opcode.SUMA, Opcode.RESTA, Opcode.MULT, Opcode.DIV)
+BINARIOS = tuple(codigo for codigo in Opcode if codigo <= Opcode.MENORIG)
+# Leen 'izq' y escriben 'res'
+DE_UN_OPERANDO = (Opcode.ASIG, Opcode.NEG)
+# SALTOS y FIN_DE_BLOQUE vienen de quad_manager: después de FIN_DE_BLOQUE
+# ya no se puede confiar en lo que se sabía de las variables. Los
+# destinos de salto y los líderes de bloque los lleva la FilaCuadruplos.
+
+# Identidades: (operador, lado de la constante, valor) -> el resultado es el otro operando
+IDENTIDADES = {
+    (Opcode.SUMA, 'izq', 0), (Opcode.SUMA, 'der', 0),
+    (Opcode.RESTA, 'der', 0),
+    (Opcode.MULT, 'izq', 1), (Opcode.MULT, 'der', 1),
+    (Opcode.DIV, 'der', 1),
+}
+
+
+def es_constante(direccion):
+    return direccion != SIN_OPERANDO and ambito_de(direccion) == 'constante'
+
+def lecturas(op, izq, der, res):
+    """Direcciones que lee un cuádruplo."""
+    if op in BINARIOS:
+        return (izq, der)
+    if op in DE_UN_OPERANDO or op == Opcode.GOTOF or op == Opcode.PARAM:
+        return (izq,)
+    if op == Opcode.ESCRIBE:
+        return (res,)
+    return ()
+
+def escritura(op, res):
+    """Dirección que escribe un cuádruplo, o None."""
+    if op in BINARIOS or op in DE_UN_OPERANDO:
+        return res
+    return None
+
+
+class Optimizador:
+    def __init__(self, tabla_constantes):
+        """
+        'tabla_constantes' es la TablaConstantes del QuadManager; el
+        plegado registra ahí los valores que calcula.
+        """
+        self.tabla_constantes = tabla_constantes
+        self.estadisticas = {}  # {nombre del pase: cuádruplos eliminados}
+        self.antes = 0
+        self.despues = 0
+        self.reubicacion = []  # Del último pase: [nuevo índice] por índice original
+        self.constantes_eliminadas = 0
+
+    def optimizar(self, fila, dir_funciones=None):
+        """
+        Aplica todos los pases en orden y devuelve la fila resultante.
+        Con 'dir_funciones', el 'inicio' de cada función se reubica
+        igual que los saltos.
+        """
+        self.antes = len(fila)
+        for nombre, pase in (
+            ('plegado_constantes', self.plegado_constantes),
+            ('propagacion_copias', self.propagacion_copias),
+            ('asignaciones_muertas', self.asignaciones_muertas),
+            ('codigo_inalcanzable', self.codigo_inalcanzable),
+        ):
+            antes = len(fila)
+            fila = pase(fila)
+            self.estadisticas[nombre] = self.estadisticas.get(nombre, 0) + antes - len(fila)
+            if dir_funciones is not None:
+                for datos in dir_funciones.functions.values():
+                    if datos['inicio'] is not None:
+                        datos['inicio'] = self.reubicacion[datos['inicio']]
+        self.despues = len(fila)
+        self.compactar_constantes(fila)
+        return fila
+
+    def reporte(self):
+        """Resumen legible de las estadísticas por pase."""
+        output = "--- Optimización de Cuádruplos ---\n"
+        for nombre, eliminados in self.estadisticas.items():
+            output += f"  {nombre}: {eliminados} cuádruplos eliminados\n"
+        output += f"  Total: {sum(self.estadisticas.values())} ({self.antes} -> {self.despues} cuádruplos)\n"
+        output += f"  Constantes sin uso eliminadas: {self.constantes_eliminadas}\n"
+        output += "----------------------------------"
+        return output
+
+    # --- Pase: Plegado y Propagación de Constantes ---
+
+    def plegado_constantes(self, fila):
+        """
+        Recorre la fila una vez, dentro de cada bloque básico:
+        - (op, c1, c2, t) con c1, c2 constantes -> se elimina; t vale la constante.
+        - (op, x, 0, t) y similares -> se elimina; t es un alias de x.
+        - (=, c, _, x) -> se conserva, pero los usos siguientes de x leen c.
+        """
+        constantes = self.tabla_constantes.valores
+        destinos = fila.destinos
+        valor = {}   # {dirección: dirección de la constante que contiene}
+        alias = {}   # {temporal eliminado: dirección a la que equivale}
+        nueva = []   # Tuplas (op, izq, der, res, índice original)
+
+        def sustituir(direccion):
+            # Cada temporal se lee una sola vez: al usarlo, se olvida
+            if direccion in alias:
+                direccion = alias.pop(direccion)
+            if direccion in valor:
+                if ambito_de(direccion) == 'temporal':
+                    return valor.pop(direccion)
+                return valor[direccion]
+            return direccion
+
+        for i, (op, izq, der, res) in enumerate(zip(fila.operadores, fila.izquierdos,
+                                                     fila.derechos, fila.resultados)):
+            if i in destinos:
+                # Se puede llegar aquí por un salto: lo sabido ya no aplica
+                self._materializar_alias(alias, None, nueva)
+                valor.clear()
+
+            if op in BINARIOS or op in DE_UN_OPERANDO or op == Opcode.GOTOF or op == Opcode.PARAM:
+                izq = sustituir(izq)
+            if op in BINARIOS:
+                der = sustituir(der)
+            if op == Opcode.ESCRIBE:
+                res = sustituir(res)
+
+            # Escribir en 'res' invalida lo que se sabía de esa dirección
+            escribe = op in BINARIOS or op in DE_UN_OPERANDO
+            if escribe:
+                self._materializar_alias(alias, res, nueva)
+                valor.pop(res, None)
+                alias.pop(res, None)
+
+            plegado = None
+            if op in ARITMETICOS and es_constante(izq) and es_constante(der):
+                plegado = self._plegar(op, constantes[izq], constantes[der], tipo_de(res))
+            elif op == Opcode.NEG and es_constante(izq):
+                plegado = self.tabla_constantes.obtener_direccion(-constantes[izq], tipo_de(res))
+            if plegado is not None:
+                valor[res] = plegado
+                if ambito_de(res) == 'temporal':
+                    continue
+                # Una variable sí debe quedar escrita en memoria
+                op, izq, der = Opcode.ASIG, plegado, SIN_OPERANDO
+
+            if op in ARITMETICOS and ambito_de(res) == 'temporal':
+                otro = self._identidad(op, izq, der, res, constantes)
+                if otro is not None:
+                    alias[res] = otro
+                    continue
+
+            if op == Opcode.ASIG and es_constante(izq):
+                if tipo_de(izq) != tipo_de(res):
+                    # flotante = entero: la constante se promueve una sola vez
+                    izq = self.tabla_constantes.obtener_direccion(float(constantes[izq]), 'flotante')
+                valor[res] = izq
+
+            if op in FIN_DE_BLOQUE:
+                self._materializar_alias(alias, None, nueva)
+                valor.clear()
+
+            nueva.append((op, izq, der, res, i))
+
+        self._materializar_alias(alias, None, nueva)
+        return self._reconstruir(fila, nueva)
+
+    # --- Pase: Propagación de Copias ---
+
+    def propagacion_copias(self, fila):
+        """
+        El parser genera '(op, a, b, t) (=, t, _, x)' para cada asignación.
+        Si 't' no se vuelve a leer, el primer cuádruplo escribe
+        directamente en 'x' y el '=' desaparece. También quita '(=, x, _, x)'.
+        """
+        quads = self._tuplas(fila)
+        lideres = fila.lideres
+        nueva = []
+        i = 0
+        while i < len(quads):
+            op, izq, der, res = quads[i]
+            if op == Opcode.ASIG and izq == res:
+                i += 1
+                continue
+            if (op in BINARIOS or op == Opcode.NEG) and i + 1 < len(quads) and i + 1 not in lideres:
+                op2, izq2, _, res2 = quads[i + 1]
+                if (op2 == Opcode.ASIG and izq2 == res and ambito_de(res) == 'temporal'
+                        and tipo_de(res) == tipo_de(res2)
+                        and not self._se_lee_despues(quads, i + 2, res, lideres)):
+                    nueva.append((op, izq, der, res2, i))
+                    i += 2
+                    continue
+            nueva.append((op, izq, der, res, i))
+            i += 1
+        return self._reconstruir(fila, nueva)
+
+    # --- Pase: Asignaciones Muertas ---
+
+    def asignaciones_muertas(self, fila):
+        """
+        Recorre cada bloque básico de abajo hacia arriba. Una escritura a
+        una dirección que más abajo (en el mismo bloque) se vuelve a
+        escribir sin leerse antes, está muerta. Al salir de un bloque
+        todo se considera vivo, porque otro bloque o función puede leerlo.
+        """
+        quads = self._tuplas(fila)
+        lideres = fila.lideres
+        constantes = self.tabla_constantes.valores
+        vivos = [True] * len(quads)
+        sobrescritas = set()
+        for i in range(len(quads) - 1, -1, -1):
+            op, izq, der, res = quads[i]
+            if op in FIN_DE_BLOQUE or i + 1 in lideres:
+                sobrescritas.clear()
+
+            destino = escritura(op, res)
+            if destino is not None and destino in sobrescritas and not self._puede_fallar(op, der, constantes):
+                vivos[i] = False
+                continue
+            if destino is not None:
+                sobrescritas.add(destino)
+            for direccion in lecturas(op, izq, der, res):
+                sobrescritas.discard(direccion)
+
+        nueva = [quad + (i,) for i, quad in enumerate(quads) if vivos[i]]
+        return self._reconstruir(fila, nueva)
+
+    # --- Pase: Código Inalcanzable ---
+
+    def codigo_inalcanzable(self, fila):
+        """
+        Después de un GOTO (incondicional) solo se puede llegar a un
+        cuádruplo si algún salto lo tiene como destino.
+        """
+        quads = self._tuplas(fila)
+        destinos = fila.destinos
+        nueva = []
+        alcanzable = True
+        for i, quad in enumerate(quads):
+            if i in destinos:
+                alcanzable = True
+            if alcanzable:
+                nueva.append(quad + (i,))
+            if quad[0] == Opcode.GOTO:
+                alcanzable = False
+        return self._reconstruir(fila, nueva)
+
+    # --- Compactación de la Tabla de Constantes ---
+
+    def compactar_constantes(self, fila):
+        """
+        Quita de la tabla las constantes que ningún cuádruplo lee y
+        recorre las que quedan al inicio de su segmento, en el mismo
+        orden. Cambia la fila y la tabla en su lugar.
+        """
+        tabla = self.tabla_constantes
+        columnas = (fila.izquierdos, fila.derechos, fila.resultados)
+        # [(columna, posición)] de cada lectura de una constante
+        lecturas_constantes = []
+        for i, op in enumerate(fila.operadores):
+            operandos = (fila.izquierdos[i], fila.derechos[i], fila.resultados[i])
+            leidas = lecturas(op, *operandos)
+            for columna, direccion in zip(columnas, operandos):
+                if direccion in leidas and es_constante(direccion):
+                    lecturas_constantes.append((columna, i))
+        usadas = {columna[i] for columna, i in lecturas_constantes}
+
+        nueva = {}  # {dirección anterior: dirección nueva}
+        direcciones = {}
+        valores = {}
+        contadores = {}
+        for llave, direccion in tabla.direcciones.items():
+            if direccion not in usadas:
+                continue
+            segmento = ('constante', llave[1])
+            contadores[segmento] = contadores.get(segmento, 0) + 1
+            nueva[direccion] = BASES[segmento] + contadores[segmento] - 1
+            direcciones[llave] = nueva[direccion]
+            valores[nueva[direccion]] = tabla.valores[direccion]
+
+        self.constantes_eliminadas = len(tabla.valores) - len(valores)
+        for columna, i in lecturas_constantes:
+            columna[i] = nueva[columna[i]]
+        tabla.direcciones, tabla.valores = direcciones, valores
+        for segmento in tabla.memoria.contadores:
+            if segmento[0] == 'constante':
+                tabla.memoria.contadores[segmento] = contadores.get(segmento, 0)
+
+    # --- Auxiliares ---
+
+    def _plegar(self, op, a, b, tipo):
+        """Calcula 'a op b' como lo haría la MV; None si no se debe plegar."""
+        codigo = CODIGOS_OPERADOR[op]
+        if codigo == OP_DIV:
+            if b == 0:
+                return None  # La división entre cero se reporta al ejecutar
+            if tipo == 'entero':
+                codigo = OP_DIV_ENTERA
+        resultado = OPERACIONES_BINARIAS[codigo](a, b)
+        if tipo == 'flotante':
+            resultado = float(resultado)
+        return self.tabla_constantes.obtener_direccion(resultado, tipo)
+
+    @staticmethod
+    def _identidad(op, izq, der, res, constantes):
+        """Si el cuádruplo es una identidad, devuelve el operando equivalente."""
+        if es_constante(der) and (op, 'der', constantes[der]) in IDENTIDADES:
+            otro = izq
+        elif es_constante(izq) and (op, 'izq', constantes[izq]) in IDENTIDADES:
+            otro = der
+        else:
+            return None
+        # 'entero + 0.0' es flotante: no es el mismo valor que el entero
+        return otro if tipo_de(otro) == tipo_de(res) else None
+
+    @staticmethod
+    def _materializar_alias(alias, direccion, nueva):
+        """
+        Antes de sobrescribir 'direccion' (o de terminar el bloque si es
+        None), los temporales eliminados que todavía no se leyeron y que
+        dependían de ella reciben su valor con un cuádruplo '=' explícito.
+        """
+        for temporal, destino in list(alias.items()):
+            if direccion is None or destino == direccion:
+                nueva.append((Opcode.ASIG, destino, SIN_OPERANDO, temporal, None))
+                del alias[temporal]
+
+    @staticmethod
+    def _puede_fallar(op, der, constantes):
+        """Una división solo se puede quitar si el divisor es una constante distinta de 0."""
+        return op == Opcode.DIV and constantes.get(der, 0) == 0
+
+    @staticmethod
+    def _se_lee_despues(quads, inicio, direccion, lideres):
+        """True si 'direccion' se lee desde 'inicio' antes de reescribirse (en el bloque)."""
+        for j in range(inicio, len(quads)):
+            if j in lideres:
+                return False
+            op, izq, der, res = quads[j]
+            if direccion in lecturas(op, izq, der, res):
+                return True
+            if escritura(op, res) == direccion:
+                return False
+            if op in FIN_DE_BLOQUE:
+                return False
+        return False
+
+    @staticmethod
+    def _tuplas(fila):
+        return list(zip(fila.operadores, fila.izquierdos, fila.derechos, fila.resultados))
+
+    def _reconstruir(self, fila, nueva):
+        """
+        Arma la FilaCuadruplos optimizada. 'nueva' trae tuplas
+        (op, izq, der, res, índice original), con None como índice
+        original en los cuádruplos que agregó el pase.
+        Los saltos se reubican: un salto a un cuádruplo eliminado va al
+        siguiente que sobrevivió (la reubicación queda en
+        self.reubicacion). Cada cuádruplo conserva el span de su
+        original; los agregados por el pase no tienen.
+        """
+        reubicacion = [len(nueva)] * (len(fila) + 1)
+        for nuevo_indice, (_, _, _, _, original) in enumerate(nueva):
+            if original is not None:
+                reubicacion[original] = nuevo_indice
+        for original in range(len(fila) - 1, -1, -1):
+            if reubicacion[original] == len(nueva):
+                reubicacion[original] = reubicacion[original + 1]
+        self.reubicacion = reubicacion
+
+        resultado = FilaCuadruplos()
+        for op, izq, der, res, original in nueva:
+            if op in SALTOS:
+                res = reubicacion[res]
+            resultado.agregar(op, izq, der, res, SIN_SPAN if original is None else fila.span(original))
+        return resultado
+
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    from constantes import TablaConstantes
+    from directory import FuncDirectory
+    from parser import compilar
+    from maquina_virtual import MaquinaVirtual
+    from objeto import a_bytes
+
+    def ejecutar(resultado):
+        salida = []
+        mv = MaquinaVirtual(salida=salida.append)
+        mv.cargar(resultado.fila_cuadruplos, resultado.tabla_constantes.valores, None, resultado.dir_funciones)
+        mv.ejecutar()
+        return salida
+
+    def fila_de(quads):
+        fila = FilaCuadruplos()
+        for quad in quads:
+            fila.agregar(*quad)
+        return fila
+
+    def cuadruplos(fila):
+        return [(Opcode(op).simbolo, izq, der, res) for op, izq, der, res in Optimizador._tuplas(fila)]
+
+    tabla = TablaConstantes()
+    uno, dos = tabla.obtener_direccion(1, 'entero'), tabla.obtener_direccion(2, 'entero')
+    nada = SIN_OPERANDO
+
+    # Propagación de copias: (op, a, b, t) (=, t, _, x) -> (op, a, b, x),
+    # también con NEG, y sin '(=, x, _, x)'; un salto al '=' eliminado
+    # va al cuádruplo que le sigue
+    optimizador = Optimizador(tabla)
+    fila = optimizador.propagacion_copias(fila_de([
+        ('+', 1000, 1001, 5000), ('=', 5000, None, 1002),
+        ('=', 1002, None, 1002),
+        ('NEG', 1000, None, 5000), ('=', 5000, None, 1001),
+        ('ESCRIBE', None, None, 1001), ('GOTO', None, None, 2),
+    ]))
+    assert cuadruplos(fila) == [('+', 1000, 1001, 1002), ('NEG', 1000, nada, 1001),
+                                ('ESCRIBE', nada, nada, 1001), ('GOTO', nada, nada, 1)]
+    assert optimizador.reubicacion == [0, 1, 1, 1, 2, 2, 3, 4]
+    # ... pero no si el temporal se vuelve a leer, si el '=' es destino
+    # de un salto, o si el '=' promueve a flotante
+    quads = [('*', 1000, 1001, 5000), ('=', 5000, None, 1002), ('ESCRIBE', None, None, 5000),
+             ('-', 1000, 1001, 5000), ('=', 5000, None, 1002), ('GOTOF', 7000, None, 4),
+             ('+', 1000, 1001, 5000), ('=', 5000, None, 2000)]
+    assert cuadruplos(optimizador.propagacion_copias(fila_de(quads))) == cuadruplos(fila_de(quads))
+
+    # Asignaciones muertas: una escritura que se vuelve a escribir sin
+    # leerse en el mismo bloque se quita, pero no si otro bloque la puede
+    # leer (la de 1000 antes del GOTOF se lee en el destino del salto) ni
+    # si es una división que puede fallar
+    fila = optimizador.asignaciones_muertas(fila_de([
+        ('=', uno, None, 1001), ('=', dos, None, 1001),
+        ('=', uno, None, 1000), ('GOTOF', 7000, None, 5), ('=', dos, None, 1000),
+        ('ESCRIBE', None, None, 1000),
+        ('/', 1000, 1001, 1002), ('=', uno, None, 1002), ('+', 1000, uno, 1003), ('=', dos, None, 1003),
+    ]))
+    assert cuadruplos(fila) == [
+        ('=', dos, nada, 1001), ('=', uno, nada, 1000), ('GOTOF', 7000, nada, 4), ('=', dos, nada, 1000),
+        ('ESCRIBE', nada, nada, 1000), ('/', 1000, 1001, 1002), ('=', uno, nada, 1002), ('=', dos, nada, 1003),
+    ]
+
+    # Código inalcanzable: lo que sigue a un GOTO hasta el siguiente
+    # destino de salto; los saltos se reubican
+    fila = optimizador.codigo_inalcanzable(fila_de([
+        ('GOTO', None, None, 3), ('ESCRIBE', None, None, 1000), ('ESCRIBE', None, None, 1001),
+        ('ESCRIBE', None, None, 1002), ('GOTOF', 7000, None, 6), ('GOTO', None, None, 3),
+        ('ESCRIBE', None, None, 1003),
+    ]))
+    assert cuadruplos(fila) == [
+        ('GOTO', nada, nada, 1), ('ESCRIBE', nada, nada, 1002), ('GOTOF', 7000, nada, 4),
+        ('GOTO', nada, nada, 1), ('ESCRIBE', nada, nada, 1003),
+    ]
+    copia = fila_de(cuadruplos(fila))  # Su índice se arma al agregar
+    assert (fila.destinos, fila.lideres) == (copia.destinos, copia.lideres)
+
+    # El 'inicio' de cada función (y el del principal) se reubica como
+    # los saltos cuando los pases quitan cuádruplos antes de él
+    funciones = FuncDirectory()
+    funciones.add_func('f', 'nula')
+    funciones.registrar_inicio('f', 2)
+    funciones.registrar_inicio('global', 5)
+    fila = Optimizador(tabla).optimizar(fila_de([
+        ('=', 1000, None, 1000), ('GOTO', None, None, 5),
+        ('+', 3000, uno, 5000), ('=', 5000, None, 3000), ('ENDFUNC', None, None, None),
+        ('ERA', 1, None, None), ('GOSUB', 1, None, 2),
+    ]), funciones)
+    assert cuadruplos(fila) == [('GOTO', nada, nada, 3), ('+', 3000, uno, 3000), ('ENDFUNC', nada, nada, nada),
+                                ('ERA', 1, nada, nada), ('GOSUB', 1, nada, 1)]
+    assert (funciones.functions['f']['inicio'], funciones.functions['global']['inicio']) == (1, 3)
+
+    def constantes_leidas(fila):
+        return {direccion for op, izq, der, res in zip(fila.operadores, fila.izquierdos,
+                                                       fila.derechos, fila.resultados)
+                for direccion in lecturas(op, izq, der, res) if es_constante(direccion)}
+
+    # Compactación de constantes: las plegadas salen de la tabla, las que
+    # quedan se recorren al inicio de su segmento y el .pobj se achica
+    fuente = '''programa p;
+vars a, b : entero; x : flotante;
+inicio {
+  a = 4 * 2; b = a + 5 * 3; x = 1.5 + 2.0 * b;
+  escribe(a / 5, b - 5, 7 - 7, "fin");
+  x = x * 1.5;
+} fin'''
+    completo = compilar(fuente)
+    optimizado = compilar(fuente, optimizar=True)
+    assert ejecutar(optimizado) == ejecutar(completo) == [1, 18, 0, "fin"]
+    constantes = optimizado.tabla_constantes
+    assert sorted(constantes.valores.values(), key=str) == sorted([8, 23, 1, 18, 0, 71.25, "fin"], key=str)
+    assert set(constantes.valores) == constantes_leidas(optimizado.fila_cuadruplos)
+    assert sorted(constantes.valores) == [8000, 8001, 8002, 8003, 8004, 9000, 10000]
+    # Las 7 del fuente que se plegaron (4, 2, 5, 3, 1.5, 2.0 y 7) y los
+    # resultados intermedios (15, 46.0 y 47.5)
+    assert optimizado.optimizador.constantes_eliminadas == 10
+    assert {direccion: valor for (valor, _), direccion in constantes.direcciones.items()} == constantes.valores
+    assert constantes.memoria.contadores[('constante', 'entero')] == 5
+    objeto = a_bytes(optimizado.dir_funciones, constantes, optimizado.fila_cuadruplos)
+    assert len(objeto) < len(a_bytes(completo.dir_funciones, completo.tabla_constantes, completo.fila_cuadruplos))
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de optimizador.py: OK")
@@ -11,19 +11,62 @@
 import ply.yacc as yacc
 import sys
 
-# --- 1. NUEVOS IMPORTS Y GLOBALES DE SEMÁNTICA ---
+# --- 1. IMPORTS ---
 
 # Importa TODO de lexer.py (tokens)
 from lexer import *
 # Importamos nuestras clases de semántica
-from directory import FuncDirectory
-from semantic_cube import cubo_semantico
-# ===== ¡NUEVO IMPORT! =====
-from quad_manager import quad_manager # Importamos nuestro manejador
+from memoria import AsignadorMemoria
+from directory import FuncDirectory, DESCARTADA
+from quad_manager import QuadManager
+from mapa_fuente import MapaFuente, SIN_SPAN, span_token
+from diagnosticos import Diagnostico, SINTACTICO, SEMANTICO, reporte_errores
+from identificadores import TablaIdentificadores
+from quad_manager import TIPO_ERROR, OPCODES
+from semantic_cube import CODIGO_TIPO
+
+import copy
+import os
+import time
+
+# NOTA: Ya no hay estado global de semántica. Cada compilación tiene
+# su propio Compilador (directorio, quad_manager y ámbito actual; ver
+# sección 5), y los Puntos Neurálgicos lo encuentran en
+# 'p.parser.compilador'.
+#
+# Los errores NO detienen la compilación: se juntan como Diagnosticos
+# (ver diagnosticos.py) y el análisis sigue para encontrar los demás.
+
+class ErrorCompilacion(Exception):
+    """Error que detiene una compilación (solo fuera de un Compilador, ver p_error)."""
+    pass
 
-# --- Instancias Globales para Semántica ---
-dir_general = FuncDirectory() # Nuestra instancia principal del Directorio
-ambito_actual = 'global'      # Para saber en qué función estamos
+def span_regla(p, token=None):
+    """
+    Span para los mensajes de error de una regla: el de 'token' si se da
+    o, si no, el del primer token de la regla. Si la regla es vacía (un
+    Punto Neurálgico) o solo tiene no terminales, el del último token
+    que se leyó (el más alto en la pila del parser).
+    """
+    if token is None:
+        for simbolo in p.slice[1:] + p.stack[::-1]:
+            if hasattr(simbolo, 'lexpos'):
+                token = simbolo
+                break
+    return SIN_SPAN if token is None else span_token(token)
+
+def error_semantico(p, e, token=None, span=None):
+    """
+    Guarda el error semántico 'e' en la compilación, con su línea y
+    columna (calculadas aquí con el MapaFuente, no al leer cada token),
+    y deja que el análisis continúe. Se ubica en 'span' si se da (ej.
+    el de una expresión) o, si no, en el de span_regla().
+    """
+    comp = p.parser.compilador
+    if span is None:
+        span = span_regla(p, token)
+    mensaje = f"Error en {comp.mapa_fuente.ubicacion(span)}: {e}"
+    comp.errores.append(Diagnostico(mensaje, SEMANTICO, span))
 
 # -----------------------------------------------------------
 # 2. PRECEDENCIA DE OPERADORES (Sin cambios)
@@ -43,17 +86,24 @@ precedence = (
 start = 'programa'
 
 def p_programa(p):
-    'programa : PROGRAMA ID pn_programa_inicio PTOCOMA vars_opcional funcs_opcional INICIO cuerpo FIN'
-    print("¡Sintaxis de 'programa' correcta!")
-    
+    'programa : PROGRAMA ID pn_programa_inicio PTOCOMA vars_opcional funcs_opcional INICIO pn_principal cuerpo FIN'
     # La impresión del directorio y cuádruplos se hace en __main__
-    pass
+    comp = p.parser.compilador
+    # Los temporales del cuerpo principal (el 'global' no tiene locales)
+    comp.dir_general.registrar_recursos('global')
 
 def p_pn_programa_inicio(p):
     'pn_programa_inicio :'
     # El ámbito 'global' ya fue creado en el constructor de FuncDirectory.
     pass
 
+def p_pn_principal(p):
+    'pn_principal :'
+    comp = p.parser.compilador
+    # El GOTO que brinca las funciones llega al cuerpo principal
+    comp.quad_manager.rellenar_salto_principal()
+    comp.dir_general.registrar_inicio('global', len(comp.quad_manager.fila_cuadruplos))
+
 # --- Opcionales (Sin cambios) ---
 def p_vars_opcional(p):
     '''vars_opcional : VARS lista_decl_var
@@ -73,23 +123,29 @@ def p_lista_decl_var(p):
 
 def p_decl_var(p):
     'decl_var : ids DOSPTOS tipo PTOCOMA'
+    comp = p.parser.compilador
     # PN: Al final de la regla, registramos las variables
-    lista_ids = p[1]
+    lista_ids = p[1]  # Tokens ID, para ubicar el error en el que falle
     tipo_var = p[3]
-    try:
-        for id_var in lista_ids:
-            dir_general.add_var_to_func(ambito_actual, id_var, tipo_var)
-    except Exception as e:
-        print(f"Error en línea {p.lineno(1)}: {e}")
-        sys.exit()
+    for token_id in lista_ids:
+        try:
+            comp.dir_general.add_var_to_func(comp.ambito_actual, token_id.value, tipo_var,
+                                           linea=token_id.lineno)
+        except Exception as e:
+            error_semantico(p, e, token_id)
+
+def p_decl_var_error(p):
+    'decl_var : error PTOCOMA'
+    # Recuperación: se descarta la declaración hasta su ';'
+    pass
 
 def p_ids(p):
     '''ids : ID
            | ids COMA ID'''
     if len(p) == 2:
-        p[0] = [p[1]] 
+        p[0] = [p.slice[1]] 
     else:
-        p[1].append(p[3]) 
+        p[1].append(p.slice[3]) 
         p[0] = p[1]
 
 def p_tipo(p):
@@ -104,26 +160,47 @@ def p_lista_funcs(p):
     pass
 
 def p_func_def(p):
-    'func_def : tipo_retorno pn_func_inicio ID LPAREN params RPAREN LBRACE vars_opcional cuerpo RBRACE pn_func_fin PTOCOMA'
+    'func_def : tipo_retorno ID pn_func_inicio LPAREN params RPAREN LBRACE vars_opcional cuerpo RBRACE pn_func_fin PTOCOMA'
     pass
 
+def p_func_def_error(p):
+    'func_def : tipo_retorno error PTOCOMA'
+    # Recuperación: un encabezado de función mal escrito (o una
+    # declaración de variable como 'entero x;') se descarta hasta su ';'
+    comp = p.parser.compilador
+    comp.ambito_actual = 'global'
+    comp.dir_general.memoria.reiniciar_locales()
+
 def p_pn_func_inicio(p):
     'pn_func_inicio :'
-    global ambito_actual
-    tipo_retorno = p[-1]
-    nombre_func = p.slice[1].value 
+    comp = p.parser.compilador
+    # Va después del ID: antes de leerlo el nombre todavía no se conoce
+    tipo_retorno = p[-2]
+    nombre_func = p[-1]
     
     try:
-        dir_general.add_func(nombre_func, tipo_retorno)
-        ambito_actual = nombre_func
+        comp.dir_general.add_func(nombre_func, tipo_retorno)
+        comp.ambito_actual = nombre_func
+        # Su código empieza aquí (parámetros y variables no generan cuádruplos)
+        comp.quad_manager.generar_salto_principal()
+        comp.dir_general.registrar_inicio(nombre_func, len(comp.quad_manager.fila_cuadruplos))
     except Exception as e:
-        print(f"Error en línea {p.lineno(1)}: {e}")
-        sys.exit()
+        error_semantico(p, e, p.stack[-1])
+        # El cuerpo se sigue revisando, pero en un ámbito aparte: sus
+        # parámetros y variables no deben caer en el global
+        comp.dir_general.descartar_func(tipo_retorno)
+        comp.ambito_actual = DESCARTADA
 
 def p_pn_func_fin(p):
     'pn_func_fin :'
-    global ambito_actual
-    ambito_actual = 'global'
+    comp = p.parser.compilador
+    if comp.ambito_actual not in ('global', DESCARTADA):
+        # Regreso al llamador, y el tamaño de su registro de activación
+        comp.quad_manager.agregar_cuadruplo('ENDFUNC', None, None, None)
+        comp.dir_general.registrar_recursos(comp.ambito_actual)
+    comp.ambito_actual = 'global'
+    # Los temporales del cuerpo principal empiezan de nuevo
+    comp.dir_general.memoria.reiniciar_locales()
 
 def p_tipo_retorno(p):
     '''tipo_retorno : tipo
@@ -142,15 +219,16 @@ def p_lista_params(p):
 
 def p_pn_param(p):
     'pn_param :'
+    comp = p.parser.compilador
     tipo_param = p[-1]
-    nombre_param = p[-3]
+    token_param = p.stack[-3]
     
     try:
-        dir_general.add_var_to_func(ambito_actual, nombre_param, tipo_param)
-        dir_general.add_param_to_func(ambito_actual, tipo_param)
+        comp.dir_general.add_var_to_func(comp.ambito_actual, token_param.value, tipo_param,
+                                         'parametro', token_param.lineno)
+        comp.dir_general.add_param_to_func(comp.ambito_actual, tipo_param)
     except Exception as e:
-        print(f"Error en línea {p.lineno(1)}: {e}")
-        sys.exit()
+        error_semantico(p, e)
 
 # --- <CUERPO> y <ESTATUTO> ---
 def p_cuerpo(p):
@@ -185,29 +263,39 @@ def p_asigna(p):
 
 def p_pn_gen_quad_asig(p):
     'pn_gen_quad_asig :'
+    comp = p.parser.compilador
     # PN: Generar cuádruplo de asignación
     try:
-        # 1. Pop el resultado de la expresión
-        resultado_expr = quad_manager.pila_operandos.pop()
-        tipo_expr = quad_manager.pila_tipos.pop()
+        # 1. Pop el resultado de la expresión (su temporal queda libre).
+        # Un '-' pendiente no se genera aún: 'x = -y' es un solo NEG
+        resultado_expr, tipo_expr, span_expr, negado = comp.quad_manager.pop_operando_con_signo()
         
         # 2. Pop el operador de asignación '='
-        operador = quad_manager.pila_operadores.pop() # Debería ser '='
+        operador = comp.quad_manager.pila_operadores.pop() # Debería ser '='
         
         # 3. Get el operando de la variable (el ID)
         # Lo tomamos del parser, p[-5] es el ID
-        id_var = p[-5]
-        tipo_var = dir_general.lookup_var_in_func(ambito_actual, id_var)
+        token_id = p.stack[-5]
+        var = comp.dir_general.lookup_var_entry_in_func(comp.ambito_actual, token_id.value, token_id.simbolo)
         
-        # 4. Validar asignación con Cubo Semántico
-        cubo_semantico.lookup(tipo_var, tipo_expr, operador)
+        # 4. Validar asignación con Cubo Semántico (si la expresión ya
+        # tuvo un error, ese ya se reportó)
+        if tipo_expr == TIPO_ERROR:
+            return
+        comp.quad_manager.cubo.lookup_codigo(CODIGO_TIPO[var.tipo], CODIGO_TIPO[tipo_expr], OPCODES[operador])
         
-        # 5. Generar cuádruplo
-        quad_manager.agregar_cuadruplo(operador, resultado_expr, None, id_var)
+        # 5. Generar cuádruplo (sobre la dirección de la variable).
+        # Su span va del ID al final de la expresión
+        span = (token_id.lexpos, span_expr[1])
+        if negado and var.tipo != tipo_expr:
+            # flotante = -entero: primero el NEG y luego la promoción
+            resultado_expr = comp.quad_manager.generar_neg(resultado_expr, tipo_expr, span_expr)
+            comp.quad_manager.liberar_temporal(resultado_expr)
+            negado = False
+        comp.quad_manager.agregar_cuadruplo('NEG' if negado else operador, resultado_expr, None, var.direccion, span)
         
     except Exception as e:
-        print(f"Error en línea {p.lineno(1)}: {e}")
-        sys.exit()
+        error_semantico(p, e, p.stack[-5])
 
 def p_imprime(p):
     'imprime : ESCRIBE pn_push_operador LPAREN lista_imprime RPAREN PTOCOMA'
@@ -223,51 +311,107 @@ def p_item_imprime(p):
     '''item_imprime : expresion
                     | LETRERO       
                     | LETRERO_KW'''
+    comp = p.parser.compilador
     # Si es 'expresion', se resuelve y deja el resultado en PilaO/PilaT
     # Si es LETRERO/LETRERO_KW, lo metemos a las pilas manualmente
     if p.slice[1].type != 'expresion':
         # p[1] es el string "hola" o la palabra "letrero"
-        quad_manager.push_operando_tipo(p[1], 'letrero') # Usamos 'letrero' como tipo
+        # Se guarda como constante (sin las comillas) y se mete su dirección
+        valor = p[1][1:-1] if p.slice[1].type == 'LETRERO' else p[1]
+        direccion = comp.quad_manager.generar_constante(valor, 'letrero')
+        comp.quad_manager.push_operando_tipo(direccion, 'letrero', span_token(p.slice[1])) # Usamos 'letrero' como tipo
         
 def p_pn_gen_quad_imprime(p):
     'pn_gen_quad_imprime :'
+    comp = p.parser.compilador
     try:
-        # 1. Pop el resultado
-        resultado = quad_manager.pila_operandos.pop()
-        quad_manager.pila_tipos.pop() # Pop el tipo, no lo usamos
+        # 1. Pop el resultado (el tipo no lo usamos)
+        resultado, tipo, span = comp.quad_manager.pop_operando_tipo_span()
         
         # 2. Generar cuádruplo
         # El operador 'ESCRIBE' debe estar en el fondo de la pila
-        quad_manager.agregar_cuadruplo('ESCRIBE', None, None, resultado)
+        if tipo != TIPO_ERROR:
+            comp.quad_manager.agregar_cuadruplo('ESCRIBE', None, None, resultado, span)
     except Exception as e:
-        print(f"Error en línea {p.lineno(1)}: {e}")
-        sys.exit()
+        error_semantico(p, e)
 
 def p_condicion(p):
-    '''condicion : SI LPAREN expresion RPAREN cuerpo PTOCOMA
-                 | SI LPAREN expresion RPAREN cuerpo SINO cuerpo PTOCOMA'''
-    # Se elimina la lógica de Etapa 2.
-    # Esta lógica (saltos) se implementará en la Etapa 4.
+    '''condicion : SI LPAREN expresion RPAREN pn_gotof cuerpo pn_fin_si PTOCOMA
+                 | SI LPAREN expresion RPAREN pn_gotof cuerpo SINO pn_sino cuerpo pn_fin_si PTOCOMA'''
+    # (GOTOF, cond, _, fin) bloque [(GOTO, _, _, fin) bloque del sino]
     pass
 
 def p_ciclo(p):
-    'ciclo : MIENTRAS LPAREN expresion RPAREN HAZ cuerpo PTOCOMA'
-    # Se elimina la lógica de Etapa 2.
-    # Esta lógica (saltos) se implementará en la Etapa 4.
+    'ciclo : MIENTRAS pn_inicio_ciclo LPAREN expresion RPAREN pn_gotof HAZ cuerpo pn_fin_mientras PTOCOMA'
+    # inicio: condición (GOTOF, cond, _, fin) bloque (GOTO, _, _, inicio) fin:
     pass
 
+def p_pn_gotof(p):
+    'pn_gotof :'
+    comp = p.parser.compilador
+    # La condición ya dejó su resultado en las pilas
+    try:
+        comp.quad_manager.generar_gotof()
+    except Exception as e:
+        error_semantico(p, e, p.stack[-1])
+
+def p_pn_sino(p):
+    'pn_sino :'
+    comp = p.parser.compilador
+    # p.stack[-1] es el token SINO
+    comp.quad_manager.generar_sino(span_token(p.stack[-1]))
+
+def p_pn_fin_si(p):
+    'pn_fin_si :'
+    comp = p.parser.compilador
+    comp.quad_manager.cerrar_si()
+
+def p_pn_inicio_ciclo(p):
+    'pn_inicio_ciclo :'
+    comp = p.parser.compilador
+    comp.quad_manager.marcar_inicio_ciclo()
+
+def p_pn_fin_mientras(p):
+    'pn_fin_mientras :'
+    comp = p.parser.compilador
+    # El GOTO de regreso se ubica en el 'mientras' (p.stack[-8])
+    comp.quad_manager.cerrar_mientras(span_token(p.stack[-8]))
+
 def p_llamada(p):
-    '''llamada : ID LPAREN RPAREN
-               | ID LPAREN lista_args RPAREN'''
-    # Se elimina la lógica de Etapa 2.
-    # (PENDIENTE: Generar cuádruplos de llamada (ERA, PARAM, GO_SUB))
-    pass
+    '''llamada : ID pn_era LPAREN RPAREN
+               | ID pn_era LPAREN lista_args RPAREN'''
+    # (ERA, f, _, _) [(PARAM, arg, _, k) ...] (GOSUB, f, _, inicio de f)
+    comp = p.parser.compilador
+    span = (p.slice[1].lexpos, span_token(p.slice[-1])[1])
+    p[0] = (p[1], span)
+    try:
+        comp.quad_manager.terminar_llamada(span)
+    except Exception as e:
+        error_semantico(p, e, p.slice[1])
+
+def p_pn_era(p):
+    'pn_era :'
+    comp = p.parser.compilador
+    # p.stack[-1] es el ID de la función
+    token_id = p.stack[-1]
+    entrada = None
+    try:
+        comp.dir_general.lookup_func(token_id.value)
+        entrada = comp.dir_general.functions[token_id.value]
+    except Exception as e:
+        error_semantico(p, e, token_id)
+    comp.quad_manager.iniciar_llamada(token_id.value, entrada, span_token(token_id))
 
 def p_lista_args(p):
     '''lista_args : expresion
                   | lista_args COMA expresion'''
-    # (PENDIENTE: Generar cuádruplos PARAM)
-    pass
+    comp = p.parser.compilador
+    # El argumento ya dejó su resultado (y su span) en las pilas
+    span = comp.quad_manager.pila_spans[-1]
+    try:
+        comp.quad_manager.generar_argumento()
+    except Exception as e:
+        error_semantico(p, e, span=span)
 
 # --- <EXPRESIÓN> (Nivel 4: Relacional) - MODIFICADO para Etapa 3 ---
 
@@ -278,16 +422,16 @@ def p_expresion(p):
 
 def p_pn_expresion_relacional(p):
     'pn_expresion_relacional : OPREL pn_push_operador exp'
+    comp = p.parser.compilador
     # Este PN se ejecuta *después* de que 'exp' (p[3]) ha sido procesada
     # y ha dejado su resultado en las pilas.
     try:
         # Verificamos si el operador en el tope es relacional
-        if quad_manager.pila_operadores:
-            if quad_manager.pila_operadores[-1] in ('>', '<', '==', '!=', '>=', '<='):
-                quad_manager.generar_cuadruplo_expresion()
+        if comp.quad_manager.pila_operadores:
+            if comp.quad_manager.pila_operadores[-1] in ('>', '<', '==', '!=', '>=', '<='):
+                comp.quad_manager.generar_cuadruplo_expresion()
     except Exception as e:
-        print(f"Error en línea {p.lineno(1)}: {e}")
-        sys.exit()
+        error_semantico(p, e)
 
 def p_oprel(p):
     '''OPREL : MAYOR
@@ -315,14 +459,14 @@ def p_pn_push_op_aditivo(p):
 
 def p_pn_check_op_aditivo(p):
     'pn_check_op_aditivo :'
+    comp = p.parser.compilador
     # PN para verificar si hay sumas o restas pendientes
     try:
-        if quad_manager.pila_operadores:
-            if quad_manager.pila_operadores[-1] in ('+', '-'):
-                quad_manager.generar_cuadruplo_expresion()
+        if comp.quad_manager.pila_operadores:
+            if comp.quad_manager.pila_operadores[-1] in ('+', '-'):
+                comp.quad_manager.generar_cuadruplo_expresion()
     except Exception as e:
-        print(f"Error en línea {p.lineno(1)}: {e}")
-        sys.exit()
+        error_semantico(p, e)
 
 # --- <TÉRMINO> (Nivel 2: Multiplicativo) - MODIFICADO para Etapa 3 ---
 
@@ -338,14 +482,14 @@ def p_pn_push_op_mult(p):
 
 def p_pn_check_op_mult(p):
     'pn_check_op_mult :'
+    comp = p.parser.compilador
     # PN para verificar si hay mult/div pendientes
     try:
-        if quad_manager.pila_operadores:
-            if quad_manager.pila_operadores[-1] in ('*', '/'):
-                quad_manager.generar_cuadruplo_expresion()
+        if comp.quad_manager.pila_operadores:
+            if comp.quad_manager.pila_operadores[-1] in ('*', '/'):
+                comp.quad_manager.generar_cuadruplo_expresion()
     except Exception as e:
-        print(f"Error en línea {p.lineno(1)}: {e}")
-        sys.exit()
+        error_semantico(p, e)
 
 # --- <FACTOR> (Nivel 1: Base) - MODIFICADO para Etapa 3 ---
 
@@ -355,58 +499,92 @@ def p_factor_agrupacion(p):
 
 def p_pn_push_paren(p):
     'pn_push_paren :'
-    quad_manager.push_operador('(') # Mete el 'fondo falso'
+    comp = p.parser.compilador
+    comp.quad_manager.push_operador('(') # Mete el 'fondo falso'
 
 def p_pn_pop_paren(p):
     'pn_pop_paren :'
+    comp = p.parser.compilador
     try:
-        quad_manager.pila_operadores.pop() # Saca el 'fondo falso'
+        comp.quad_manager.pila_operadores.pop() # Saca el 'fondo falso'
     except Exception as e:
-        print(f"Error: Desbalance de paréntesis - {e}")
-        sys.exit()
+        error_semantico(p, f"Desbalance de paréntesis - {e}")
 
 def p_factor_unario(p):
     '''factor : MAS factor %prec UMAS
               | MENOS factor %prec UMENOS'''
-    # (PENDIENTE: Lógica de cuádruplos para unarios)
-    pass
+    comp = p.parser.compilador
+    # El operando ya está en las pilas. Una constante a la que
+    # p_factor_cte ya le aplicó toda la cadena de signos (p[2] es True)
+    # no se vuelve a tocar
+    if p[2]:
+        p[0] = True
+        return
+    try:
+        if p[1] == '+':
+            comp.quad_manager.mas_unario(span_token(p.slice[1]))
+        else:
+            comp.quad_manager.negar(span_token(p.slice[1]))
+    except Exception as e:
+        error_semantico(p, e, p.slice[1])
 
 def p_factor_llamada(p):
     'factor : llamada'
-    # (PENDIENTE: Lógica de cuádruplos para llamadas)
-    pass
+    comp = p.parser.compilador
+    # La llamada ya se generó, pero Patito no tiene con qué regresar un
+    # valor: la expresión sigue con un operando de error
+    nombre, span = p[1]
+    comp.quad_manager.push_error(span)
+    error_semantico(p, f"Error Semántico: La función '{nombre}' no regresa un valor; "
+                       f"solo se puede llamar como estatuto.", span=span)
 
 def p_factor_id(p):
     'factor : ID'
+    comp = p.parser.compilador
     # PN: Meter operando y tipo a las pilas
     try:
-        tipo_var = dir_general.lookup_var_in_func(ambito_actual, p[1])
-        quad_manager.push_operando_tipo(p[1], tipo_var)
+        var = comp.dir_general.lookup_var_entry_in_func(comp.ambito_actual, p[1], p.slice[1].simbolo)
+        comp.quad_manager.push_operando_tipo(var.direccion, var.tipo, span_token(p.slice[1]))
     except Exception as e:
-        print(f"Error en línea {p.lineno(1)}: {e}")
-        sys.exit()
+        # La expresión sigue con un operando de error (sin errores en cascada)
+        comp.quad_manager.push_error(span_token(p.slice[1]))
+        error_semantico(p, e)
 
 def p_factor_cte(p):
     'factor : cte'
-    # p[1] es la tupla (valor, tipo) que devuelve p_cte
-    valor, tipo = p[1]
-    quad_manager.push_operando_tipo(valor, tipo)
+    comp = p.parser.compilador
+    # p[1] es la tupla (valor, tipo, span) que devuelve p_cte
+    valor, tipo, span = p[1]
+    # Los signos unarios justo antes (sus tokens MAS/MENOS siguen en la
+    # pila del parser; un binario ya se redujo a pn_push_op_aditivo) se
+    # aplican aquí: en la tabla solo entra la constante ya con su signo
+    signos = 0
+    while signos < len(p.stack) - 1 and p.stack[-1 - signos].type in ('MAS', 'MENOS'):
+        if p.stack[-1 - signos].type == 'MENOS':
+            valor = -valor
+        signos += 1
+    if signos:
+        span = (p.stack[-signos].lexpos, span[1])
+    direccion = comp.quad_manager.generar_constante(valor, tipo)
+    comp.quad_manager.push_operando_tipo(direccion, tipo, span)
+    p[0] = signos > 0
 
 # --- <CTE> (Constantes) - MODIFICADO para Etapa 3 ---
 def p_cte(p):
     '''cte : CTE_ENT
            | CTE_FLOT'''
-    # Devolvemos una tupla (valor, tipo)
+    # Devolvemos una tupla (valor, tipo, span)
     if p.slice[1].type == 'CTE_ENT':
-        p[0] = (p[1], 'entero')
+        p[0] = (p[1], 'entero', span_token(p.slice[1]))
     else:
-        p[0] = (p[1], 'flotante')
+        p[0] = (p[1], 'flotante', span_token(p.slice[1]))
 
 # --- PN General para PUSH de Operadores ---
 def p_pn_push_operador(p):
     'pn_push_operador :'
+    comp = p.parser.compilador
     # p[-1] es el token del operador que llamó a esta regla
-    quad_manager.push_operador(p[-1])
+    comp.quad_manager.push_operador(p[-1])
 
 # --- Regla 'empty' (Sin cambios) ---
 def p_empty(p):
@@ -414,45 +592,291 @@ def p_empty(p):
     pass
 
 # -----------------------------------------------------------
-# 4. MANEJO DE ERRORES DE SINTAXIS (Sin cambios)
+# 4. MANEJO DE ERRORES DE SINTAXIS
 # -----------------------------------------------------------
-def p_error(p):
+def p_estatuto_error(p):
+    'estatuto : error PTOCOMA'
+    # Recuperación: se descarta el estatuto hasta su ';', junto con la
+    # expresión que haya quedado a medias en las pilas
+    p.parser.compilador.quad_manager.limpiar_pilas()
+
+def mensaje_error_sintaxis(p, mapa_fuente=None):
+    if p and mapa_fuente is not None:
+        return f"Error de Sintaxis: Token inesperado '{p.value}' (tipo: {p.type}) en {mapa_fuente.ubicacion(span_token(p))}"
     if p:
-        print(f"Error de Sintaxis: Token inesperado '{p.value}' (tipo: {p.type}) en línea {p.lineno(0)}")
-        parser.errok()
-    else:
-        print("Error de Sintaxis: Fin de archivo inesperado (EOF)")
+        return f"Error de Sintaxis: Token inesperado '{p.value}' (tipo: {p.type}) en línea {p.lineno}"
+    return "Error de Sintaxis: Fin de archivo inesperado (EOF)"
+
+def p_error(p):
+    # Cada Compilador instala su propio manejador (ver _error_sintaxis),
+    # que guarda el error y deja que PLY se recupere con las producciones
+    # 'error'. Este solo se usa si alguien llama a parser.parse() sin un
+    # Compilador.
+    raise ErrorCompilacion(mensaje_error_sintaxis(p))
 
 # -----------------------------------------------------------
-# 5. CONSTRUIR EL PARSER
+# 5. CONSTRUIR EL PARSER Y EL COMPILADOR
 # -----------------------------------------------------------
-parser = yacc.yacc()
+# Las tablas LALR se cargan UNA vez por proceso y las comparten todas
+# las compilaciones (también entre hilos): cada Compilador usa una
+# copia ligera del parser y un clon del lexer con su propio estado.
+def firma_gramatica():
+    """
+    La firma de la gramática como la calcula yacc.yacc(): símbolo
+    inicial, precedencia, tokens y el docstring de cada función p_.
+    Solo lee atributos (sin validar nada), así que cuesta muy poco.
+    """
+    reflexion = yacc.ParserReflect(globals())
+    reflexion.get_all()
+    return reflexion.signature()
+
+def cargar_tablas(modulo='parsetab'):
+    """
+    Las tablas LALR de 'modulo' (nombre o módulo ya importado) si se
+    generaron con la gramática actual; None si no existen, son de otra
+    versión de PLY o la gramática cambió desde que se generaron.
+    """
+    tablas = yacc.LRTable()
+    try:
+        firma = tablas.read_table(modulo)
+    except (ImportError, yacc.VersionError):
+        return None
+    return tablas if firma == firma_gramatica() else None
+
+def construir_parser():
+    """
+    Con TABLAS_CONGELADAS (ver lexer.py) carga parsetab.py directo, sin
+    validar la gramática ni escribir parser.out; solo compara su firma
+    con la de las funciones p_. Si no hay tablas, son de otra gramática,
+    o en modo 'validar', las construye y regenera con yacc.yacc().
+    """
+    if TABLAS_CONGELADAS:
+        tablas = cargar_tablas()
+        if tablas is not None:
+            tablas.bind_callables(globals())
+            return yacc.LRParser(tablas, p_error)
+    return yacc.yacc()
+
+parser = construir_parser()
+# Sin esto PLY reduce los Puntos Neurálgicos vacíos sin ver el siguiente
+# token; al recuperarse de un error de sintaxis los saca de la pila y los
+# vuelve a reducir, una y otra vez (ej. 'flotante z;' tomado como función)
+parser.disable_defaulted_states()
+
+class ResultadoCompilacion:
+    """Lo que produce una compilación: el programa y los errores encontrados."""
+    def __init__(self, dir_funciones, tabla_constantes, fila_cuadruplos, memoria, errores, optimizador=None,
+                 mapa_fuente=None, perfil=None):
+        self.dir_funciones = dir_funciones
+        self.tabla_constantes = tabla_constantes
+        self.fila_cuadruplos = fila_cuadruplos
+        self.memoria = memoria
+        self.errores = errores          # Diagnosticos léxicos, sintácticos y semánticos
+        self.optimizador = optimizador  # Optimizador usado (None si no se optimizó)
+        self.mapa_fuente = mapa_fuente  # Para pasar spans (de cuádruplos) a línea y columna
+        self.perfil = perfil            # Perfil de la compilación (None si no se pidió)
+
+    @property
+    def exito(self):
+        return not self.errores
+
+    def reporte_errores(self):
+        """Todos los errores de la compilación, en orden de aparición en el fuente."""
+        return reporte_errores(self.errores, self.mapa_fuente)
+
+class Compilador:
+    """
+    Una compilación independiente: tiene su propio AsignadorMemoria,
+    FuncDirectory, QuadManager y ámbito actual, así que se pueden correr
+    varias a la vez (hilos o procesos) sin estado global compartido.
+    Los Puntos Neurálgicos lo encuentran en 'p.parser.compilador'.
+
+    'lexer_base' es el lexer que se clona para cada compilación: el de
+    PLY por omisión, o cualquiera con el mismo contrato (ej. el Escaner
+    de escaner.py).
+
+    Con 'perfilar' se mide cada fase de la compilación (ver perfil.py).
+    """
+    def __init__(self, lexer_base=None, perfilar=False):
+        self.lexer_base = lexer_base if lexer_base is not None else lexer
+        self.memoria = AsignadorMemoria()
+        self.dir_general = FuncDirectory(self.memoria)
+        self.quad_manager = QuadManager(self.memoria)
+        self.identificadores = TablaIdentificadores()  # La llena el lexer
+        self.ambito_actual = 'global'
+        self.errores = []
+        self.mapa_fuente = MapaFuente()
+        self.perfil = None
+        if perfilar:
+            from perfil import Perfil
+            self.perfil = Perfil()
+        self._parser = None
+
+    def _error_sintaxis(self, p):
+        # Sin errok(): PLY descarta tokens hasta poder usar una producción
+        # 'error' (un estatuto o una declaración) y no reporta otro error
+        # hasta leer 3 tokens bien, así no hay errores en cascada
+        span = span_token(p) if p else SIN_SPAN
+        self.errores.append(Diagnostico(mensaje_error_sintaxis(p, self.mapa_fuente), SINTACTICO, span))
+
+    def compilar(self, fuente, optimizar=False):
+        """Compila 'fuente' y devuelve un ResultadoCompilacion. No imprime ni termina el proceso."""
+        lexer_local = self._nuevo_lexer(self.lexer_base)
+        lexer_local.input(fuente)
+        self.mapa_fuente = MapaFuente.desde_texto(fuente)
+        return self._compilar(lexer_local, optimizar)
+
+    def compilar_archivo(self, archivo, optimizar=False, tam_ventana=None):
+        """
+        Como compilar(), pero lee 'archivo' (una ruta, un archivo abierto
+        o un mmap) por ventanas en lugar de cargarlo completo. Usa el
+        Escaner si el lexer_base no sabe leer por ventanas. El
+        MapaFuente se llena conforme se leen las ventanas.
+        """
+        from escaner import Escaner, TAM_VENTANA
+        base = self.lexer_base if hasattr(self.lexer_base, 'input_archivo') else Escaner()
+        lexer_local = self._nuevo_lexer(base)
+        self.mapa_fuente = MapaFuente()
+        if isinstance(archivo, str):
+            with open(archivo, 'rb') as f:
+                lexer_local.input_archivo(f, tam_ventana or TAM_VENTANA, self.mapa_fuente)
+                return self._compilar(lexer_local, optimizar)
+        lexer_local.input_archivo(archivo, tam_ventana or TAM_VENTANA, self.mapa_fuente)
+        return self._compilar(lexer_local, optimizar)
+
+    def _nuevo_lexer(self, base):
+        lexer_local = base.clone()
+        lexer_local.lineno = 1
+        lexer_local.errores = self.errores
+        lexer_local.identificadores = self.identificadores
+        return lexer_local
+
+    def _compilar(self, lexer_local, optimizar):
+        self._parser = copy.copy(parser)  # Comparte las tablas; el estado del análisis es propio
+        self._parser.compilador = self
+        self._parser.errorfunc = self._error_sintaxis
+
+        perfil = self.perfil
+        if perfil is not None:
+            perfil.instrumentar(self, lexer_local, self._parser)
+            inicio = time.perf_counter()
+
+        self._parser.parse(lexer=lexer_local)  # El lexer ya tiene su entrada
+
+        if perfil is not None:
+            perfil.tiempos['analisis'] = time.perf_counter() - inicio
+
+        optimizador = None
+        if optimizar and not self.errores:
+            from optimizador import Optimizador
+            optimizador = Optimizador(self.quad_manager.tabla_constantes)
+            inicio_optimizacion = time.perf_counter()
+            self.quad_manager.fila_cuadruplos = optimizador.optimizar(self.quad_manager.fila_cuadruplos,
+                                                                         self.dir_general)
+            if perfil is not None:
+                perfil.tiempos['optimizacion'] = time.perf_counter() - inicio_optimizacion
+
+        if perfil is not None:
+            perfil.tiempos['total'] = perfil.tiempos['analisis'] + perfil.tiempos['optimizacion']
+
+        return ResultadoCompilacion(self.dir_general, self.quad_manager.tabla_constantes,
+                                    self.quad_manager.fila_cuadruplos, self.memoria,
+                                    self.errores, optimizador, self.mapa_fuente, perfil)
+
+def compilar(fuente, optimizar=False, lexer_base=None, perfilar=False):
+    """Atajo: compila 'fuente' con un Compilador nuevo."""
+    return Compilador(lexer_base, perfilar).compilar(fuente, optimizar)
+
+def compilar_archivo(archivo, optimizar=False, lexer_base=None, perfilar=False):
+    """Atajo: compila 'archivo' por ventanas con un Compilador nuevo."""
+    return Compilador(lexer_base, perfilar).compilar_archivo(archivo, optimizar)
+
+def run_tests():
+    import types
+    import parsetab
+
+    # Las tablas congeladas del repositorio son las de esta gramática
+    assert parsetab._lr_signature == firma_gramatica()
+    assert cargar_tablas() is not None
+
+    # Unas tablas de otra gramática no se usan (construir_parser las regenera)
+    viejas = types.ModuleType('parsetab_viejo')
+    viejas.__dict__.update(vars(parsetab))
+    viejas._lr_signature = parsetab._lr_signature.replace('factor : cte', 'factor : CTE_ENT')
+    assert viejas._lr_signature != parsetab._lr_signature
+    assert cargar_tablas(viejas) is None
+    assert cargar_tablas('no_existe_parsetab') is None
+
+    # Lo mismo con lextab.py: un cambio en una regla del lexer (ej. que
+    # '3.' sea flotante) deja la tabla vieja sin usar
+    import lexer as reglas
+    import lextab
+    assert lextab._firma == reglas.firma_lexer()
+    assert reglas.cargar_lexer() is not None
+    expresion = reglas.t_CTE_FLOT.__doc__
+    try:
+        reglas.t_CTE_FLOT.__doc__ = r'\d+\.\d*'
+        assert reglas.cargar_lexer() is None
+    finally:
+        reglas.t_CTE_FLOT.__doc__ = expresion
+    viejo = types.ModuleType('lextab_viejo')
+    viejo.__dict__.update(vars(lextab))
+    del viejo._firma  # Una tabla de antes de guardar la firma
+    assert reglas.cargar_lexer(viejo) is None
+    assert reglas.cargar_lexer('no_existe_lextab') is None
 
 # -----------------------------------------------------------
 # 6. SECCIÓN DE PRUEBA (MODIFICADO para Etapa 3)
 # -----------------------------------------------------------
 if __name__ == '__main__':
-    # Lee el archivo de prueba
+    # Uso: python parser.py [archivo.pat] [-O] [-P]
+    #   -O  aplica el optimizador de cuádruplos (ver optimizador.py)
+    #   -P  mide cada fase de la compilación e imprime el perfil; el
+    #       mismo perfil en JSON se escribe en archivo.perfil.json
+    optimizar = '-O' in sys.argv
+    perfilar = '-P' in sys.argv
+    argumentos = [arg for arg in sys.argv[1:] if arg not in ('-O', '-P')]
+    # ===== ¡ASEGÚRATE DE USAR UN ARCHIVO DE PRUEBA DE ETAPA 3! =====
+    archivo = argumentos[0] if argumentos else 'prueba_etapa3.pat'
+
+    # El archivo se lee por ventanas (no se carga completo en memoria)
     try:
-        # ===== ¡ASEGÚRATE DE USAR UN ARCHIVO DE PRUEBA DE ETAPA 3! =====
-        with open('prueba_etapa3.pat', 'r') as f:
-            data = f.read()
-    except EOFError:
-        print("No se pudo abrir el archivo de prueba.")
-        data = ""
+        vacio = os.path.getsize(archivo) == 0
     except FileNotFoundError:
-        print("Archivo 'prueba_etapa3.pat' no encontrado. Asegúrate de que existe.")
-        data = ""
+        print(f"Archivo '{archivo}' no encontrado. Asegúrate de que existe.")
+        vacio = True
 
-    if not data:
+    if vacio:
         print("No hay datos para analizar.")
     else:
         print("--- INICIO DE ANÁLISIS SINTÁCTICO ---")
-        parser.parse(data, lexer=lexer)
+        compilador = Compilador(perfilar=perfilar)
+        resultado = compilador.compilar_archivo(archivo, optimizar)
         print("--- FIN DE ANÁLISIS SINTÁCTICO ---")
-        
+
+        if resultado.perfil:
+            print(resultado.perfil)
+            with open(archivo.rsplit('.', 1)[0] + '.perfil.json', 'w', encoding='utf-8') as f:
+                f.write(resultado.perfil.a_json())
+
+        if not resultado.exito:
+            print(resultado.reporte_errores())
+            sys.exit(1)
+        print("¡Sintaxis de 'programa' correcta!")
+
         # ===== ¡NUEVO! MOSTRAR CUÁDRUPLOS Y DIRECTORIO =====
         print("\n--- Directorio General Final ---")
-        print(dir_general)
-        
-        quad_manager.mostrar_cuadruplos()
\ No newline at end of file
+        print(resultado.dir_funciones)
+
+        if resultado.optimizador:
+            print(resultado.optimizador.reporte())
+
+        print(resultado.memoria)
+        compilador.quad_manager.mostrar_cuadruplos()
+
+        # Guardar el código objeto para ejecutarlo sin volver a compilar
+        from objeto import escribir_objeto, EXTENSION
+        ruta_objeto = archivo.rsplit('.', 1)[0] + EXTENSION
+        tam = escribir_objeto(ruta_objeto, resultado.dir_funciones, resultado.tabla_constantes,
+                              resultado.fila_cuadruplos)
+        print(f"Código objeto escrito en '{ruta_objeto}' ({tam} bytes)")
\ No newline at end of file
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'programaleftMAYORMENORDIFIGUALDADMAYORIGMENORIGleftMASMENOSleftPORDIVrightUMASUMENOSASIG COMA CTE_ENT CTE_FLOT DIF DIV DOSPTOS ENTERO ESCRIBE FIN FLOTANTE HAZ ID IGUALDAD INICIO LBRACE LETRERO LETRERO_KW LPAREN MAS MAYOR MAYORIG MENOR MENORIG MENOS MIENTRAS NULA POR PROGRAMA PTOCOMA RBRACE RPAREN SI SINO VARSprograma : PROGRAMA ID pn_programa_inicio PTOCOMA vars_opcional funcs_opcional INICIO cuerpo FINpn_programa_inicio :vars_opcional : VARS lista_decl_var\n                     | emptyfuncs_opcional : lista_funcs\n                      | emptylista_decl_var : decl_var\n                      | decl_var lista_decl_vardecl_var : ids DOSPTOS tipo PTOCOMAids : ID\n           | ids COMA IDtipo : ENTERO\n            | FLOTANTElista_funcs : func_def\n                   | func_def lista_funcsfunc_def : tipo_retorno pn_func_inicio ID LPAREN params RPAREN LBRACE vars_opcional cuerpo RBRACE pn_func_fin PTOCOMApn_func_inicio :pn_func_fin :tipo_retorno : tipo\n                    | NULAparams : lista_params\n              | emptylista_params : ID DOSPTOS tipo pn_param\n                    | lista_params COMA ID DOSPTOS tipo pn_parampn_param :cuerpo : LBRACE lista_estatuto RBRACElista_estatuto : estatuto lista_estatuto\n                      | emptyestatuto : asigna\n                | condicion\n                | ciclo\n                | imprime\n                | llamada PTOCOMA\n                | cuerpoasigna : ID ASIG pn_push_operador expresion PTOCOMA pn_gen_quad_asigpn_gen_quad_asig :imprime : ESCRIBE pn_push_operador LPAREN lista_imprime RPAREN PTOCOMAlista_imprime : item_imprime pn_gen_quad_imprime\n                     | lista_imprime COMA item_imprime pn_gen_quad_imprimeitem_imprime : expresion\n                    | LETRERO       \n                    | LETRERO_KWpn_gen_quad_imprime :condicion : SI LPAREN expresion RPAREN cuerpo PTOCOMA\n                 | SI LPAREN expresion RPAREN cuerpo SINO cuerpo PTOCOMAciclo : MIENTRAS LPAREN expresion RPAREN HAZ cuerpo PTOCOMAllamada : ID LPAREN RPAREN\n               | ID LPAREN lista_args RPARENlista_args : expresion\n                  | lista_args COMA expresionexpresion : exp pn_expresion_relacional\n                 | exppn_expresion_relacional : OPREL pn_push_operador expOPREL : MAYOR\n             | MENOR\n             | DIF\n             | IGUALDAD\n             | MAYORIG\n             | MENORIGexp : termino pn_check_op_aditivo\n           | exp pn_push_op_aditivo termino pn_check_op_aditivopn_push_op_aditivo : MAS pn_push_operador\n                          | MENOS pn_push_operadorpn_check_op_aditivo :termino : factor pn_check_op_mult\n               | termino pn_push_op_mult factor pn_check_op_multpn_push_op_mult : POR pn_push_operador\n                       | DIV pn_push_operadorpn_check_op_mult :factor : LPAREN pn_push_paren expresion RPAREN pn_pop_parenpn_push_paren :pn_pop_paren :factor : MAS factor %prec UMAS\n              | MENOS factor %prec UMENOSfactor : llamadafactor : IDfactor : ctecte : CTE_ENT\n           | CTE_FLOTpn_push_operador :empty :'
+_lr_signature = 'programaleftMAYORMENORDIFIGUALDADMAYORIGMENORIGleftMASMENOSleftPORDIVrightUMASUMENOSASIG COMA CTE_ENT CTE_FLOT DIF DIV DOSPTOS ENTERO ESCRIBE FIN FLOTANTE HAZ ID IGUALDAD INICIO LBRACE LETRERO LETRERO_KW LPAREN MAS MAYOR MAYORIG MENOR MENORIG MENOS MIENTRAS NULA POR PROGRAMA PTOCOMA RBRACE RPAREN SI SINO VARSprograma : PROGRAMA ID pn_programa_inicio PTOCOMA vars_opcional funcs_opcional INICIO pn_principal cuerpo FINpn_programa_inicio :pn_principal :vars_opcional : VARS lista_decl_var\n                     | emptyfuncs_opcional : lista_funcs\n                      | emptylista_decl_var : decl_var\n                      | decl_var lista_decl_vardecl_var : ids DOSPTOS tipo PTOCOMAdecl_var : error PTOCOMAids : ID\n           | ids COMA IDtipo : ENTERO\n            | FLOTANTElista_funcs : func_def\n                   | func_def lista_funcsfunc_def : tipo_retorno ID pn_func_inicio LPAREN params RPAREN LBRACE vars_opcional cuerpo RBRACE pn_func_fin PTOCOMAfunc_def : tipo_retorno error PTOCOMApn_func_inicio :pn_func_fin :tipo_retorno : tipo\n                    | NULAparams : lista_params\n              | emptylista_params : ID DOSPTOS tipo pn_param\n                    | lista_params COMA ID DOSPTOS tipo pn_parampn_param :cuerpo : LBRACE lista_estatuto RBRACElista_estatuto : estatuto lista_estatuto\n                      | emptyestatuto : asigna\n                | condicion\n                | ciclo\n                | imprime\n                | llamada PTOCOMA\n                | cuerpoasigna : ID ASIG pn_push_operador expresion PTOCOMA pn_gen_quad_asigpn_gen_quad_asig :imprime : ESCRIBE pn_push_operador LPAREN lista_imprime RPAREN PTOCOMAlista_imprime : item_imprime pn_gen_quad_imprime\n                     | lista_imprime COMA item_imprime pn_gen_quad_imprimeitem_imprime : expresion\n                    | LETRERO       \n                    | LETRERO_KWpn_gen_quad_imprime :condicion : SI LPAREN expresion RPAREN pn_gotof cuerpo pn_fin_si PTOCOMA\n                 | SI LPAREN expresion RPAREN pn_gotof cuerpo SINO pn_sino cuerpo pn_fin_si PTOCOMAciclo : MIENTRAS pn_inicio_ciclo LPAREN expresion RPAREN pn_gotof HAZ cuerpo pn_fin_mientras PTOCOMApn_gotof :pn_sino :pn_fin_si :pn_inicio_ciclo :pn_fin_mientras :llamada : ID pn_era LPAREN RPAREN\n               | ID pn_era LPAREN lista_args RPARENpn_era :lista_args : expresion\n                  | lista_args COMA expresionexpresion : exp pn_expresion_relacional\n                 | exppn_expresion_relacional : OPREL pn_push_operador expOPREL : MAYOR\n             | MENOR\n             | DIF\n             | IGUALDAD\n             | MAYORIG\n             | MENORIGexp : termino pn_check_op_aditivo\n           | exp pn_push_op_aditivo termino pn_check_op_aditivopn_push_op_aditivo : MAS pn_push_operador\n                          | MENOS pn_push_operadorpn_check_op_aditivo :termino : factor pn_check_op_mult\n               | termino pn_push_op_mult factor pn_check_op_multpn_push_op_mult : POR pn_push_operador\n                       | DIV pn_push_operadorpn_check_op_mult :factor : LPAREN pn_push_paren expresion RPAREN pn_pop_parenpn_push_paren :pn_pop_paren :factor : MAS factor %prec UMAS\n              | MENOS factor %prec UMENOSfactor : llamadafactor : IDfactor : ctecte : CTE_ENT\n           | CTE_FLOTpn_push_operador :empty :estatuto : error PTOCOMA'
     
-_lr_action_items = {'PROGRAMA':([0,],[2,]),'$end':([1,33,],[0,-1,]),'ID':([2,7,13,14,15,16,17,19,24,27,29,35,37,38,39,40,42,47,48,49,51,52,53,54,55,61,63,70,71,78,81,83,85,87,88,89,90,91,92,93,94,95,96,98,99,100,114,118,119,120,122,123,127,132,137,140,146,150,],[3,21,-17,-19,-20,-12,-13,21,30,32,43,43,-29,-30,-31,-32,-34,57,-9,-26,-33,-80,62,62,62,62,-71,62,62,62,113,62,62,62,-80,-80,-80,-54,-55,-56,-57,-58,-59,62,-80,-80,-36,62,-62,-63,-67,-68,62,-35,-44,-37,-46,-45,]),'PTOCOMA':([3,4,16,17,31,41,49,62,64,67,68,69,72,73,74,75,82,84,86,97,101,102,103,117,121,124,126,133,134,135,136,139,144,145,148,151,],[-2,5,-12,-13,48,51,-26,-76,-47,-52,-64,-69,-75,-77,-78,-79,114,-48,-51,-60,-65,-73,-74,-64,-69,137,140,-72,-61,-53,-66,146,-70,150,-18,152,]),'VARS':([5,112,],[7,7,]),'NULA':([5,6,8,12,18,19,25,48,152,],[-81,15,-4,15,-3,-7,-8,-9,-16,]),'ENTERO':([5,6,8,12,18,19,25,26,48,79,131,152,],[-81,16,-4,16,-3,-7,-8,16,-9,16,16,-16,]),'FLOTANTE':([5,6,8,12,18,19,25,26,48,79,131,152,],[-81,17,-4,17,-3,-7,-8,17,-9,17,17,-16,]),'INICIO':([5,6,8,9,10,11,12,18,19,23,25,48,152,],[-81,-81,-4,22,-5,-6,-14,-3,-7,-15,-8,-9,-16,]),'LBRACE':([8,18,19,22,25,29,35,37,38,39,40,42,48,49,51,80,104,112,114,125,130,132,137,138,140,146,150,],[-4,-3,-7,29,-8,29,29,-29,-30,-31,-32,-34,-9,-26,-33,112,29,-81,-36,29,29,-35,-44,29,-37,-46,-45,]),'COMA':([16,17,20,21,32,59,62,64,65,66,67,68,69,72,73,74,75,84,86,97,101,102,103,106,107,108,109,110,111,116,117,121,128,129,133,134,135,136,141,143,144,147,149,],[-12,-13,27,-10,-11,81,-76,-47,85,-49,-52,-64,-69,-75,-77,-78,-79,-48,-51,-60,-65,-73,-74,127,-43,-40,-41,-42,-25,-50,-64,-69,-38,-23,-72,-61,-53,-66,-43,-25,-70,-39,-24,]),'RPAREN':([16,17,47,53,58,59,60,62,64,65,66,67,68,69,72,73,74,75,76,77,84,86,97,101,102,103,106,107,108,109,110,111,115,116,117,121,128,129,133,134,135,136,141,143,144,147,149,],[-12,-13,-81,64,80,-21,-22,-76,-47,84,-49,-52,-64,-69,-75,-77,-78,-79,104,105,-48,-51,-60,-65,-73,-74,126,-43,-40,-41,-42,-25,133,-50,-64,-69,-38,-23,-72,-61,-53,-66,-43,-25,-70,-39,-24,]),'DOSPTOS':([20,21,32,57,113,],[26,-10,-11,79,131,]),'FIN':([28,49,],[33,-26,]),'RBRACE':([29,34,35,36,37,38,39,40,42,49,50,51,114,132,137,140,142,146,150,],[-81,49,-81,-28,-29,-30,-31,-32,-34,-26,-27,-33,-36,-35,-44,-37,148,-46,-45,]),'SI':([29,35,37,38,39,40,42,49,51,114,132,137,140,146,150,],[44,44,-29,-30,-31,-32,-34,-26,-33,-36,-35,-44,-37,-46,-45,]),'MIENTRAS':([29,35,37,38,39,40,42,49,51,114,132,137,140,146,150,],[45,45,-29,-30,-31,-32,-34,-26,-33,-36,-35,-44,-37,-46,-45,]),'ESCRIBE':([29,35,37,38,39,40,42,49,51,114,132,137,140,146,150,],[46,46,-29,-30,-31,-32,-34,-26,-33,-36,-35,-44,-37,-46,-45,]),'LPAREN':([30,43,44,45,46,52,53,54,55,56,61,62,63,70,71,78,83,85,87,88,89,90,91,92,93,94,95,96,98,99,100,118,119,120,122,123,127,],[47,53,54,55,-80,-80,63,63,63,78,63,53,-71,63,63,63,63,63,63,-80,-80,-80,-54,-55,-56,-57,-58,-59,63,-80,-80,63,-62,-63,-67,-68,63,]),'ASIG':([43,],[52,]),'SINO':([49,124,],[-26,138,]),'MAS':([52,53,54,55,61,62,63,64,67,68,69,70,71,72,73,74,75,78,83,84,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,117,118,119,120,121,122,123,127,133,134,135,136,144,],[-80,70,70,70,70,-76,-71,-47,89,-64,-69,70,70,-75,-77,-78,-79,70,70,-48,70,70,-80,-80,-80,-54,-55,-56,-57,-58,-59,-60,70,-80,-80,-65,-73,-74,-64,70,-62,-63,-69,-67,-68,70,-72,-61,89,-66,-70,]),'MENOS':([52,53,54,55,61,62,63,64,67,68,69,70,71,72,73,74,75,78,83,84,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,117,118,119,120,121,122,123,127,133,134,135,136,144,],[-80,71,71,71,71,-76,-71,-47,90,-64,-69,71,71,-75,-77,-78,-79,71,71,-48,71,71,-80,-80,-80,-54,-55,-56,-57,-58,-59,-60,71,-80,-80,-65,-73,-74,-64,71,-62,-63,-69,-67,-68,71,-72,-61,90,-66,-70,]),'CTE_ENT':([52,53,54,55,61,63,70,71,78,83,85,87,88,89,90,91,92,93,94,95,96,98,99,100,118,119,120,122,123,127,],[-80,74,74,74,74,-71,74,74,74,74,74,74,-80,-80,-80,-54,-55,-56,-57,-58,-59,74,-80,-80,74,-62,-63,-67,-68,74,]),'CTE_FLOT':([52,53,54,55,61,63,70,71,78,83,85,87,88,89,90,91,92,93,94,95,96,98,99,100,118,119,120,122,123,127,],[-80,75,75,75,75,-71,75,75,75,75,75,75,-80,-80,-80,-54,-55,-56,-57,-58,-59,75,-80,-80,75,-62,-63,-67,-68,75,]),'POR':([62,64,68,69,72,73,74,75,84,101,102,103,117,121,133,136,144,],[-76,-47,99,-69,-75,-77,-78,-79,-48,-65,-73,-74,99,-69,-72,-66,-70,]),'DIV':([62,64,68,69,72,73,74,75,84,101,102,103,117,121,133,136,144,],[-76,-47,100,-69,-75,-77,-78,-79,-48,-65,-73,-74,100,-69,-72,-66,-70,]),'MAYOR':([62,64,67,68,69,72,73,74,75,84,97,101,102,103,117,121,133,134,136,144,],[-76,-47,91,-64,-69,-75,-77,-78,-79,-48,-60,-65,-73,-74,-64,-69,-72,-61,-66,-70,]),'MENOR':([62,64,67,68,69,72,73,74,75,84,97,101,102,103,117,121,133,134,136,144,],[-76,-47,92,-64,-69,-75,-77,-78,-79,-48,-60,-65,-73,-74,-64,-69,-72,-61,-66,-70,]),'DIF':([62,64,67,68,69,72,73,74,75,84,97,101,102,103,117,121,133,134,136,144,],[-76,-47,93,-64,-69,-75,-77,-78,-79,-48,-60,-65,-73,-74,-64,-69,-72,-61,-66,-70,]),'IGUALDAD':([62,64,67,68,69,72,73,74,75,84,97,101,102,103,117,121,133,134,136,144,],[-76,-47,94,-64,-69,-75,-77,-78,-79,-48,-60,-65,-73,-74,-64,-69,-72,-61,-66,-70,]),'MAYORIG':([62,64,67,68,69,72,73,74,75,84,97,101,102,103,117,121,133,134,136,144,],[-76,-47,95,-64,-69,-75,-77,-78,-79,-48,-60,-65,-73,-74,-64,-69,-72,-61,-66,-70,]),'MENORIG':([62,64,67,68,69,72,73,74,75,84,97,101,102,103,117,121,133,134,136,144,],[-76,-47,96,-64,-69,-75,-77,-78,-79,-48,-60,-65,-73,-74,-64,-69,-72,-61,-66,-70,]),'LETRERO':([78,127,],[109,109,]),'LETRERO_KW':([78,127,],[110,110,]),'HAZ':([105,],[125,]),}
+_lr_action_items = {'PROGRAMA':([0,],[2,]),'$end':([1,40,],[0,-1,]),'ID':([2,7,13,14,15,16,17,19,29,30,37,38,39,42,44,45,46,47,49,59,61,62,63,65,70,71,72,73,78,79,85,86,94,97,98,99,100,101,102,103,104,105,106,108,109,110,123,125,129,130,131,133,134,137,141,149,159,166,167,],[3,22,25,-22,-23,-14,-15,22,35,-11,51,55,-10,51,-32,-33,-34,-35,-37,-29,-36,-91,-89,81,89,81,81,-80,81,81,81,81,81,81,-89,-89,-89,-63,-64,-65,-66,-67,-68,81,-89,-89,-39,81,81,-71,-72,-76,-77,81,-38,-40,-47,-49,-48,]),'PTOCOMA':([3,4,16,17,21,26,34,48,50,59,75,76,77,80,81,82,83,84,90,91,96,107,111,112,113,124,128,132,136,143,144,145,146,147,151,153,154,158,161,163,164,165,],[-2,5,-14,-15,30,33,39,61,62,-29,-61,-73,-78,-84,-85,-86,-87,-88,123,-55,-60,-69,-74,-82,-83,-56,-73,-78,149,-81,-52,-70,-62,-75,-21,-79,159,162,-54,-52,166,167,]),'VARS':([5,88,],[7,7,]),'NULA':([5,6,8,12,18,19,27,30,33,39,162,],[-90,15,-5,15,-4,-8,-9,-11,-19,-10,-18,]),'ENTERO':([5,6,8,12,18,19,27,28,30,33,39,68,122,162,],[-90,16,-5,16,-4,-8,-9,16,-11,-19,-10,16,16,-18,]),'FLOTANTE':([5,6,8,12,18,19,27,28,30,33,39,68,122,162,],[-90,17,-5,17,-4,-8,-9,17,-11,-19,-10,17,17,-18,]),'INICIO':([5,6,8,9,10,11,12,18,19,24,27,30,33,39,162,],[-90,-90,-5,23,-6,-7,-16,-4,-8,-17,-9,-11,-19,-10,-18,]),'error':([7,13,14,15,16,17,19,30,37,39,42,44,45,46,47,49,59,61,62,123,141,149,159,166,167,],[21,26,-22,-23,-14,-15,21,-11,50,-10,50,-32,-33,-34,-35,-37,-29,-36,-91,-39,-38,-40,-47,-49,-48,]),'LBRACE':([8,18,19,23,27,30,31,37,39,42,44,45,46,47,49,59,61,62,69,88,95,121,123,127,141,149,155,156,159,160,166,167,],[-5,-4,-8,-3,-9,-11,37,37,-10,37,-32,-33,-34,-35,-37,-29,-36,-91,88,-90,-50,37,-39,37,-38,-40,-51,37,-47,37,-49,-48,]),'COMA':([16,17,20,22,35,57,75,76,77,80,81,82,83,84,87,91,92,93,96,107,111,112,113,115,116,117,118,119,120,124,128,132,138,140,142,143,145,146,147,150,152,153,157,],[-14,-15,29,-12,-13,70,-61,-73,-78,-84,-85,-86,-87,-88,-28,-55,125,-58,-60,-69,-74,-82,-83,137,-46,-43,-44,-45,-26,-56,-73,-78,-41,-28,-59,-81,-70,-62,-75,-46,-27,-79,-42,]),'RPAREN':([16,17,38,56,57,58,72,74,75,76,77,80,81,82,83,84,87,91,92,93,96,107,111,112,113,114,115,116,117,118,119,120,124,126,128,132,138,140,142,143,145,146,147,150,152,153,157,],[-14,-15,-90,69,-24,-25,91,95,-61,-73,-78,-84,-85,-86,-87,-88,-28,-55,124,-58,-60,-69,-74,-82,-83,135,136,-46,-43,-44,-45,-26,-56,143,-73,-78,-41,-28,-59,-81,-70,-62,-75,-46,-27,-79,-42,]),'DOSPTOS':([20,22,35,55,89,],[28,-12,-13,68,122,]),'LPAREN':([25,32,51,52,53,54,63,64,65,66,67,71,72,73,78,79,81,85,86,94,97,98,99,100,101,102,103,104,105,106,108,109,110,125,129,130,131,133,134,137,],[-20,38,-57,65,-53,-89,-89,72,73,85,86,73,73,-80,73,73,-57,73,73,73,73,-89,-89,-89,-63,-64,-65,-66,-67,-68,73,-89,-89,73,73,-71,-72,-76,-77,73,]),'FIN':([36,59,],[40,-29,]),'RBRACE':([37,41,42,43,44,45,46,47,49,59,60,61,62,123,139,141,149,159,166,167,],[-90,59,-90,-31,-32,-33,-34,-35,-37,-29,-30,-36,-91,-39,151,-38,-40,-47,-49,-48,]),'SI':([37,42,44,45,46,47,49,59,61,62,123,141,149,159,166,167,],[52,52,-32,-33,-34,-35,-37,-29,-36,-91,-39,-38,-40,-47,-49,-48,]),'MIENTRAS':([37,42,44,45,46,47,49,59,61,62,123,141,149,159,166,167,],[53,53,-32,-33,-34,-35,-37,-29,-36,-91,-39,-38,-40,-47,-49,-48,]),'ESCRIBE':([37,42,44,45,46,47,49,59,61,62,123,141,149,159,166,167,],[54,54,-32,-33,-34,-35,-37,-29,-36,-91,-39,-38,-40,-47,-49,-48,]),'ASIG':([51,],[63,]),'SINO':([59,144,],[-29,155,]),'MAS':([63,65,71,72,73,75,76,77,78,79,80,81,82,83,84,85,86,91,94,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,124,125,128,129,130,131,132,133,134,137,143,145,146,147,153,],[-89,78,78,78,-80,99,-73,-78,78,78,-84,-85,-86,-87,-88,78,78,-55,78,78,-89,-89,-89,-63,-64,-65,-66,-67,-68,-69,78,-89,-89,-74,-82,-83,-56,78,-73,78,-71,-72,-78,-76,-77,78,-81,-70,99,-75,-79,]),'MENOS':([63,65,71,72,73,75,76,77,78,79,80,81,82,83,84,85,86,91,94,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,124,125,128,129,130,131,132,133,134,137,143,145,146,147,153,],[-89,79,79,79,-80,100,-73,-78,79,79,-84,-85,-86,-87,-88,79,79,-55,79,79,-89,-89,-89,-63,-64,-65,-66,-67,-68,-69,79,-89,-89,-74,-82,-83,-56,79,-73,79,-71,-72,-78,-76,-77,79,-81,-70,100,-75,-79,]),'CTE_ENT':([63,65,71,72,73,78,79,85,86,94,97,98,99,100,101,102,103,104,105,106,108,109,110,125,129,130,131,133,134,137,],[-89,83,83,83,-80,83,83,83,83,83,83,-89,-89,-89,-63,-64,-65,-66,-67,-68,83,-89,-89,83,83,-71,-72,-76,-77,83,]),'CTE_FLOT':([63,65,71,72,73,78,79,85,86,94,97,98,99,100,101,102,103,104,105,106,108,109,110,125,129,130,131,133,134,137,],[-89,84,84,84,-80,84,84,84,84,84,84,-89,-89,-89,-63,-64,-65,-66,-67,-68,84,-89,-89,84,84,-71,-72,-76,-77,84,]),'MAYOR':([75,76,77,80,81,82,83,84,91,107,111,112,113,124,128,132,143,145,147,153,],[101,-73,-78,-84,-85,-86,-87,-88,-55,-69,-74,-82,-83,-56,-73,-78,-81,-70,-75,-79,]),'MENOR':([75,76,77,80,81,82,83,84,91,107,111,112,113,124,128,132,143,145,147,153,],[102,-73,-78,-84,-85,-86,-87,-88,-55,-69,-74,-82,-83,-56,-73,-78,-81,-70,-75,-79,]),'DIF':([75,76,77,80,81,82,83,84,91,107,111,112,113,124,128,132,143,145,147,153,],[103,-73,-78,-84,-85,-86,-87,-88,-55,-69,-74,-82,-83,-56,-73,-78,-81,-70,-75,-79,]),'IGUALDAD':([75,76,77,80,81,82,83,84,91,107,111,112,113,124,128,132,143,145,147,153,],[104,-73,-78,-84,-85,-86,-87,-88,-55,-69,-74,-82,-83,-56,-73,-78,-81,-70,-75,-79,]),'MAYORIG':([75,76,77,80,81,82,83,84,91,107,111,112,113,124,128,132,143,145,147,153,],[105,-73,-78,-84,-85,-86,-87,-88,-55,-69,-74,-82,-83,-56,-73,-78,-81,-70,-75,-79,]),'MENORIG':([75,76,77,80,81,82,83,84,91,107,111,112,113,124,128,132,143,145,147,153,],[106,-73,-78,-84,-85,-86,-87,-88,-55,-69,-74,-82,-83,-56,-73,-78,-81,-70,-75,-79,]),'POR':([76,77,80,81,82,83,84,91,111,112,113,124,128,132,143,147,153,],[109,-78,-84,-85,-86,-87,-88,-55,-74,-82,-83,-56,109,-78,-81,-75,-79,]),'DIV':([76,77,80,81,82,83,84,91,111,112,113,124,128,132,143,147,153,],[110,-78,-84,-85,-86,-87,-88,-55,-74,-82,-83,-56,110,-78,-81,-75,-79,]),'LETRERO':([86,137,],[118,118,]),'LETRERO_KW':([86,137,],[119,119,]),'HAZ':([135,148,],[-50,156,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'programa':([0,],[1,]),'pn_programa_inicio':([3,],[4,]),'vars_opcional':([5,112,],[6,130,]),'empty':([5,6,29,35,47,112,],[8,11,36,36,60,8,]),'funcs_opcional':([6,],[9,]),'lista_funcs':([6,12,],[10,23,]),'func_def':([6,12,],[12,12,]),'tipo_retorno':([6,12,],[13,13,]),'tipo':([6,12,26,79,131,],[14,14,31,111,143,]),'lista_decl_var':([7,19,],[18,25,]),'decl_var':([7,19,],[19,19,]),'ids':([7,19,],[20,20,]),'pn_func_inicio':([13,],[24,]),'cuerpo':([22,29,35,104,125,130,138,],[28,42,42,124,139,142,145,]),'lista_estatuto':([29,35,],[34,50,]),'estatuto':([29,35,],[35,35,]),'asigna':([29,35,],[37,37,]),'condicion':([29,35,],[38,38,]),'ciclo':([29,35,],[39,39,]),'imprime':([29,35,],[40,40,]),'llamada':([29,35,53,54,55,61,70,71,78,83,85,87,98,118,127,],[41,41,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'pn_push_operador':([46,52,88,89,90,99,100,],[56,61,118,119,120,122,123,]),'params':([47,],[58,]),'lista_params':([47,],[59,]),'lista_args':([53,],[65,]),'expresion':([53,54,55,61,78,83,85,127,],[66,76,77,82,108,115,116,108,]),'exp':([53,54,55,61,78,83,85,118,127,],[67,67,67,67,67,67,67,135,67,]),'termino':([53,54,55,61,78,83,85,87,118,127,],[68,68,68,68,68,68,68,117,68,68,]),'factor':([53,54,55,61,70,71,78,83,85,87,98,118,127,],[69,69,69,69,102,103,69,69,69,69,121,69,69,]),'cte':([53,54,55,61,70,71,78,83,85,87,98,118,127,],[73,73,73,73,73,73,73,73,73,73,73,73,73,]),'pn_push_paren':([63,],[83,]),'pn_expresion_relacional':([67,],[86,]),'pn_push_op_aditivo':([67,135,],[87,87,]),'OPREL':([67,],[88,]),'pn_check_op_aditivo':([68,117,],[97,134,]),'pn_push_op_mult':([68,117,],[98,98,]),'pn_check_op_mult':([69,121,],[101,136,]),'lista_imprime':([78,],[106,]),'item_imprime':([78,127,],[107,141,]),'pn_gen_quad_imprime':([107,141,],[128,147,]),'pn_param':([111,143,],[129,149,]),'pn_gen_quad_asig':([114,],[132,]),'pn_pop_paren':([133,],[144,]),'pn_func_fin':([148,],[151,]),}
+_lr_goto_items = {'programa':([0,],[1,]),'pn_programa_inicio':([3,],[4,]),'vars_opcional':([5,88,],[6,121,]),'empty':([5,6,37,38,42,88,],[8,11,43,58,43,8,]),'funcs_opcional':([6,],[9,]),'lista_funcs':([6,12,],[10,24,]),'func_def':([6,12,],[12,12,]),'tipo_retorno':([6,12,],[13,13,]),'tipo':([6,12,28,68,122,],[14,14,34,87,140,]),'lista_decl_var':([7,19,],[18,27,]),'decl_var':([7,19,],[19,19,]),'ids':([7,19,],[20,20,]),'pn_principal':([23,],[31,]),'pn_func_inicio':([25,],[32,]),'cuerpo':([31,37,42,121,127,156,160,],[36,49,49,139,144,161,163,]),'lista_estatuto':([37,42,],[41,60,]),'estatuto':([37,42,],[42,42,]),'asigna':([37,42,],[44,44,]),'condicion':([37,42,],[45,45,]),'ciclo':([37,42,],[46,46,]),'imprime':([37,42,],[47,47,]),'llamada':([37,42,65,71,72,78,79,85,86,94,97,108,125,129,137,],[48,48,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'params':([38,],[56,]),'lista_params':([38,],[57,]),'pn_era':([51,81,],[64,64,]),'pn_inicio_ciclo':([53,],[66,]),'pn_push_operador':([54,63,98,99,100,109,110,],[67,71,129,130,131,133,134,]),'expresion':([65,71,72,85,86,94,125,137,],[74,90,93,114,117,126,142,117,]),'exp':([65,71,72,85,86,94,125,129,137,],[75,75,75,75,75,75,75,146,75,]),'termino':([65,71,72,85,86,94,97,125,129,137,],[76,76,76,76,76,76,128,76,76,76,]),'factor':([65,71,72,78,79,85,86,94,97,108,125,129,137,],[77,77,77,112,113,77,77,77,77,132,77,77,77,]),'cte':([65,71,72,78,79,85,86,94,97,108,125,129,137,],[82,82,82,82,82,82,82,82,82,82,82,82,82,]),'lista_args':([72,],[92,]),'pn_push_paren':([73,],[94,]),'pn_expresion_relacional':([75,],[96,]),'pn_push_op_aditivo':([75,146,],[97,97,]),'OPREL':([75,],[98,]),'pn_check_op_aditivo':([76,128,],[107,145,]),'pn_push_op_mult':([76,128,],[108,108,]),'pn_check_op_mult':([77,132,],[111,147,]),'lista_imprime':([86,],[115,]),'item_imprime':([86,137,],[116,150,]),'pn_param':([87,140,],[120,152,]),'pn_gotof':([95,135,],[127,148,]),'pn_gen_quad_imprime':([116,150,],[138,157,]),'pn_gen_quad_asig':([123,],[141,]),'pn_pop_paren':([143,],[153,]),'pn_fin_si':([144,163,],[154,165,]),'pn_func_fin':([151,],[158,]),'pn_sino':([155,],[160,]),'pn_fin_mientras':([161,],[164,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,85 +27,95 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> programa","S'",1,None,None,None),
-  ('programa -> PROGRAMA ID pn_programa_inicio PTOCOMA vars_opcional funcs_opcional INICIO cuerpo FIN','programa',9,'p_programa','parser.py',46),
-  ('pn_programa_inicio -> <empty>','pn_programa_inicio',0,'p_pn_programa_inicio','parser.py',53),
-  ('vars_opcional -> VARS lista_decl_var','vars_opcional',2,'p_vars_opcional','parser.py',59),
-  ('vars_opcional -> empty','vars_opcional',1,'p_vars_opcional','parser.py',60),
-  ('funcs_opcional -> lista_funcs','funcs_opcional',1,'p_funcs_opcional','parser.py',64),
-  ('funcs_opcional -> empty','funcs_opcional',1,'p_funcs_opcional','parser.py',65),
-  ('lista_decl_var -> decl_var','lista_decl_var',1,'p_lista_decl_var','parser.py',70),
-  ('lista_decl_var -> decl_var lista_decl_var','lista_decl_var',2,'p_lista_decl_var','parser.py',71),
-  ('decl_var -> ids DOSPTOS tipo PTOCOMA','decl_var',4,'p_decl_var','parser.py',75),
-  ('ids -> ID','ids',1,'p_ids','parser.py',87),
-  ('ids -> ids COMA ID','ids',3,'p_ids','parser.py',88),
-  ('tipo -> ENTERO','tipo',1,'p_tipo','parser.py',96),
-  ('tipo -> FLOTANTE','tipo',1,'p_tipo','parser.py',97),
-  ('lista_funcs -> func_def','lista_funcs',1,'p_lista_funcs','parser.py',102),
-  ('lista_funcs -> func_def lista_funcs','lista_funcs',2,'p_lista_funcs','parser.py',103),
-  ('func_def -> tipo_retorno pn_func_inicio ID LPAREN params RPAREN LBRACE vars_opcional cuerpo RBRACE pn_func_fin PTOCOMA','func_def',12,'p_func_def','parser.py',107),
-  ('pn_func_inicio -> <empty>','pn_func_inicio',0,'p_pn_func_inicio','parser.py',111),
-  ('pn_func_fin -> <empty>','pn_func_fin',0,'p_pn_func_fin','parser.py',124),
-  ('tipo_retorno -> tipo','tipo_retorno',1,'p_tipo_retorno','parser.py',129),
-  ('tipo_retorno -> NULA','tipo_retorno',1,'p_tipo_retorno','parser.py',130),
-  ('params -> lista_params','params',1,'p_params','parser.py',134),
-  ('params -> empty','params',1,'p_params','parser.py',135),
-  ('lista_params -> ID DOSPTOS tipo pn_param','lista_params',4,'p_lista_params','parser.py',139),
-  ('lista_params -> lista_params COMA ID DOSPTOS tipo pn_param','lista_params',6,'p_lista_params','parser.py',140),
-  ('pn_param -> <empty>','pn_param',0,'p_pn_param','parser.py',144),
-  ('cuerpo -> LBRACE lista_estatuto RBRACE','cuerpo',3,'p_cuerpo','parser.py',157),
-  ('lista_estatuto -> estatuto lista_estatuto','lista_estatuto',2,'p_lista_estatuto','parser.py',161),
-  ('lista_estatuto -> empty','lista_estatuto',1,'p_lista_estatuto','parser.py',162),
-  ('estatuto -> asigna','estatuto',1,'p_estatuto','parser.py',166),
-  ('estatuto -> condicion','estatuto',1,'p_estatuto','parser.py',167),
-  ('estatuto -> ciclo','estatuto',1,'p_estatuto','parser.py',168),
-  ('estatuto -> imprime','estatuto',1,'p_estatuto','parser.py',169),
-  ('estatuto -> llamada PTOCOMA','estatuto',2,'p_estatuto','parser.py',170),
-  ('estatuto -> cuerpo','estatuto',1,'p_estatuto','parser.py',171),
-  ('asigna -> ID ASIG pn_push_operador expresion PTOCOMA pn_gen_quad_asig','asigna',6,'p_asigna','parser.py',177),
-  ('pn_gen_quad_asig -> <empty>','pn_gen_quad_asig',0,'p_pn_gen_quad_asig','parser.py',187),
-  ('imprime -> ESCRIBE pn_push_operador LPAREN lista_imprime RPAREN PTOCOMA','imprime',6,'p_imprime','parser.py',213),
-  ('lista_imprime -> item_imprime pn_gen_quad_imprime','lista_imprime',2,'p_lista_imprime','parser.py',218),
-  ('lista_imprime -> lista_imprime COMA item_imprime pn_gen_quad_imprime','lista_imprime',4,'p_lista_imprime','parser.py',219),
-  ('item_imprime -> expresion','item_imprime',1,'p_item_imprime','parser.py',223),
-  ('item_imprime -> LETRERO','item_imprime',1,'p_item_imprime','parser.py',224),
-  ('item_imprime -> LETRERO_KW','item_imprime',1,'p_item_imprime','parser.py',225),
-  ('pn_gen_quad_imprime -> <empty>','pn_gen_quad_imprime',0,'p_pn_gen_quad_imprime','parser.py',233),
-  ('condicion -> SI LPAREN expresion RPAREN cuerpo PTOCOMA','condicion',6,'p_condicion','parser.py',247),
-  ('condicion -> SI LPAREN expresion RPAREN cuerpo SINO cuerpo PTOCOMA','condicion',8,'p_condicion','parser.py',248),
-  ('ciclo -> MIENTRAS LPAREN expresion RPAREN HAZ cuerpo PTOCOMA','ciclo',7,'p_ciclo','parser.py',254),
-  ('llamada -> ID LPAREN RPAREN','llamada',3,'p_llamada','parser.py',260),
-  ('llamada -> ID LPAREN lista_args RPAREN','llamada',4,'p_llamada','parser.py',261),
-  ('lista_args -> expresion','lista_args',1,'p_lista_args','parser.py',267),
-  ('lista_args -> lista_args COMA expresion','lista_args',3,'p_lista_args','parser.py',268),
-  ('expresion -> exp pn_expresion_relacional','expresion',2,'p_expresion','parser.py',275),
-  ('expresion -> exp','expresion',1,'p_expresion','parser.py',276),
-  ('pn_expresion_relacional -> OPREL pn_push_operador exp','pn_expresion_relacional',3,'p_pn_expresion_relacional','parser.py',280),
-  ('OPREL -> MAYOR','OPREL',1,'p_oprel','parser.py',293),
-  ('OPREL -> MENOR','OPREL',1,'p_oprel','parser.py',294),
-  ('OPREL -> DIF','OPREL',1,'p_oprel','parser.py',295),
-  ('OPREL -> IGUALDAD','OPREL',1,'p_oprel','parser.py',296),
-  ('OPREL -> MAYORIG','OPREL',1,'p_oprel','parser.py',297),
-  ('OPREL -> MENORIG','OPREL',1,'p_oprel','parser.py',298),
-  ('exp -> termino pn_check_op_aditivo','exp',2,'p_exp','parser.py',307),
-  ('exp -> exp pn_push_op_aditivo termino pn_check_op_aditivo','exp',4,'p_exp','parser.py',308),
-  ('pn_push_op_aditivo -> MAS pn_push_operador','pn_push_op_aditivo',2,'p_pn_push_op_aditivo','parser.py',312),
-  ('pn_push_op_aditivo -> MENOS pn_push_operador','pn_push_op_aditivo',2,'p_pn_push_op_aditivo','parser.py',313),
-  ('pn_check_op_aditivo -> <empty>','pn_check_op_aditivo',0,'p_pn_check_op_aditivo','parser.py',317),
-  ('termino -> factor pn_check_op_mult','termino',2,'p_termino','parser.py',330),
-  ('termino -> termino pn_push_op_mult factor pn_check_op_mult','termino',4,'p_termino','parser.py',331),
-  ('pn_push_op_mult -> POR pn_push_operador','pn_push_op_mult',2,'p_pn_push_op_mult','parser.py',335),
-  ('pn_push_op_mult -> DIV pn_push_operador','pn_push_op_mult',2,'p_pn_push_op_mult','parser.py',336),
-  ('pn_check_op_mult -> <empty>','pn_check_op_mult',0,'p_pn_check_op_mult','parser.py',340),
-  ('factor -> LPAREN pn_push_paren expresion RPAREN pn_pop_paren','factor',5,'p_factor_agrupacion','parser.py',353),
-  ('pn_push_paren -> <empty>','pn_push_paren',0,'p_pn_push_paren','parser.py',357),
-  ('pn_pop_paren -> <empty>','pn_pop_paren',0,'p_pn_pop_paren','parser.py',361),
-  ('factor -> MAS factor','factor',2,'p_factor_unario','parser.py',369),
-  ('factor -> MENOS factor','factor',2,'p_factor_unario','parser.py',370),
-  ('factor -> llamada','factor',1,'p_factor_llamada','parser.py',375),
-  ('factor -> ID','factor',1,'p_factor_id','parser.py',380),
-  ('factor -> cte','factor',1,'p_factor_cte','parser.py',390),
-  ('cte -> CTE_ENT','cte',1,'p_cte','parser.py',397),
-  ('cte -> CTE_FLOT','cte',1,'p_cte','parser.py',398),
-  ('pn_push_operador -> <empty>','pn_push_operador',0,'p_pn_push_operador','parser.py',407),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',413),
+  ('programa -> PROGRAMA ID pn_programa_inicio PTOCOMA vars_opcional funcs_opcional INICIO pn_principal cuerpo FIN','programa',10,'p_programa','parser.py',89),
+  ('pn_programa_inicio -> <empty>','pn_programa_inicio',0,'p_pn_programa_inicio','parser.py',96),
+  ('pn_principal -> <empty>','pn_principal',0,'p_pn_principal','parser.py',101),
+  ('vars_opcional -> VARS lista_decl_var','vars_opcional',2,'p_vars_opcional','parser.py',109),
+  ('vars_opcional -> empty','vars_opcional',1,'p_vars_opcional','parser.py',110),
+  ('funcs_opcional -> lista_funcs','funcs_opcional',1,'p_funcs_opcional','parser.py',114),
+  ('funcs_opcional -> empty','funcs_opcional',1,'p_funcs_opcional','parser.py',115),
+  ('lista_decl_var -> decl_var','lista_decl_var',1,'p_lista_decl_var','parser.py',120),
+  ('lista_decl_var -> decl_var lista_decl_var','lista_decl_var',2,'p_lista_decl_var','parser.py',121),
+  ('decl_var -> ids DOSPTOS tipo PTOCOMA','decl_var',4,'p_decl_var','parser.py',125),
+  ('decl_var -> error PTOCOMA','decl_var',2,'p_decl_var_error','parser.py',138),
+  ('ids -> ID','ids',1,'p_ids','parser.py',143),
+  ('ids -> ids COMA ID','ids',3,'p_ids','parser.py',144),
+  ('tipo -> ENTERO','tipo',1,'p_tipo','parser.py',152),
+  ('tipo -> FLOTANTE','tipo',1,'p_tipo','parser.py',153),
+  ('lista_funcs -> func_def','lista_funcs',1,'p_lista_funcs','parser.py',158),
+  ('lista_funcs -> func_def lista_funcs','lista_funcs',2,'p_lista_funcs','parser.py',159),
+  ('func_def -> tipo_retorno ID pn_func_inicio LPAREN params RPAREN LBRACE vars_opcional cuerpo RBRACE pn_func_fin PTOCOMA','func_def',12,'p_func_def','parser.py',163),
+  ('func_def -> tipo_retorno error PTOCOMA','func_def',3,'p_func_def_error','parser.py',167),
+  ('pn_func_inicio -> <empty>','pn_func_inicio',0,'p_pn_func_inicio','parser.py',175),
+  ('pn_func_fin -> <empty>','pn_func_fin',0,'p_pn_func_fin','parser.py',191),
+  ('tipo_retorno -> tipo','tipo_retorno',1,'p_tipo_retorno','parser.py',202),
+  ('tipo_retorno -> NULA','tipo_retorno',1,'p_tipo_retorno','parser.py',203),
+  ('params -> lista_params','params',1,'p_params','parser.py',207),
+  ('params -> empty','params',1,'p_params','parser.py',208),
+  ('lista_params -> ID DOSPTOS tipo pn_param','lista_params',4,'p_lista_params','parser.py',212),
+  ('lista_params -> lista_params COMA ID DOSPTOS tipo pn_param','lista_params',6,'p_lista_params','parser.py',213),
+  ('pn_param -> <empty>','pn_param',0,'p_pn_param','parser.py',217),
+  ('cuerpo -> LBRACE lista_estatuto RBRACE','cuerpo',3,'p_cuerpo','parser.py',231),
+  ('lista_estatuto -> estatuto lista_estatuto','lista_estatuto',2,'p_lista_estatuto','parser.py',235),
+  ('lista_estatuto -> empty','lista_estatuto',1,'p_lista_estatuto','parser.py',236),
+  ('estatuto -> asigna','estatuto',1,'p_estatuto','parser.py',240),
+  ('estatuto -> condicion','estatuto',1,'p_estatuto','parser.py',241),
+  ('estatuto -> ciclo','estatuto',1,'p_estatuto','parser.py',242),
+  ('estatuto -> imprime','estatuto',1,'p_estatuto','parser.py',243),
+  ('estatuto -> llamada PTOCOMA','estatuto',2,'p_estatuto','parser.py',244),
+  ('estatuto -> cuerpo','estatuto',1,'p_estatuto','parser.py',245),
+  ('asigna -> ID ASIG pn_push_operador expresion PTOCOMA pn_gen_quad_asig','asigna',6,'p_asigna','parser.py',251),
+  ('pn_gen_quad_asig -> <empty>','pn_gen_quad_asig',0,'p_pn_gen_quad_asig','parser.py',261),
+  ('imprime -> ESCRIBE pn_push_operador LPAREN lista_imprime RPAREN PTOCOMA','imprime',6,'p_imprime','parser.py',291),
+  ('lista_imprime -> item_imprime pn_gen_quad_imprime','lista_imprime',2,'p_lista_imprime','parser.py',296),
+  ('lista_imprime -> lista_imprime COMA item_imprime pn_gen_quad_imprime','lista_imprime',4,'p_lista_imprime','parser.py',297),
+  ('item_imprime -> expresion','item_imprime',1,'p_item_imprime','parser.py',301),
+  ('item_imprime -> LETRERO','item_imprime',1,'p_item_imprime','parser.py',302),
+  ('item_imprime -> LETRERO_KW','item_imprime',1,'p_item_imprime','parser.py',303),
+  ('pn_gen_quad_imprime -> <empty>','pn_gen_quad_imprime',0,'p_pn_gen_quad_imprime','parser.py',315),
+  ('condicion -> SI LPAREN expresion RPAREN pn_gotof cuerpo pn_fin_si PTOCOMA','condicion',8,'p_condicion','parser.py',329),
+  ('condicion -> SI LPAREN expresion RPAREN pn_gotof cuerpo SINO pn_sino cuerpo pn_fin_si PTOCOMA','condicion',11,'p_condicion','parser.py',330),
+  ('ciclo -> MIENTRAS pn_inicio_ciclo LPAREN expresion RPAREN pn_gotof HAZ cuerpo pn_fin_mientras PTOCOMA','ciclo',10,'p_ciclo','parser.py',335),
+  ('pn_gotof -> <empty>','pn_gotof',0,'p_pn_gotof','parser.py',340),
+  ('pn_sino -> <empty>','pn_sino',0,'p_pn_sino','parser.py',349),
+  ('pn_fin_si -> <empty>','pn_fin_si',0,'p_pn_fin_si','parser.py',355),
+  ('pn_inicio_ciclo -> <empty>','pn_inicio_ciclo',0,'p_pn_inicio_ciclo','parser.py',360),
+  ('pn_fin_mientras -> <empty>','pn_fin_mientras',0,'p_pn_fin_mientras','parser.py',365),
+  ('llamada -> ID pn_era LPAREN RPAREN','llamada',4,'p_llamada','parser.py',371),
+  ('llamada -> ID pn_era LPAREN lista_args RPAREN','llamada',5,'p_llamada','parser.py',372),
+  ('pn_era -> <empty>','pn_era',0,'p_pn_era','parser.py',383),
+  ('lista_args -> expresion','lista_args',1,'p_lista_args','parser.py',396),
+  ('lista_args -> lista_args COMA expresion','lista_args',3,'p_lista_args','parser.py',397),
+  ('expresion -> exp pn_expresion_relacional','expresion',2,'p_expresion','parser.py',409),
+  ('expresion -> exp','expresion',1,'p_expresion','parser.py',410),
+  ('pn_expresion_relacional -> OPREL pn_push_operador exp','pn_expresion_relacional',3,'p_pn_expresion_relacional','parser.py',414),
+  ('OPREL -> MAYOR','OPREL',1,'p_oprel','parser.py',427),
+  ('OPREL -> MENOR','OPREL',1,'p_oprel','parser.py',428),
+  ('OPREL -> DIF','OPREL',1,'p_oprel','parser.py',429),
+  ('OPREL -> IGUALDAD','OPREL',1,'p_oprel','parser.py',430),
+  ('OPREL -> MAYORIG','OPREL',1,'p_oprel','parser.py',431),
+  ('OPREL -> MENORIG','OPREL',1,'p_oprel','parser.py',432),
+  ('exp -> termino pn_check_op_aditivo','exp',2,'p_exp','parser.py',441),
+  ('exp -> exp pn_push_op_aditivo termino pn_check_op_aditivo','exp',4,'p_exp','parser.py',442),
+  ('pn_push_op_aditivo -> MAS pn_push_operador','pn_push_op_aditivo',2,'p_pn_push_op_aditivo','parser.py',446),
+  ('pn_push_op_aditivo -> MENOS pn_push_operador','pn_push_op_aditivo',2,'p_pn_push_op_aditivo','parser.py',447),
+  ('pn_check_op_aditivo -> <empty>','pn_check_op_aditivo',0,'p_pn_check_op_aditivo','parser.py',451),
+  ('termino -> factor pn_check_op_mult','termino',2,'p_termino','parser.py',464),
+  ('termino -> termino pn_push_op_mult factor pn_check_op_mult','termino',4,'p_termino','parser.py',465),
+  ('pn_push_op_mult -> POR pn_push_operador','pn_push_op_mult',2,'p_pn_push_op_mult','parser.py',469),
+  ('pn_push_op_mult -> DIV pn_push_operador','pn_push_op_mult',2,'p_pn_push_op_mult','parser.py',470),
+  ('pn_check_op_mult -> <empty>','pn_check_op_mult',0,'p_pn_check_op_mult','parser.py',474),
+  ('factor -> LPAREN pn_push_paren expresion RPAREN pn_pop_paren','factor',5,'p_factor_agrupacion','parser.py',487),
+  ('pn_push_paren -> <empty>','pn_push_paren',0,'p_pn_push_paren','parser.py',491),
+  ('pn_pop_paren -> <empty>','pn_pop_paren',0,'p_pn_pop_paren','parser.py',496),
+  ('factor -> MAS factor','factor',2,'p_factor_unario','parser.py',504),
+  ('factor -> MENOS factor','factor',2,'p_factor_unario','parser.py',505),
+  ('factor -> llamada','factor',1,'p_factor_llamada','parser.py',510),
+  ('factor -> ID','factor',1,'p_factor_id','parser.py',520),
+  ('factor -> cte','factor',1,'p_factor_cte','parser.py',532),
+  ('cte -> CTE_ENT','cte',1,'p_cte','parser.py',541),
+  ('cte -> CTE_FLOT','cte',1,'p_cte','parser.py',542),
+  ('pn_push_operador -> <empty>','pn_push_operador',0,'p_pn_push_operador','parser.py',551),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',558),
+  ('estatuto -> error PTOCOMA','estatuto',2,'p_estatuto_error','parser.py',565),
 ]
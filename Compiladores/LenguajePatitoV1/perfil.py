@@ -0,0 +1,213 @@
+# -----------------------------------------------------------------
+# perfil.py
+#
+# Perfil de una compilación (opcional): cuánto tiempo se va en cada
+# fase y cuántas veces se hace cada cosa.
+#
+# Con Compilador(perfilar=True) se instalan medidores sobre los
+# objetos de ESA compilación (el lexer, las reglas del parser, el
+# FuncDirectory, el cubo y el QuadManager), como atributos de
+# instancia. Sin perfil no se instala nada: el costo es cero.
+#
+# Fases (tiempo exclusivo, sin contar las fases que van dentro):
+#   lexico        token() del lexer
+#   sintactico    la maquinaria LR de PLY
+#   semantico     los Puntos Neurálgicos y demás acciones de las reglas
+#   directorio    altas y búsquedas en el FuncDirectory
+#   cubo          consultas al cubo_semantico (lookup y lookup_codigo)
+#   cuadruplos    emisión de cuádruplos
+#   optimizacion  el Optimizador (si se pidió)
+# -----------------------------------------------------------------
+import copy
+import json
+import time
+from types import SimpleNamespace
+
+FASES = ('lexico', 'sintactico', 'semantico', 'directorio', 'cubo', 'cuadruplos', 'optimizacion')
+
+# Métodos del FuncDirectory que llaman los Puntos Neurálgicos (los
+# internos, como lookup_func, quedan dentro de estos)
+METODOS_DIRECTORIO = ('add_func', 'add_var_to_func', 'add_param_to_func', 'lookup_var_entry_in_func')
+
+
+class Perfil:
+    def __init__(self):
+        # Tiempos inclusivos (en segundos); las fases exclusivas se calculan en fases()
+        self.tiempos = dict.fromkeys(('lexico', 'analisis', 'acciones', 'directorio', 'cubo',
+                                      'cuadruplos', 'optimizacion', 'total'), 0.0)
+        self.contadores = dict.fromkeys(('tokens', 'reducciones', 'consultas_directorio',
+                                         'consultas_cubo', 'cuadruplos'), 0)
+        self.reducciones_por_regla = {}
+        self.pico_operandos = 0   # Máximo de elementos en pila_operandos
+        self.pico_operadores = 0  # Máximo de elementos en pila_operadores
+
+    # --- Instalación de los medidores ---
+
+    def _medir(self, tiempo, contador, funcion):
+        """Envuelve 'funcion' para sumar su tiempo y contar sus llamadas."""
+        tiempos = self.tiempos
+        contadores = self.contadores
+        reloj = time.perf_counter
+
+        def medida(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                tiempos[tiempo] += reloj() - inicio
+                contadores[contador] += 1
+        return medida
+
+    def instrumentar(self, compilador, lexer, parser):
+        """
+        Instala los medidores en el lexer, el parser (una copia propia
+        de la compilación) y los objetos semánticos del compilador.
+        """
+        tiempos = self.tiempos
+        contadores = self.contadores
+        reloj = time.perf_counter
+
+        # Lexer: tiempo de token() y tokens devueltos (sin el None final)
+        token = lexer.token
+        def token_medido():
+            inicio = reloj()
+            tok = token()
+            tiempos['lexico'] += reloj() - inicio
+            if tok is not None:
+                contadores['tokens'] += 1
+            return tok
+        lexer.token = token_medido
+
+        # Parser: cada regla es una reducción (copias, para no tocar las
+        # producciones compartidas por todas las compilaciones)
+        por_regla = self.reducciones_por_regla
+        producciones = []
+        for produccion in parser.productions:
+            produccion = copy.copy(produccion)
+            if produccion.callable is not None:
+                produccion.callable = self._reduccion(produccion.name, produccion.callable, por_regla)
+            producciones.append(produccion)
+        parser.productions = producciones
+
+        directorio = compilador.dir_general
+        for metodo in METODOS_DIRECTORIO:
+            setattr(directorio, metodo, self._medir('directorio', 'consultas_directorio', getattr(directorio, metodo)))
+
+        quad_manager = compilador.quad_manager
+        cubo = quad_manager.cubo
+        quad_manager.cubo = SimpleNamespace(
+            lookup=self._medir('cubo', 'consultas_cubo', cubo.lookup),
+            lookup_codigo=self._medir('cubo', 'consultas_cubo', cubo.lookup_codigo))
+        quad_manager.agregar_cuadruplo = self._medir('cuadruplos', 'cuadruplos', quad_manager.agregar_cuadruplo)
+
+        # Picos de las pilas: se revisan al meter (nunca crecen al sacar)
+        perfil = self
+        push_operando_tipo = quad_manager.push_operando_tipo
+        def push_operando_medido(*args):
+            push_operando_tipo(*args)
+            perfil.pico_operandos = max(perfil.pico_operandos, len(quad_manager.pila_operandos))
+        quad_manager.push_operando_tipo = push_operando_medido
+
+        push_operador = quad_manager.push_operador
+        def push_operador_medido(operador):
+            push_operador(operador)
+            perfil.pico_operadores = max(perfil.pico_operadores, len(quad_manager.pila_operadores))
+        quad_manager.push_operador = push_operador_medido
+
+    def _reduccion(self, nombre, accion, por_regla):
+        medida = self._medir('acciones', 'reducciones', accion)
+        def reduccion(p):
+            por_regla[nombre] = por_regla.get(nombre, 0) + 1
+            medida(p)
+        return reduccion
+
+    # --- Reporte ---
+
+    def fases(self):
+        """{fase: segundos}, con tiempos exclusivos (ver FASES arriba)."""
+        t = self.tiempos
+        return {
+            'lexico': t['lexico'],
+            'sintactico': max(t['analisis'] - t['lexico'] - t['acciones'], 0.0),
+            'semantico': max(t['acciones'] - t['directorio'] - t['cubo'] - t['cuadruplos'], 0.0),
+            'directorio': t['directorio'],
+            'cubo': t['cubo'],
+            'cuadruplos': t['cuadruplos'],
+            'optimizacion': t['optimizacion'],
+        }
+
+    def a_dict(self):
+        return {
+            'total_s': self.tiempos['total'],
+            'fases_s': self.fases(),
+            'contadores': dict(self.contadores),
+            'picos': {'pila_operandos': self.pico_operandos, 'pila_operadores': self.pico_operadores},
+            'reducciones_por_regla': dict(sorted(self.reducciones_por_regla.items(),
+                                                 key=lambda par: -par[1])),
+        }
+
+    def a_json(self):
+        """El perfil como JSON (para guardarlo o compararlo entre corridas)."""
+        return json.dumps(self.a_dict(), ensure_ascii=False, indent=2)
+
+    def __str__(self):
+        """Resumen legible."""
+        total = self.tiempos['total']
+        output = "--- Perfil de Compilación ---\n"
+        output += f"  {'Fase':<14}{'ms':>10}{'%':>8}\n"
+        for fase, segundos in self.fases().items():
+            porcentaje = 100 * segundos / total if total else 0.0
+            output += f"  {fase:<14}{segundos * 1000:>10.3f}{porcentaje:>8.1f}\n"
+        output += f"  {'total':<14}{total * 1000:>10.3f}\n"
+        c = self.contadores
+        output += (f"  Tokens: {c['tokens']}  Reducciones: {c['reducciones']}  "
+                   f"Consultas al directorio: {c['consultas_directorio']}  "
+                   f"Consultas al cubo: {c['consultas_cubo']}  Cuádruplos: {c['cuadruplos']}\n")
+        output += f"  Pico de pila_operandos: {self.pico_operandos}  Pico de pila_operadores: {self.pico_operadores}\n"
+        mas_reducidas = list(self.a_dict()['reducciones_por_regla'].items())[:5]
+        output += "  Reglas más reducidas: " + ", ".join(f"{regla} ({n})" for regla, n in mas_reducidas) + "\n"
+        output += "-----------------------------"
+        return output
+
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    from parser import compilar
+    from escaner import Escaner, tokens_de
+
+    fuente = open('prueba_etapa3.pat').read() + "\n// (x + (y * (3 - (4 / x))))"
+    fuente = fuente.replace("inicio\n{", "inicio\n{\n    x = (x + (x * (3 - (4 / x))));", 1)
+
+    sin_perfil = compilar(fuente)
+    assert sin_perfil.perfil is None
+
+    for lexer_base in (None, Escaner()):
+        resultado = compilar(fuente, optimizar=True, lexer_base=lexer_base, perfilar=True)
+        assert resultado.exito
+        perfil = resultado.perfil
+        c = perfil.contadores
+        assert c['tokens'] == len(tokens_de(Escaner(), fuente)[0])
+        assert c['reducciones'] == sum(perfil.reducciones_por_regla.values()) > c['tokens'] // 2
+        assert c['cuadruplos'] == len(sin_perfil.fila_cuadruplos)
+        assert c['consultas_cubo'] > 0 and c['consultas_directorio'] > 0
+        # x = ( x + ( x * ( 3 - ( 4 / x ...: '=', 4 paréntesis y 4 operadores
+        assert perfil.pico_operadores == 9 and perfil.pico_operandos >= 5
+        assert all(segundos >= 0 for segundos in perfil.fases().values())
+        assert sum(perfil.fases().values()) <= perfil.tiempos['total'] * 1.01
+
+        import json
+        datos = json.loads(perfil.a_json())
+        assert datos['contadores'] == c
+        assert "Perfil de Compilación" in str(perfil)
+
+    # Medir no cambia lo que se genera
+    con_perfil = compilar(fuente, perfilar=True)
+    assert con_perfil.fila_cuadruplos.operadores == sin_perfil.fila_cuadruplos.operadores
+    assert con_perfil.fila_cuadruplos.resultados == sin_perfil.fila_cuadruplos.resultados
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de perfil.py: OK")
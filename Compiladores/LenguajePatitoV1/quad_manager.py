@@ -1,42 +1,232 @@
 # quad_manager.py
-from semantic_cube import cubo_semantico
+from semantic_cube import cubo_semantico, CODIGO_TIPO, TIPOS
+from memoria import AsignadorMemoria, ambito_de
+from constantes import TablaConstantes
+from mapa_fuente import SIN_SPAN
+from array import array
+from enum import IntEnum
 
-# --- 1. Clase para definir un Cuádruplo ---
-# Usamos una clase simple para claridad
+# --- 1. Códigos de Operación ---
+class Opcode(IntEnum):
+    """
+    Código entero de cada operador de los cuádruplos.
+    Los binarios van primero (SUMA..MENORIG) para poder reconocerlos
+    con una sola comparación.
+    """
+    SUMA = 0
+    RESTA = 1
+    MULT = 2
+    DIV = 3
+    MAYOR = 4
+    MENOR = 5
+    IGUALDAD = 6
+    DIF = 7
+    MAYORIG = 8
+    MENORIG = 9
+    ASIG = 10
+    ESCRIBE = 11
+    # Saltos y llamadas (Etapa 4)
+    GOTO = 12
+    GOTOF = 13
+    ERA = 14
+    PARAM = 15
+    GOSUB = 16
+    ENDFUNC = 17
+    # Unario: (NEG, x, _, t) es t = -x
+    NEG = 18
+
+    @property
+    def simbolo(self):
+        """El operador como se escribe en el código fuente (ej. '+')"""
+        return SIMBOLOS[self]
+
+# {símbolo: Opcode}. También acepta el Opcode mismo como llave.
+OPCODES = {
+    '+': Opcode.SUMA,
+    '-': Opcode.RESTA,
+    '*': Opcode.MULT,
+    '/': Opcode.DIV,
+    '>': Opcode.MAYOR,
+    '<': Opcode.MENOR,
+    '==': Opcode.IGUALDAD,
+    '!=': Opcode.DIF,
+    '>=': Opcode.MAYORIG,
+    '<=': Opcode.MENORIG,
+    '=': Opcode.ASIG,
+}
+SIMBOLOS = {codigo: simbolo for simbolo, codigo in OPCODES.items()}
+for _codigo in Opcode:
+    SIMBOLOS.setdefault(_codigo, _codigo.name)
+    OPCODES.setdefault(_codigo.name, _codigo)
+    OPCODES[_codigo] = _codigo
+
+# Operadores cuyo 'resultado' es un número de cuádruplo (no una dirección)
+SALTOS = (Opcode.GOTO, Opcode.GOTOF, Opcode.GOSUB)
+# Después de estos termina un bloque básico
+FIN_DE_BLOQUE = (Opcode.GOTO, Opcode.GOTOF, Opcode.ERA, Opcode.PARAM,
+                 Opcode.GOSUB, Opcode.ENDFUNC)
+
+# Valor de columna para un operando ausente (None)
+SIN_OPERANDO = -1
+
+# Tipo del operando que queda en las pilas cuando una expresión tuvo un
+# error semántico (ej. una variable no declarada). La compilación sigue
+# para juntar más errores, pero con él ya no se generan cuádruplos ni se
+# reportan errores en cascada.
+TIPO_ERROR = 'error'
+
+# --- 2. Vista de un Cuádruplo ---
+# Solo para depurar/imprimir: la fila NO guarda estos objetos,
+# los crea al pedir fila[i]. __slots__ evita el __dict__ por objeto.
 class Cuadruplo:
+    __slots__ = ('operador', 'op_izq', 'op_der', 'resultado')
+
     def __init__(self, operador, op_izq, op_der, resultado):
-        self.operador = operador
+        self.operador = operador   # Opcode
         self.op_izq = op_izq
         self.op_der = op_der
-        self.resultado = resultado # Esto suele ser un temporal (t1, t2, ...)
+        self.resultado = resultado # Dirección virtual (ej. un temporal 5000)
 
     def __str__(self):
         # Un formato bonito para imprimir
-        return f"({self.operador}, {self.op_izq}, {self.op_der}, {self.resultado})"
+        return f"({self.operador.simbolo}, {self.op_izq}, {self.op_der}, {self.resultado})"
 
-# --- 2. El Manejador Principal ---
-class QuadManager:
+# --- 3. Fila de Cuádruplos (estructura de arreglos) ---
+class FilaCuadruplos:
+    """
+    Guarda los cuádruplos en 4 columnas paralelas de enteros
+    (array('i')): operador, op_izq, op_der y resultado.
+    Cada cuádruplo ocupa 16 bytes en lugar de un objeto de Python.
+
+    Aparte, 'inicios' y 'fines' guardan el span de cada cuádruplo en el
+    código fuente (ver mapa_fuente.py); el .pobj también las guarda.
+
+    También lleva el índice de bloques básicos, al día con cada
+    cuádruplo que se agrega o salto que se rellena:
+    - 'destinos': cuádruplos a los que salta algún GOTO/GOTOF/GOSUB
+    - 'lideres': primer cuádruplo de cada bloque básico (el 0, los
+      destinos y el que sigue a uno de FIN_DE_BLOQUE)
+    Así saber si un cuádruplo empieza un bloque es una consulta a un
+    set, sin recorrer la fila.
+    """
     def __init__(self):
-        self.fila_cuadruplos = []
-        self.pila_operandos = []
+        self.operadores = array('i')
+        self.izquierdos = array('i')
+        self.derechos = array('i')
+        self.resultados = array('i')
+        self.inicios = array('i')
+        self.fines = array('i')
+        self.destinos = set()
+        self.lideres = {0}
+
+    def agregar(self, operador, op_izq, op_der, resultado, span=SIN_SPAN):
+        """
+        Añade un cuádruplo. 'operador' puede ser un símbolo ('+') o un Opcode.
+        Un salto con resultado None queda pendiente (ver rellenar).
+        """
+        codigo = OPCODES[operador]
+        if resultado is None:
+            resultado = SIN_OPERANDO
+        self.operadores.append(codigo)
+        self.izquierdos.append(SIN_OPERANDO if op_izq is None else op_izq)
+        self.derechos.append(SIN_OPERANDO if op_der is None else op_der)
+        self.resultados.append(resultado)
+        self.inicios.append(span[0])
+        self.fines.append(span[1])
+        if codigo in FIN_DE_BLOQUE:
+            self.lideres.add(len(self.operadores))
+            if codigo in SALTOS and resultado != SIN_OPERANDO:
+                self.destinos.add(resultado)
+                self.lideres.add(resultado)
+
+    def rellenar(self, i, destino):
+        """Backpatching: el salto pendiente i va al cuádruplo 'destino'."""
+        if self.operadores[i] not in SALTOS or self.resultados[i] != SIN_OPERANDO:
+            raise Exception(f"Error Interno: El cuádruplo {i} no es un salto pendiente.")
+        self.resultados[i] = destino
+        self.destinos.add(destino)
+        self.lideres.add(destino)
+
+    def reindexar(self):
+        """Rehace 'destinos' y 'lideres' desde las columnas (ej. al cargar un .pobj)."""
+        self.destinos = {res for op, res in zip(self.operadores, self.resultados)
+                         if op in SALTOS and res != SIN_OPERANDO}
+        self.lideres = {0} | self.destinos
+        self.lideres.update(i + 1 for i, op in enumerate(self.operadores) if op in FIN_DE_BLOQUE)
+
+    def span(self, i):
+        """(inicio, fin) en el fuente del cuádruplo i, o SIN_SPAN si no se conoce."""
+        if i >= len(self.inicios):
+            return SIN_SPAN
+        return self.inicios[i], self.fines[i]
+
+    def __len__(self):
+        return len(self.operadores)
+
+    def __getitem__(self, i):
+        """Devuelve una vista Cuadruplo del cuádruplo i (para depurar)."""
+        def operando(valor):
+            return None if valor == SIN_OPERANDO else valor
+        return Cuadruplo(Opcode(self.operadores[i]),
+                         operando(self.izquierdos[i]),
+                         operando(self.derechos[i]),
+                         operando(self.resultados[i]))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def bytes_usados(self):
+        """Bytes ocupados por los datos de las 4 columnas."""
+        return sum(columna.itemsize * len(columna) for columna in
+                   (self.operadores, self.izquierdos, self.derechos, self.resultados))
+
+# --- 4. El Manejador Principal ---
+class QuadManager:
+    def __init__(self, memoria=None):
+        self.fila_cuadruplos = FilaCuadruplos()
+        self.pila_operandos = []  # Direcciones virtuales (no nombres)
         self.pila_tipos = []
+        self.pila_spans = []      # (inicio, fin) en el fuente de cada operando
+        self.pila_negados = []    # True si el operando tiene un '-' unario pendiente (ver negar)
         self.pila_operadores = []
-        self.contador_temporales = 1 # Para t1, t2, t3...
+        # Cuádruplos de salto pendientes de rellenar (y el inicio de
+        # cada ciclo), del si/mientras más externo al más interno
+        self.pila_saltos = []
+        # GOTO del cuádruplo 0 al cuerpo principal (solo si hay funciones)
+        self.salto_principal = None
+        # Llamadas abiertas, de la más externa a la más interna:
+        # [nombre, entrada del directorio (None si no existe), argumentos]
+        self.pila_llamadas = []
+        # Reparte direcciones de temporales y constantes (uno propio por compilación)
+        self.memoria = memoria if memoria is not None else AsignadorMemoria()
+        self.tabla_constantes = TablaConstantes(self.memoria) # Una dirección por constante
+        self.cubo = cubo_semantico  # Por compilación, para poder medirlo (ver perfil.py)
+
+    def generar_temporal(self, tipo):
+        """Reserva la dirección de un nuevo temporal del tipo dado (ej. 5000)"""
+        return self.memoria.asignar('temporal', tipo)
+
+    def liberar_temporal(self, direccion):
+        """
+        Devuelve un temporal al pool del asignador. Se llama cuando el
+        temporal ya fue consumido por su único uso (su último uso).
+        """
+        self.memoria.liberar(direccion)
 
-    def generar_temporal(self):
-        """Genera un nuevo nombre de variable temporal (ej. 't1')"""
-        temp_nombre = f"t{self.contador_temporales}"
-        self.contador_temporales += 1
-        return temp_nombre
+    def generar_constante(self, valor, tipo):
+        """Devuelve la dirección (única) de la constante en la tabla"""
+        return self.tabla_constantes.obtener_direccion(valor, tipo)
 
-    def agregar_cuadruplo(self, operador, op_izq, op_der, resultado):
-        """Crea y añade un nuevo cuádruplo a la fila"""
-        nuevo_quad = Cuadruplo(operador, op_izq, op_der, resultado)
-        self.fila_cuadruplos.append(nuevo_quad)
-        # print(f"Cuádruplo Generado: {nuevo_quad}") # Para depuración
+    def agregar_cuadruplo(self, operador, op_izq, op_der, resultado, span=SIN_SPAN):
+        """Añade un nuevo cuádruplo a la fila"""
+        self.fila_cuadruplos.agregar(operador, op_izq, op_der, resultado, span)
+        # print(f"Cuádruplo Generado: {self.fila_cuadruplos[-1]}") # Para depuración
 
     def mostrar_cuadruplos(self):
-        """Imprime la fila completa de cuádruplos al final"""
+        """Imprime la tabla de constantes y la fila completa de cuádruplos al final"""
+        print()
+        print(self.tabla_constantes)
         print("\n--- Fila de Cuádruplos ---")
         for i, quad in enumerate(self.fila_cuadruplos):
             print(f"{i}: {quad}")
@@ -44,10 +234,62 @@ class QuadManager:
 
     # --- Métodos para Pilas ---
     
-    def push_operando_tipo(self, operando, tipo):
-        """Mete un operando y su tipo a las pilas"""
+    def push_operando_tipo(self, operando, tipo, span=SIN_SPAN, negado=False):
+        """Mete un operando, su tipo y su span en el fuente a las pilas"""
         self.pila_operandos.append(operando)
         self.pila_tipos.append(tipo)
+        self.pila_spans.append(span)
+        self.pila_negados.append(negado)
+
+    def pop_operando_tipo(self):
+        """
+        Saca un operando y su tipo de las pilas.
+        Cada temporal se usa una sola vez, así que al sacarlo ya se puede
+        reciclar: un cuádruplo lee sus operandos antes de escribir su
+        resultado, de modo que el resultado puede reutilizar la dirección.
+        """
+        operando, tipo, _ = self.pop_operando_tipo_span()
+        return operando, tipo
+
+    def pop_operando_tipo_span(self):
+        """
+        Como pop_operando_tipo(), pero también devuelve el span del
+        operando. Si tenía un '-' pendiente, aquí se genera su NEG.
+        """
+        if self.pila_negados[-1]:
+            self.resolver_signo(-1)
+        operando, tipo, span, _ = self.pop_operando_con_signo()
+        return operando, tipo, span
+
+    def pop_operando_con_signo(self):
+        """
+        Saca (operando, tipo, span, negado) sin generar el NEG pendiente:
+        quien lo saca se encarga del signo (ej. la asignación genera un
+        solo (NEG, x, _, variable)).
+        """
+        operando = self.pila_operandos.pop()
+        tipo = self.pila_tipos.pop()
+        span = self.pila_spans.pop()
+        negado = self.pila_negados.pop()
+        if operando != SIN_OPERANDO:
+            self.liberar_temporal(operando)
+        return operando, tipo, span, negado
+
+    def push_error(self, span=SIN_SPAN):
+        """Mete a las pilas un operando de TIPO_ERROR (ver arriba)"""
+        self.push_operando_tipo(SIN_OPERANDO, TIPO_ERROR, span)
+
+    def limpiar_pilas(self):
+        """
+        Vacía las pilas de operandos y operadores, liberando sus
+        temporales. Se usa al recuperarse de un error de sintaxis, que
+        puede dejar una expresión (o una llamada) a medias. La pila de
+        saltos no se toca: los si/mientras que la contienen siguen abiertos.
+        """
+        while self.pila_operandos:
+            self.pop_operando_con_signo()  # Sin generar sus NEG pendientes
+        self.pila_operadores.clear()
+        self.pila_llamadas.clear()
 
     def push_operador(self, operador):
         """Mete un operador a la pila"""
@@ -61,24 +303,409 @@ class QuadManager:
         Saca los 2 operandos y 1 operador de la cima para generar
         un cuádruplo.
         """
-        # 1. Sacar operandos y tipos
-        op_der = self.pila_operandos.pop()
-        op_izq = self.pila_operandos.pop()
-        tipo_der = self.pila_tipos.pop()
-        tipo_izq = self.pila_tipos.pop()
-        
-        # 2. Sacar operador
-        operador = self.pila_operadores.pop()
+        # 1. Sacar operador (como Opcode: también es su código en el cubo).
+        # Los '-' unarios pendientes se acomodan en la operación si se
+        # puede (a + -b -> a - b); si no, se generan sus NEG
+        operador = OPCODES[self.pila_operadores.pop()]
+        operador, negar_resultado = self._absorber_signos(operador)
+
+        # 2. Sacar operandos y tipos (sus temporales quedan libres)
+        op_der, tipo_der, span_der = self.pop_operando_tipo_span()
+        op_izq, tipo_izq, span_izq = self.pop_operando_tipo_span()
         
-        # 3. Validar con Cubo Semántico
-        tipo_resultado = cubo_semantico.lookup(tipo_izq, tipo_der, operador)
+        # 3. Validar con Cubo Semántico. Si falla (o un operando ya era
+        # un error) el resultado es un operando de TIPO_ERROR
+        span = (min(span_izq[0], span_der[0]), max(span_izq[1], span_der[1]))
+        if TIPO_ERROR in (tipo_izq, tipo_der):
+            self.push_error(span)
+            return
+        try:
+            tipo_resultado = TIPOS[self.cubo.lookup_codigo(CODIGO_TIPO[tipo_izq], CODIGO_TIPO[tipo_der], operador)]
+        except Exception:
+            self.push_error(span)
+            raise
         
-        # 4. Generar el temporal y el cuádruplo
-        temporal = self.generar_temporal()
-        self.agregar_cuadruplo(operador, op_izq, op_der, temporal)
+        # 4. Generar el temporal y el cuádruplo (abarca ambos operandos)
+        temporal = self.generar_temporal(tipo_resultado)
+        self.agregar_cuadruplo(operador, op_izq, op_der, temporal, span)
         
         # 5. Meter el resultado de vuelta a las pilas
-        self.push_operando_tipo(temporal, tipo_resultado)
+        self.push_operando_tipo(temporal, tipo_resultado, span, negar_resultado)
+
+    # --- Operadores unarios ---
+
+    def negar(self, span=SIN_SPAN):
+        """
+        Punto Neurálgico del '-' unario. No genera nada todavía:
+        - una constante se cambia por la constante negativa,
+        - cualquier otro operando queda marcado como negado; dos '-'
+          seguidos se cancelan, así que una cadena de signos cuesta a lo
+          más un NEG, que se genera hasta que alguien usa el operando
+          (ver resolver_signo) o ninguno si la operación lo absorbe.
+        """
+        self._validar_unario('-')
+        operando, tipo = self.pila_operandos[-1], self.pila_tipos[-1]
+        self.pila_spans[-1] = (span[0], self.pila_spans[-1][1])
+        if tipo == TIPO_ERROR:
+            return
+        if ambito_de(operando) == 'constante':
+            valor = self.tabla_constantes.valores[operando]
+            self.pila_operandos[-1] = self.generar_constante(-valor, tipo)
+        else:
+            self.pila_negados[-1] = not self.pila_negados[-1]
+
+    def mas_unario(self, span=SIN_SPAN):
+        """Punto Neurálgico del '+' unario: no cambia el valor, solo se valida el tipo."""
+        self._validar_unario('+')
+        self.pila_spans[-1] = (span[0], self.pila_spans[-1][1])
+
+    def _validar_unario(self, signo):
+        tipo = self.pila_tipos[-1]
+        if tipo not in ('entero', 'flotante', TIPO_ERROR):
+            span = self.pila_spans[-1]
+            self.pop_operando_con_signo()
+            self.push_error(span)
+            raise Exception(f"Error Semántico: Operación inválida. No se puede hacer '{signo}{tipo}'.")
+
+    def resolver_signo(self, posicion=-1):
+        """
+        Genera el NEG pendiente del operando en 'posicion' de las pilas:
+        (NEG, x, _, t), y t queda en su lugar. Si x es un temporal, t
+        reutiliza su dirección.
+        """
+        operando, tipo, span = (self.pila_operandos[posicion], self.pila_tipos[posicion],
+                                self.pila_spans[posicion])
+        self.liberar_temporal(operando)
+        self.pila_operandos[posicion] = self.generar_neg(operando, tipo, span)
+        self.pila_negados[posicion] = False
+
+    def generar_neg(self, operando, tipo, span=SIN_SPAN):
+        """(NEG, operando, _, t) sobre un temporal nuevo; devuelve t."""
+        temporal = self.generar_temporal(tipo)
+        self.agregar_cuadruplo('NEG', operando, None, temporal, span)
+        return temporal
+
+    def _absorber_signos(self, operador):
+        """
+        Acomoda los '-' pendientes de los dos operandos de la cima en la
+        operación, con identidades exactas también en flotantes:
+            a - (-b) = a + b     (-a) - b = -(a + b)
+            a + (-b) = a - b     (-a) + b = b - a      (-a) + (-b) = -(a + b)
+            (-a) * b = -(a * b)  (-a) * (-b) = a * b   (igual con '/')
+        Devuelve (operador, True si el resultado queda negado). Los que
+        no se pueden absorber (ej. en una comparación) se generan aquí.
+        """
+        negados = self.pila_negados
+        negar_resultado = False
+        if operador == Opcode.RESTA and negados[-1]:
+            operador, negados[-1] = Opcode.SUMA, False
+        elif operador == Opcode.RESTA and negados[-2]:
+            operador, negados[-2], negar_resultado = Opcode.SUMA, False, True
+        if operador == Opcode.SUMA:
+            if negados[-2] and negados[-1]:
+                negados[-2] = negados[-1] = False
+                negar_resultado = not negar_resultado
+            elif negados[-1]:
+                operador, negados[-1] = Opcode.RESTA, False
+            elif negados[-2]:
+                # (-a) + b = b - a: los operandos se intercambian
+                for pila in (self.pila_operandos, self.pila_tipos, self.pila_spans, negados):
+                    pila[-2], pila[-1] = pila[-1], pila[-2]
+                operador, negados[-1] = Opcode.RESTA, False
+        elif operador in (Opcode.MULT, Opcode.DIV):
+            negar_resultado = negados[-2] != negados[-1]
+            negados[-2] = negados[-1] = False
+        # Lo que quede (ej. en una comparación) se genera antes de sacar
+        # los operandos, para que un NEG no reutilice el temporal del otro
+        for posicion in (-2, -1):
+            if negados[posicion]:
+                self.resolver_signo(posicion)
+        return operador, negar_resultado
+
+    # --- Saltos (si, sino, mientras) ---
+
+    def generar_gotof(self, span=SIN_SPAN):
+        """
+        Punto Neurálgico después de la condición de un si/mientras.
+        Saca la condición y genera un GOTOF pendiente (a dónde salta se
+        sabe hasta cerrar el bloque). Se genera aunque la condición no
+        sea booleana, para que la pila de saltos quede balanceada.
+        """
+        condicion, tipo, span_condicion = self.pop_operando_tipo_span()
+        self.pila_saltos.append(len(self.fila_cuadruplos))
+        self.agregar_cuadruplo('GOTOF', condicion, None, None, span_condicion)
+        if tipo not in ('booleano', TIPO_ERROR):
+            raise Exception(f"Error Semántico: La condición debe ser booleana, no '{tipo}'.")
+
+    def generar_sino(self, span=SIN_SPAN):
+        """
+        Punto Neurálgico al leer 'sino': el final del bloque verdadero
+        salta al final del si (GOTO pendiente), y el GOTOF de la
+        condición salta al bloque del sino.
+        """
+        en_falso = self.pila_saltos.pop()
+        self.pila_saltos.append(len(self.fila_cuadruplos))
+        self.agregar_cuadruplo('GOTO', None, None, None, span)
+        self.rellenar(en_falso)
+
+    def cerrar_si(self):
+        """Punto Neurálgico al final de un si: su salto pendiente llega aquí."""
+        self.rellenar(self.pila_saltos.pop())
+
+    def marcar_inicio_ciclo(self):
+        """Punto Neurálgico antes de la condición de un mientras: ahí regresa el ciclo."""
+        self.pila_saltos.append(len(self.fila_cuadruplos))
+
+    def cerrar_mientras(self, span=SIN_SPAN):
+        """
+        Punto Neurálgico al final de un mientras: GOTO de regreso a la
+        condición, y el GOTOF de la condición sale del ciclo aquí.
+        """
+        en_falso = self.pila_saltos.pop()
+        inicio = self.pila_saltos.pop()
+        self.agregar_cuadruplo('GOTO', None, None, inicio, span)
+        self.rellenar(en_falso)
+
+    def rellenar(self, cuadruplo, destino=None):
+        """Rellena el salto pendiente 'cuadruplo' (por omisión, al siguiente cuádruplo)."""
+        if destino is None:
+            destino = len(self.fila_cuadruplos)
+        self.fila_cuadruplos.rellenar(cuadruplo, destino)
+
+    # --- Funciones y llamadas ---
+
+    def generar_salto_principal(self):
+        """
+        Punto Neurálgico al declarar una función: antes del código de la
+        primera, un GOTO pendiente que brinca las funciones hasta el
+        cuerpo principal. Sin funciones no hace falta.
+        """
+        if self.salto_principal is None:
+            self.salto_principal = len(self.fila_cuadruplos)
+            self.agregar_cuadruplo('GOTO', None, None, None)
+
+    def rellenar_salto_principal(self):
+        """Punto Neurálgico al leer 'inicio': el GOTO del cuádruplo 0 llega aquí."""
+        if self.salto_principal is not None:
+            self.rellenar(self.salto_principal)
+
+    def iniciar_llamada(self, nombre, entrada, span=SIN_SPAN):
+        """
+        Punto Neurálgico después del nombre de la función llamada:
+        (ERA, número de la función, _, _) reserva su registro de
+        activación. Mete un 'fondo falso' para que los argumentos no se
+        mezclen con la expresión de afuera. 'entrada' es la del
+        directorio, o None si la función no existe (ya se reportó): los
+        argumentos se sacan de las pilas pero no generan nada.
+        """
+        self.push_operador('(')
+        self.pila_llamadas.append([nombre, entrada, 0])
+        if entrada is not None:
+            self.agregar_cuadruplo('ERA', entrada['numero'], None, None, span)
+
+    def generar_argumento(self):
+        """
+        Punto Neurálgico después de cada argumento: lo saca de las pilas,
+        lo valida contra el tipo del parámetro (como una asignación al
+        parámetro) y genera (PARAM, argumento, _, número de parámetro).
+        """
+        argumento, tipo, span = self.pop_operando_tipo_span()
+        llamada = self.pila_llamadas[-1]
+        nombre, entrada, k = llamada
+        llamada[2] += 1
+        if entrada is None or tipo == TIPO_ERROR or k >= len(entrada['parametros']):
+            return  # El número de argumentos se revisa al cerrar la llamada
+        parametro = entrada['parametros'][k]
+        try:
+            self.cubo.lookup_codigo(CODIGO_TIPO[parametro], CODIGO_TIPO[tipo], Opcode.ASIG)
+        except Exception:
+            raise Exception(f"Error Semántico: El argumento {k + 1} de '{nombre}' debe ser "
+                            f"'{parametro}', no '{tipo}'.")
+        self.agregar_cuadruplo('PARAM', argumento, None, k, span)
+
+    def terminar_llamada(self, span=SIN_SPAN):
+        """
+        Punto Neurálgico al cerrar la llamada: saca el 'fondo falso' y
+        genera (GOSUB, número de la función, _, su primer cuádruplo).
+        Las funciones se declaran antes de usarse (o es una llamada
+        recursiva), así que el destino ya se conoce.
+        """
+        self.pila_operadores.pop()
+        nombre, entrada, argumentos = self.pila_llamadas.pop()
+        if entrada is None:
+            return
+        self.agregar_cuadruplo('GOSUB', entrada['numero'], None, entrada['inicio'], span)
+        if argumentos != len(entrada['parametros']):
+            raise Exception(f"Error Semántico: La función '{nombre}' recibe {len(entrada['parametros'])} "
+                            f"argumentos, no {argumentos}.")
+
+
+# -----------------------------------------------------------
+# PRUEBAS (saltos, índice de bloques básicos y llamadas)
+# -----------------------------------------------------------
+def run_tests():
+    from parser import compilar, Compilador
+    from maquina_virtual import MaquinaVirtual
+    from objeto import a_bytes, desde_bytes
+    from generador import generar_programa
+
+    def ejecutar(fila, resultado):
+        salida = []
+        mv = MaquinaVirtual(salida=salida.append)
+        mv.cargar(fila, resultado.tabla_constantes.valores, None, resultado.dir_funciones)
+        mv.ejecutar()
+        return salida
+
+    def indice_recalculado(fila):
+        copia = FilaCuadruplos()
+        copia.operadores, copia.resultados = fila.operadores, fila.resultados
+        copia.reindexar()
+        return copia.destinos, copia.lideres
+
+    fuente = '''programa p;
+vars i, j, s : entero;
+inicio {
+  i = 0; s = 0;
+  mientras (i < 6) haz {
+    si (i > 2) { s = s + i; } sino { s = s - 1; };
+    j = 0;
+    mientras (j < i) haz { si (j == 1) { escribe(j); }; j = j + 1; };
+    i = i + 1;
+  };
+  si (s == 9) { escribe("ok"); } sino { escribe("mal"); };
+  escribe(s);
+} fin'''
+    resultado = compilar(fuente)
+    assert resultado.exito, resultado.errores
+    fila = resultado.fila_cuadruplos
+    assert ejecutar(fila, resultado) == [1] * 4 + ['ok', 9]
+
+    # Ningún salto quedó pendiente, y el índice es el de la fila completa
+    assert all(res != SIN_OPERANDO for op, res in zip(fila.operadores, fila.resultados) if op in SALTOS)
+    assert (fila.destinos, fila.lideres) == indice_recalculado(fila)
+    assert 2 in fila.destinos  # El regreso del primer mientras (tras i = 0; s = 0;)
+
+    # El optimizador y el .pobj conservan los saltos y el índice
+    optimizado = compilar(fuente, optimizar=True)
+    assert len(optimizado.fila_cuadruplos) < len(fila)
+    assert ejecutar(optimizado.fila_cuadruplos, optimizado) == [1] * 4 + ['ok', 9]
+    assert (optimizado.fila_cuadruplos.destinos, optimizado.fila_cuadruplos.lideres) == \
+        indice_recalculado(optimizado.fila_cuadruplos)
+    cargado = desde_bytes(a_bytes(resultado.dir_funciones, resultado.tabla_constantes, fila))
+    assert (cargado.fila_cuadruplos.destinos, cargado.fila_cuadruplos.lideres) == (fila.destinos, fila.lideres)
+
+    # Los programas generados (con si y mientras anidados) dejan la pila de saltos vacía
+    for semilla in range(3):
+        compilador = Compilador()
+        assert compilador.compilar(generar_programa(semilla=semilla, anidamiento=3)).exito
+        assert compilador.quad_manager.pila_saltos == []
+
+    # Un salto pendiente solo se rellena una vez
+    manager = QuadManager()
+    manager.push_operando_tipo(5000, 'booleano')
+    manager.generar_gotof()
+    manager.cerrar_si()
+    try:
+        manager.rellenar(0)
+        assert False, "el salto ya estaba relleno"
+    except Exception as e:
+        assert "no es un salto pendiente" in str(e)
+
+    # La condición debe ser booleana (y la compilación sigue)
+    resultado = compilar("programa p; vars x : entero; inicio { si (x + 1) { x = 2; }; "
+                         "mientras (x) haz { x = 1; }; si (y > 1) { x = 3; }; } fin")
+    assert [e.split(': ', 1)[1] for e in resultado.errores] == [
+        "Error Semántico: La condición debe ser booleana, no 'entero'.",
+        "Error Semántico: La condición debe ser booleana, no 'entero'.",
+        "Error Semántico: La variable 'y' no está declarada.",
+    ], resultado.errores
+
+
+    # Llamadas: recursión, parámetros flotantes con argumento entero y
+    # registros de activación que no se pisan entre llamadas
+    fuente = '''programa p;
+vars r : entero; s : flotante;
+nula fib(n : entero) {
+  vars a : entero;
+  { si (n < 2) { r = n; } sino { fib(n - 1); a = r; fib(n - 2); r = a + r; }; }
+};
+nula suma(x : flotante, k : entero, y : flotante) {
+  { s = x + y * k; escribe(s); }
+};
+inicio { fib(12); escribe(r); suma(1, 2, 0.5); suma(r, r, r); } fin'''
+    for optimizar in (False, True):
+        resultado = compilar(fuente, optimizar=optimizar)
+        assert resultado.exito, resultado.errores
+        assert ejecutar(resultado.fila_cuadruplos, resultado) == [144, 2.0, 144.0 + 144 * 144]
+    funciones = resultado.dir_funciones.functions
+    fila = resultado.fila_cuadruplos
+    assert (fila[0].operador, fila[0].resultado) == (Opcode.GOTO, funciones['global']['inicio'])
+    assert funciones['fib']['numero'] == 1 and fila[funciones['fib']['inicio'] - 1].operador == Opcode.GOTO
+    # [local entero, local flotante, temporal entero, temporal flotante, temporal booleano]
+    assert funciones['fib']['recursos'] == [2, 0, 1, 0, 1]
+    assert funciones['suma']['recursos'] == [1, 2, 0, 1, 0]
+    cargado = desde_bytes(a_bytes(resultado.dir_funciones, resultado.tabla_constantes, fila))
+    assert ejecutar(cargado.fila_cuadruplos, cargado) == [144, 2.0, 144.0 + 144 * 144]
+
+    # Sin funciones no hay GOTO al principal
+    assert compilar("programa p; vars x : entero; inicio { x = 1; } fin").fila_cuadruplos[0].operador == Opcode.ASIG
+
+    # Una recursión sin fin se detiene
+    resultado = compilar("programa p; nula f() { { f(); } }; inicio { f(); } fin")
+    try:
+        ejecutar(resultado.fila_cuadruplos, resultado)
+        assert False, "la recursión no termina"
+    except Exception as e:
+        assert "llamadas anidadas" in str(e)
+
+    # Argumentos contra 'parametros' (y la compilación sigue)
+    resultado = compilar("programa p; vars x : entero; nula f(a : entero, b : flotante) { { x = a; } };\n"
+                         "inicio { f(1.5, 2); f(1); f(1, 2, 3); x = f(1, 2) + 1; g(x); f(x > 1, x); } fin")
+    assert [e.split(': ', 1)[1] for e in resultado.errores] == [
+        "Error Semántico: El argumento 1 de 'f' debe ser 'entero', no 'flotante'.",
+        "Error Semántico: La función 'f' recibe 2 argumentos, no 1.",
+        "Error Semántico: La función 'f' recibe 2 argumentos, no 3.",
+        "Error Semántico: La función 'f' no regresa un valor; solo se puede llamar como estatuto.",
+        "Error Semántico: La función 'g' no está declarada.",
+        "Error Semántico: El argumento 1 de 'f' debe ser 'entero', no 'booleano'.",
+    ], resultado.errores
+    assert resultado.errores[0].startswith("Error en línea 2, columna 12")
+
+    # Signos unarios: '+' no genera nada, una constante entra ya negativa
+    # a la tabla, y una cadena de '-' cuesta a lo más un NEG (o ninguno
+    # si la operación lo absorbe: a + -b es a - b)
+    fuente = '''programa p;
+vars a, b, c : entero; x : flotante;
+nula f(n : entero, y : flotante) { { escribe(n, y); } };
+inicio {
+  a = 7; b = - + -3; c = - - - a; escribe(c); c = a + -b; escribe(c);
+  c = -a - b; escribe(c); c = -a * -b; escribe(c); escribe(-a / 2); c = -(a + b) - -(a - b); escribe(c);
+  x = -a; escribe(x); x = - - 2.5 + - + -a; escribe(x); escribe(-a, -5);
+  si (-a < b) { f(-a, -b); };
+} fin'''
+    esperado = [-7, 4, -10, 21, -3, -6, -7.0, 9.5, -7, -5, -7, -3.0]
+    for optimizar in (False, True):
+        resultado = compilar(fuente, optimizar=optimizar)
+        assert resultado.exito, resultado.errores
+        assert ejecutar(resultado.fila_cuadruplos, resultado) == esperado
+    resultado = compilar(fuente)
+    assert sorted(resultado.tabla_constantes.valores.values()) == [-5, 2, 2.5, 3, 7]
+    negaciones = [quad for quad in resultado.fila_cuadruplos if quad.operador == Opcode.NEG]
+    # c = ---a, -a - b (que es -(a + b)), -a / 2, x = -a, escribe(-a), -a < b y f(-a, -b)
+    assert len(negaciones) == 8
+    assert negaciones[0].resultado == resultado.dir_funciones.lookup_var_entry_in_func('global', 'c').direccion
+
+    cadena = compilar("programa p; vars a, c : entero; inicio { c = a * " + "- " * 51 + "a; } fin")
+    assert [quad.operador for quad in cadena.fila_cuadruplos] == [Opcode.MULT, Opcode.NEG]
+    assert cadena.dir_funciones.functions['global']['recursos'][2] == 1  # Un solo temporal entero
+
+    resultado = compilar("programa p; vars a : entero; inicio { a = -(a > 1); a = +(a < 2) * 3; a = - -a; } fin")
+    assert [e.split(': ', 1)[1] for e in resultado.errores] == [
+        "Error Semántico: Operación inválida. No se puede hacer '-booleano'.",
+        "Error Semántico: Operación inválida. No se puede hacer '+booleano'.",
+    ], resultado.errores
+
 
-# --- Instancia global que el parser importará ---
-quad_manager = QuadManager()
\ No newline at end of file
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de quad_manager.py: OK")
@@ -3,105 +3,182 @@
 #
 # Implementación del Cubo Semántico como una clase.
 # Contiene la lógica para validar tipos en expresiones.
+#
+# El cubo se escribe como diccionario anidado (fácil de leer) y al
+# crearse se aplana en una tabla densa indexada por códigos enteros:
+#   tabla[(tipo_izq * N_TIPOS + tipo_der) * N_OPERADORES + operador]
+# Así una consulta es una multiplicación y un acceso a una tupla.
 # -----------------------------------------------------------------
 
+# Tipos con código (su posición). El resultado de una consulta es
+# siempre uno de estos mismos str, no una copia.
+TIPOS = ('entero', 'flotante', 'booleano')
+CODIGO_TIPO = {tipo: codigo for codigo, tipo in enumerate(TIPOS)}
+
+# Operadores con código (su posición). Son los mismos valores del
+# Opcode de quad_manager (SUMA=0 ... ASIG=10), así que un Opcode sirve
+# directo como código de operador.
+OPERADORES = ('+', '-', '*', '/', '>', '<', '==', '!=', '>=', '<=', '=')
+CODIGO_OPERADOR = {operador: codigo for codigo, operador in enumerate(OPERADORES)}
+
+N_TIPOS = len(TIPOS)
+N_OPERADORES = len(OPERADORES)
+
+# Código de resultado de una operación inválida
+ERROR = -1
+
+
 class SemanticCube:
     def __init__(self):
-        # Definimos el tipo 'booleano' internamente para comparaciones
-        # y 'error' para tipos inválidos.
-        self.tipos = {
-            'entero': 1,
-            'flotante': 2,
-            'booleano': 3,
-            'error': -1
-        }
-
-        # El cubo semántico real, implementado como un diccionario anidado.
+        # El cubo semántico, escrito como un diccionario anidado.
         # [op_izq][op_der][operador] -> tipo_resultado
+        # Lo que no aparece es un error.
         self.cubo = {
             # entero vs ...
-            self.tipos['entero']: {
-                self.tipos['entero']: {
-                    '+': self.tipos['entero'],
-                    '-': self.tipos['entero'],
-                    '*': self.tipos['entero'],
-                    '/': self.tipos['entero'], # Nota: Idealmente 'flotante', pero simple 'entero'
-                    '>': self.tipos['booleano'],
-                    '<': self.tipos['booleano'],
-                    '==': self.tipos['booleano'],
-                    '!=': self.tipos['booleano'],
-                    '>=': self.tipos['booleano'],
-                    '<=': self.tipos['booleano'],
-                    '=': self.tipos['entero'], # Asignación
+            'entero': {
+                'entero': {
+                    '+': 'entero',
+                    '-': 'entero',
+                    '*': 'entero',
+                    '/': 'entero', # Nota: Idealmente 'flotante', pero simple 'entero'
+                    '>': 'booleano',
+                    '<': 'booleano',
+                    '==': 'booleano',
+                    '!=': 'booleano',
+                    '>=': 'booleano',
+                    '<=': 'booleano',
+                    '=': 'entero', # Asignación
                 },
-                self.tipos['flotante']: {
-                    '+': self.tipos['flotante'],
-                    '-': self.tipos['flotante'],
-                    '*': self.tipos['flotante'],
-                    '/': self.tipos['flotante'],
-                    '>': self.tipos['booleano'],
-                    '<': self.tipos['booleano'],
-                    '==': self.tipos['booleano'],
-                    '!=': self.tipos['booleano'],
-                    '>=': self.tipos['booleano'],
-                    '<=': self.tipos['booleano'],
-                    '=': self.tipos['error'], # ERROR: entero = flotante (truncamiento)
+                'flotante': {
+                    '+': 'flotante',
+                    '-': 'flotante',
+                    '*': 'flotante',
+                    '/': 'flotante',
+                    '>': 'booleano',
+                    '<': 'booleano',
+                    '==': 'booleano',
+                    '!=': 'booleano',
+                    '>=': 'booleano',
+                    '<=': 'booleano',
+                    # '=' no está: entero = flotante es error (truncamiento)
                 },
             },
             # flotante vs ...
-            self.tipos['flotante']: {
-                self.tipos['entero']: {
-                    '+': self.tipos['flotante'],
-                    '-': self.tipos['flotante'],
-                    '*': self.tipos['flotante'],
-                    '/': self.tipos['flotante'],
-                    '>': self.tipos['booleano'],
-                    '<': self.tipos['booleano'],
-                    '==': self.tipos['booleano'],
-                    '!=': self.tipos['booleano'],
-                    '>=': self.tipos['booleano'],
-                    '<=': self.tipos['booleano'],
-                    '=': self.tipos['flotante'], # OK: flotante = entero (promoción)
+            'flotante': {
+                'entero': {
+                    '+': 'flotante',
+                    '-': 'flotante',
+                    '*': 'flotante',
+                    '/': 'flotante',
+                    '>': 'booleano',
+                    '<': 'booleano',
+                    '==': 'booleano',
+                    '!=': 'booleano',
+                    '>=': 'booleano',
+                    '<=': 'booleano',
+                    '=': 'flotante', # OK: flotante = entero (promoción)
                 },
-                self.tipos['flotante']: {
-                    '+': self.tipos['flotante'],
-                    '-': self.tipos['flotante'],
-                    '*': self.tipos['flotante'],
-                    '/': self.tipos['flotante'],
-                    '>': self.tipos['booleano'],
-                    '<': self.tipos['booleano'],
-                    '==': self.tipos['booleano'],
-                    '!=': self.tipos['booleano'],
-                    '>=': self.tipos['booleano'],
-                    '<=': self.tipos['booleano'],
-                    '=': self.tipos['flotante'], # OK: flotante = flotante
+                'flotante': {
+                    '+': 'flotante',
+                    '-': 'flotante',
+                    '*': 'flotante',
+                    '/': 'flotante',
+                    '>': 'booleano',
+                    '<': 'booleano',
+                    '==': 'booleano',
+                    '!=': 'booleano',
+                    '>=': 'booleano',
+                    '<=': 'booleano',
+                    '=': 'flotante', # OK: flotante = flotante
                 },
             },
         }
 
+        # La tabla densa: un código de tipo (o ERROR) por combinación
+        tabla = [ERROR] * (N_TIPOS * N_TIPOS * N_OPERADORES)
+        for tipo_izq, por_der in self.cubo.items():
+            for tipo_der, por_operador in por_der.items():
+                for operador, resultado in por_operador.items():
+                    indice = ((CODIGO_TIPO[tipo_izq] * N_TIPOS + CODIGO_TIPO[tipo_der]) * N_OPERADORES
+                              + CODIGO_OPERADOR[operador])
+                    tabla[indice] = CODIGO_TIPO[resultado]
+        self.tabla = tuple(tabla)
+
+    def lookup_codigo(self, tipo_izq, tipo_der, operador):
+        """
+        Igual que lookup(), pero con códigos enteros (CODIGO_TIPO y
+        CODIGO_OPERADOR, o un Opcode). Devuelve el código del tipo de
+        resultado o lanza una excepción si es un error.
+        """
+        resultado = self.tabla[(tipo_izq * N_TIPOS + tipo_der) * N_OPERADORES + operador]
+        if resultado == ERROR:
+            raise Exception(f"Error Semántico: Operación inválida. No se puede hacer "
+                            f"'{TIPOS[tipo_izq]} {OPERADORES[operador]} {TIPOS[tipo_der]}'.")
+        return resultado
+
     def lookup(self, op_izq, op_der, operador):
         """
         Busca una operación en el cubo semántico.
         Devuelve el tipo de resultado ('entero', 'flotante', 'booleano')
         o lanza una excepción si es 'error'.
         """
-        # Convertir tipos de string a nuestros IDs numéricos
-        tipo_izq = self.tipos.get(op_izq, self.tipos['error'])
-        tipo_der = self.tipos.get(op_der, self.tipos['error'])
-        
-        # Buscar en el cubo
-        resultado_num = self.cubo.get(tipo_izq, {}).get(tipo_der, {}).get(operador, self.tipos['error'])
-        
-        if resultado_num == self.tipos['error']:
-            # Error de tipos
+        tipo_izq = CODIGO_TIPO.get(op_izq)
+        tipo_der = CODIGO_TIPO.get(op_der)
+        codigo_operador = CODIGO_OPERADOR.get(operador)
+        if tipo_izq is None or tipo_der is None or codigo_operador is None:
+            # Tipos o un operador que el cubo no conoce (ej. 'letrero')
             raise Exception(f"Error Semántico: Operación inválida. No se puede hacer '{op_izq} {operador} {op_der}'.")
-        
-        # Devolver el tipo de resultado como string
-        for tipo_str, tipo_num in self.tipos.items():
-            if tipo_num == resultado_num:
-                return tipo_str
-        
-        return 'error' # No debería llegar aquí
+        return TIPOS[self.lookup_codigo(tipo_izq, tipo_der, codigo_operador)]
 
 # Crear una instancia global para que el parser la importe
-cubo_semantico = SemanticCube()
\ No newline at end of file
+cubo_semantico = SemanticCube()
+
+
+# -----------------------------------------------------------
+# PRUEBAS
+# -----------------------------------------------------------
+def run_tests():
+    from quad_manager import Opcode, OPCODES
+
+    # Los códigos de operador son los del Opcode
+    for operador, codigo in CODIGO_OPERADOR.items():
+        assert OPCODES[operador] == codigo
+
+    # La tabla densa dice lo mismo que el diccionario, en todas las combinaciones
+    for tipo_izq in TIPOS:
+        for tipo_der in TIPOS:
+            for operador in OPERADORES:
+                esperado = cubo_semantico.cubo.get(tipo_izq, {}).get(tipo_der, {}).get(operador)
+                try:
+                    obtenido = cubo_semantico.lookup(tipo_izq, tipo_der, operador)
+                except Exception:
+                    obtenido = None
+                assert obtenido == esperado, (tipo_izq, operador, tipo_der)
+                if esperado is not None:
+                    assert obtenido is TIPOS[CODIGO_TIPO[esperado]]  # El mismo str
+
+    entero, flotante = CODIGO_TIPO['entero'], CODIGO_TIPO['flotante']
+    assert cubo_semantico.lookup_codigo(entero, flotante, Opcode.SUMA) == flotante
+    assert cubo_semantico.lookup_codigo(flotante, entero, Opcode.ASIG) == flotante
+    assert cubo_semantico.lookup_codigo(entero, entero, Opcode.MENOR) == CODIGO_TIPO['booleano']
+
+    # Mismo mensaje de error con strings y con códigos
+    for consulta in (lambda: cubo_semantico.lookup('entero', 'flotante', '='),
+                     lambda: cubo_semantico.lookup_codigo(entero, flotante, Opcode.ASIG)):
+        try:
+            consulta()
+            assert False, "entero = flotante debe fallar"
+        except Exception as e:
+            assert "No se puede hacer 'entero = flotante'" in str(e)
+
+    for invalida in (('letrero', 'entero', '+'), ('entero', 'entero', '%'), ('error', 'entero', '+')):
+        try:
+            cubo_semantico.lookup(*invalida)
+            assert False, invalida
+        except Exception as e:
+            assert "Operación inválida" in str(e)
+
+
+if __name__ == '__main__':
+    run_tests()
+    print("Pruebas de semantic_cube.py: OK")